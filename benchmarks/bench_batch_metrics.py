@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк сводных метрик: проходы по списку VideoData против VideoBatch (NumPy)
+
+Метрики сводного отчета и итогов main(): суммы просмотров и лайков, средняя
+длительность, самое популярное видео, топ-20, средние просмотры и активные каналы.
+Время построения пачки выводится отдельно.
+
+Запуск: python benchmarks/bench_batch_metrics.py [--videos 100000] [--runs 5]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.analyzer import ChannelData, VideoData
+from src.batch_metrics import ChannelBatch, VideoBatch
+
+def generate(count: int, seed: int = 42):
+    """Синтетические видео и каналы (один канал на 100 видео)"""
+    rng = random.Random(seed)
+    videos = [
+        VideoData(
+            url=f"https://www.youtube.com/watch?v={index:011d}", title=f"Видео {index}", description='',
+            duration=rng.randint(10, 7200), views=rng.randint(0, 5000000), likes=rng.randint(0, 100000),
+            comments_count=rng.randint(0, 5000), upload_date=f"2025{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}",
+            channel_name=f"Канал {index % 1000}", channel_id=f"UC{index % 1000:022d}", tags=[], transcript='',
+            thumbnail_url='', category='Education'
+        )
+        for index in range(count)
+    ]
+    channels = [
+        ChannelData(
+            channel_id=f"UC{index:022d}", channel_name=f"Канал {index}", description='',
+            subscriber_count=rng.randint(0, 1000000), total_videos=rng.randint(0, 2000), creation_date='',
+            first_video_date='', videos_last_year=rng.randint(0, 100), videos_last_3_months=rng.randint(0, 10),
+            avg_long_video_duration=0, avg_short_video_duration=0, long_videos_count=0, short_videos_count=0
+        )
+        for index in range(max(1, count // 100))
+    ]
+    return videos, channels
+
+def python_metrics(videos: list, channels: list) -> tuple:
+    """Прежняя схема: отдельный проход по списку на каждую метрику"""
+    return (
+        sum(v.views for v in videos),
+        sum(v.likes for v in videos),
+        sum(v.duration for v in videos) / len(videos) / 60,
+        max(videos, key=lambda x: x.views).title,
+        [v.url for v in sorted(videos, key=lambda x: x.views, reverse=True)[:20]],
+        max(channels, key=lambda x: x.total_videos).channel_name,
+        sum(v.views for v in videos) / len(videos),
+        len([c for c in channels if c.videos_last_3_months > 0])
+    )
+
+def batch_metrics(video_batch: VideoBatch, channel_batch: ChannelBatch) -> tuple:
+    """Текущая схема: векторные агрегаты по колонкам"""
+    top = video_batch.top('views', 20)
+    return (
+        video_batch.total('views'),
+        video_batch.total('likes'),
+        video_batch.mean('duration') / 60,
+        top[0].title,
+        [v.url for v in top],
+        channel_batch.top('total_videos', 1)[0].channel_name,
+        video_batch.mean('views'),
+        channel_batch.active_count()
+    )
+
+def timed(function, *args, runs: int) -> tuple:
+    """Медианное время (мс) и результат"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = function(*args)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), result
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Бенчмарк сводных метрик')
+    parser.add_argument('--videos', type=int, default=100000, help='Количество видео')
+    parser.add_argument('--runs', type=int, default=5, help='Количество повторов')
+    args = parser.parse_args()
+    
+    videos, channels = generate(args.videos)
+    print(f"Видео: {len(videos):,}, каналов: {len(channels):,}")
+    
+    python_ms, expected = timed(python_metrics, videos, channels, runs=args.runs)
+    build_ms, (video_batch, channel_batch) = timed(
+        lambda: (VideoBatch(videos), ChannelBatch(channels)), runs=args.runs
+    )
+    batch_ms, result = timed(batch_metrics, video_batch, channel_batch, runs=args.runs)
+    
+    if result[:4] != expected[:4] or result[4] != expected[4] or result[5:] != expected[5:]:
+        print("❌ Результаты расходятся")
+        return 1
+    
+    print(f"{'Проходы по списку':<22} {python_ms:9.1f} мс")
+    print(f"{'Построение пачек':<22} {build_ms:9.1f} мс")
+    print(f"{'Метрики по пачкам':<22} {batch_ms:9.1f} мс")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк экспорта отчета по видео в Excel: время и пик памяти на 50 000 видео
+
+Сравнивает потоковую запись (StreamingExcelWriter, write-only) с прежней схемой:
+DataFrame, pd.ExcelWriter и Alignment на каждую ячейку (--legacy, нужен pandas).
+
+Запуск: python benchmarks/bench_excel_export.py [--videos 50000] [--legacy]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from config import ExcelStylesConfig
+from src.analyzer import VideoData, YouTubeAnalyzer
+from src.excel_writer import StreamingExcelWriter
+
+WORDS = ['python', 'курс', 'обучение', 'урок', 'нейросеть', 'обзор', 'гайд', 'программирование', 'с нуля']
+
+def generate_videos(count: int, seed: int = 42) -> list:
+    """Синтетические VideoData с заполненными полями анализа"""
+    rng = random.Random(seed)
+    videos = []
+    for index in range(count):
+        title = ' '.join(rng.choice(WORDS) for _ in range(6))
+        videos.append(VideoData(
+            url=f"https://www.youtube.com/watch?v={index:011d}",
+            title=title,
+            description=' '.join(rng.choice(WORDS) for _ in range(120)),
+            duration=rng.randint(60, 3600),
+            views=rng.randint(100, 5000000),
+            likes=rng.randint(0, 100000),
+            comments_count=rng.randint(0, 5000),
+            upload_date='20250315',
+            channel_name=f"Канал {index % 500}",
+            channel_id=f"UC{index % 500:022d}",
+            tags=rng.sample(WORDS, 4),
+            transcript='',
+            thumbnail_url='',
+            category='Education',
+            topic_format=f"{title} | Формат: туториал",
+            global_problem='Как начать программировать с нуля?',
+            viewer_questions=['Что такое Python?', 'Как учить?'],
+            speaker_answers=['Это язык программирования.', 'Каждый день.'],
+            cta_action='Подписка на канал',
+            topic_justification='Высокая вовлеченность',
+            reference_preview_views='Просмотры: 1,000, Лайки: 10',
+            topic_verification='Актуально',
+            speaker_opinion='Я думаю, это важно.'
+        ))
+    return videos
+
+def streaming_export(videos: list, filepath: Path) -> None:
+    """Текущая схема: потоковая запись с именованными стилями"""
+    columns = [(header, ExcelStylesConfig.COLUMN_WIDTHS.get(header, 20))
+               for header in YouTubeAnalyzer.VIDEO_REPORT_HEADERS]
+    with StreamingExcelWriter(filepath) as writer:
+        writer.write_sheet('Анализ видео', columns, (YouTubeAnalyzer._video_report_row(video) for video in videos))
+
+def legacy_export(videos: list, filepath: Path) -> None:
+    """Прежняя схема: DataFrame, pd.ExcelWriter и Alignment на каждую ячейку"""
+    import pandas as pd
+    from openpyxl.styles import Alignment
+    
+    rows = [YouTubeAnalyzer._video_report_row(video) for video in videos]
+    df = pd.DataFrame(rows, columns=list(YouTubeAnalyzer.VIDEO_REPORT_HEADERS))
+    with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
+        df.to_excel(writer, sheet_name='Анализ видео', index=False)
+        worksheet = writer.sheets['Анализ видео']
+        for row in worksheet.iter_rows(min_row=2):
+            for cell in row:
+                cell.alignment = Alignment(wrap_text=True, vertical="top")
+
+def measure(export, videos: list, filepath: Path):
+    """Время (с) и пик выделенной памяти (МБ) одного экспорта"""
+    # Время и память замеряются в отдельных прогонах: tracemalloc в разы замедляет запись
+    started = time.perf_counter()
+    export(videos, filepath)
+    elapsed = time.perf_counter() - started
+    
+    tracemalloc.start()
+    export(videos, filepath)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1024 / 1024
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Бенчмарк экспорта Excel')
+    parser.add_argument('--videos', type=int, default=50000, help='Количество видео')
+    parser.add_argument('--legacy', action='store_true', help='Сравнить с прежней схемой (pandas)')
+    args = parser.parse_args()
+    
+    videos = generate_videos(args.videos)
+    print(f"Видео: {len(videos):,}, столбцов: {len(YouTubeAnalyzer.VIDEO_REPORT_HEADERS)}")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        exports = [('Потоковая запись', streaming_export)]
+        if args.legacy:
+            exports.append(('Прежняя схема', legacy_export))
+        
+        for label, export in exports:
+            filepath = Path(directory) / f"{export.__name__}.xlsx"
+            elapsed, peak = measure(export, videos, filepath)
+            size = filepath.stat().st_size / 1024 / 1024
+            print(f"{label:<20} {elapsed:8.2f} с   пик памяти {peak:8.1f} МБ   файл {size:6.1f} МБ")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
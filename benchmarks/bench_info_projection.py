@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк памяти и места на диске: полный info dict yt-dlp против спроецированного и сжатого
+
+Образцы - вывод `yt-dlp -j URL` (один JSON на строку, в файлах *.json или *.jsonl).
+Записать образцы можно этим же скриптом:
+
+    python benchmarks/bench_info_projection.py --record https://www.youtube.com/watch?v=... [URL ...]
+
+Без сети - синтетические info dict той же структуры (форматы с подписанными URL,
+миниатюры, ~150 языков автоматических субтитров, heatmap):
+    
+    python benchmarks/bench_info_projection.py --synthetic 20
+
+Запуск: python benchmarks/bench_info_projection.py [--samples benchmarks/samples] [--synthetic N]
+"""
+
+import argparse
+import json
+import pickle
+import random
+import string
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.video_info import pack_video_info, project_video_info, unpack_video_info
+
+DEFAULT_SAMPLES_DIR = Path(__file__).resolve().parent / 'samples'
+
+# Языки автоматического перевода субтитров (в реальном ответе их около 150)
+AUTO_CAPTION_LANGUAGES = 150
+CAPTION_FORMATS = ('json3', 'srv1', 'srv2', 'srv3', 'ttml', 'vtt')
+
+def deep_sizeof(obj: Any, seen: set = None) -> int:
+    """Приблизительный размер объекта в памяти со всеми вложенными объектами"""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(key, seen) + deep_sizeof(value, seen) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    return size
+
+def load_samples(samples_dir: Path) -> Iterator[Dict[str, Any]]:
+    """Info dict из файлов вывода yt-dlp -j"""
+    for path in sorted(samples_dir.glob('*.json')) + sorted(samples_dir.glob('*.jsonl')):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+def signed_url(rng: random.Random, host: str, path: str, params: int = 20) -> str:
+    """URL с подписью и параметрами, как у форматов и субтитров YouTube"""
+    query = '&'.join(
+        f"{''.join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 8)))}="
+        f"{''.join(rng.choices(string.ascii_letters + string.digits, k=rng.randint(4, 40)))}"
+        for _ in range(params)
+    )
+    signature = ''.join(rng.choices(string.hexdigits, k=160))
+    return f"https://{host}/{path}?{query}&sig={signature}"
+
+def synthetic_info(index: int, seed: int = 42) -> Dict[str, Any]:
+    """Полный info dict видео со структурой и объемом ответа yt-dlp"""
+    rng = random.Random(seed + index)
+    video_id = f"{index:011d}"
+    channel_id = f"UC{rng.randint(0, 999):022d}"
+    headers = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
+                      'Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-us,en;q=0.5',
+        'Sec-Fetch-Mode': 'navigate'
+    }
+    
+    formats = []
+    for format_index in range(30):
+        height = rng.choice([144, 240, 360, 480, 720, 1080, 1440, 2160])
+        formats.append({
+            'format_id': str(100 + format_index),
+            'format_note': f"{height}p",
+            'ext': rng.choice(['mp4', 'webm', 'm4a']),
+            'protocol': 'https',
+            'acodec': rng.choice(['none', 'mp4a.40.2', 'opus']),
+            'vcodec': rng.choice(['none', 'avc1.640028', 'vp09.00.40.08']),
+            'url': signed_url(rng, 'rr3---sn-4g5e6nsz.googlevideo.com', 'videoplayback', params=30),
+            'width': height * 16 // 9, 'height': height, 'fps': 30, 'tbr': rng.uniform(50, 5000),
+            'filesize': rng.randint(10 ** 6, 10 ** 9), 'quality': format_index, 'has_drm': False,
+            'dynamic_range': 'SDR', 'container': 'mp4_dash',
+            'downloader_options': {'http_chunk_size': 10485760},
+            'http_headers': dict(headers),
+            'format': f"{100 + format_index} - {height * 16 // 9}x{height} ({height}p)",
+            'resolution': f"{height * 16 // 9}x{height}"
+        })
+    # Раскадровки: список фрагментов у каждого формата
+    for storyboard_index in range(4):
+        formats.append({
+            'format_id': f"sb{storyboard_index}", 'format_note': 'storyboard', 'ext': 'mhtml',
+            'protocol': 'mhtml', 'acodec': 'none', 'vcodec': 'none',
+            'url': signed_url(rng, 'i.ytimg.com', f"sb/{video_id}/storyboard3_L{storyboard_index}/M0.jpg"),
+            'fragments': [
+                {'url': signed_url(rng, 'i.ytimg.com', f"sb/{video_id}/M{fragment}.jpg", params=4),
+                 'duration': 200.0}
+                for fragment in range(rng.randint(3, 12))
+            ],
+            'http_headers': dict(headers)
+        })
+    
+    def caption_tracks(lang: str, name: str) -> List[Dict[str, str]]:
+        return [
+            {'ext': ext, 'name': name,
+             'url': signed_url(rng, 'www.youtube.com', 'api/timedtext', params=12) + f"&lang={lang}&fmt={ext}"}
+            for ext in CAPTION_FORMATS
+        ]
+    
+    languages = ['ru', 'en'] + [f"l{number:03d}" for number in range(AUTO_CAPTION_LANGUAGES - 2)]
+    description = ' '.join(rng.choice(['Разбираем', 'курс', 'Python', 'с нуля', 'ссылки:', 'https://example.com',
+                                       'таймкоды', 'подписывайтесь', 'вопросы', 'ответы']) for _ in range(300))
+    
+    return {
+        'id': video_id,
+        'title': f"Видео {index}: Python с нуля за час",
+        'description': description,
+        'duration': rng.randint(60, 7200),
+        'view_count': rng.randint(0, 5000000),
+        'like_count': rng.randint(0, 100000),
+        'comment_count': rng.randint(0, 5000),
+        'upload_date': f"2025{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}",
+        'uploader': f"Канал {channel_id[-3:]}",
+        'uploader_id': f"@channel{channel_id[-3:]}",
+        'uploader_url': f"https://www.youtube.com/@channel{channel_id[-3:]}",
+        'channel_id': channel_id,
+        'channel_url': f"https://www.youtube.com/channel/{channel_id}",
+        'channel_follower_count': rng.randint(0, 1000000),
+        'tags': [f"тег {number}" for number in range(15)],
+        'categories': ['Education'],
+        'category': 'Education',
+        'thumbnail': f"https://i.ytimg.com/vi/{video_id}/maxresdefault.jpg",
+        'thumbnails': [
+            {'url': f"https://i.ytimg.com/vi/{video_id}/{number}.jpg?sqp={rng.getrandbits(128):032x}",
+             'preference': -number, 'id': str(number), 'height': 90 + number * 10, 'width': 120 + number * 16,
+             'resolution': f"{120 + number * 16}x{90 + number * 10}"}
+            for number in range(40)
+        ],
+        'formats': formats,
+        'requested_formats': [dict(formats[0]), dict(formats[1])],
+        'subtitles': {'ru': caption_tracks('ru', 'Russian')},
+        'automatic_captions': {lang: caption_tracks(lang, lang) for lang in languages},
+        'heatmap': [{'start_time': number * 10.0, 'end_time': number * 10.0 + 10, 'value': rng.random()}
+                    for number in range(100)],
+        'chapters': [{'start_time': number * 60.0, 'end_time': number * 60.0 + 60, 'title': f"Глава {number}"}
+                     for number in range(10)],
+        'webpage_url': f"https://www.youtube.com/watch?v={video_id}",
+        'original_url': f"https://www.youtube.com/watch?v={video_id}",
+        'http_headers': headers,
+        'age_limit': 0, 'availability': 'public', 'live_status': 'not_live', 'playable_in_embed': True,
+        'extractor': 'youtube', 'extractor_key': 'Youtube', 'epoch': 1760000000
+    }
+
+def record_samples(urls: List[str], samples_dir: Path) -> None:
+    """Запись info dict указанных видео (аналог yt-dlp -j)"""
+    import yt_dlp
+    
+    samples_dir.mkdir(parents=True, exist_ok=True)
+    with yt_dlp.YoutubeDL({'quiet': True, 'no_warnings': True, 'skip_download': True}) as ydl:
+        for url in urls:
+            info = ydl.sanitize_info(ydl.extract_info(url, download=False))
+            path = samples_dir / f"{info['id']}.json"
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(info, f, ensure_ascii=False)
+            print(f"Записан образец: {path}")
+
+def measure(info: Dict[str, Any]) -> Dict[str, int]:
+    """Размеры одного видео до и после проекции"""
+    timestamp = datetime.now()
+    projected = project_video_info(info)
+    # В кэш, как в анализаторе, дорожки субтитров не записываются: подписанные URL истекают
+    cached = {key: value for key, value in projected.items() if key != 'caption_tracks'}
+    packed = pack_video_info(cached)
+    assert unpack_video_info(packed) == cached
+    
+    return {
+        'full_json': len(json.dumps(info, ensure_ascii=False).encode('utf-8')),
+        # Прежняя запись кэша: (время, полный info dict) в pickle
+        'full_cache': len(pickle.dumps((timestamp, info), protocol=pickle.HIGHEST_PROTOCOL)),
+        'full_memory': deep_sizeof(info),
+        'projected_json': len(json.dumps(projected, ensure_ascii=False).encode('utf-8')),
+        'projected_cache': len(pickle.dumps((timestamp, packed), protocol=pickle.HIGHEST_PROTOCOL)),
+        'projected_memory': deep_sizeof(projected)
+    }
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Размер info dict до и после проекции')
+    parser.add_argument('--samples', type=Path, default=DEFAULT_SAMPLES_DIR, help='Папка с образцами yt-dlp -j')
+    parser.add_argument('--record', nargs='+', metavar='URL', help='Записать образцы для указанных видео')
+    parser.add_argument('--synthetic', type=int, metavar='N',
+                        help='Вместо образцов - N синтетических info dict (без сети)')
+    args = parser.parse_args()
+    
+    if args.record:
+        record_samples(args.record, args.samples)
+    
+    if args.synthetic:
+        results = [measure(synthetic_info(index)) for index in range(args.synthetic)]
+    else:
+        results = [measure(info) for info in load_samples(args.samples)] if args.samples.is_dir() else []
+    if not results:
+        parser.error(f"образцы не найдены в {args.samples}: запишите их (--record URL или "
+                     f"yt-dlp -j URL > {args.samples}/video.json) или используйте --synthetic N")
+    
+    count = len(results)
+    average = {name: sum(result[name] for result in results) / count for name in results[0]}
+    
+    print(f"Видео в выборке: {count}")
+    print(f"{'Байт на видео':<28}{'полный':>12}{'проекция':>12}{'сокращение':>12}")
+    for label, full_name, projected_name in (
+        ('JSON', 'full_json', 'projected_json'),
+        ('Запись кэша (диск)', 'full_cache', 'projected_cache'),
+        ('Объект в памяти', 'full_memory', 'projected_memory')
+    ):
+        full_value = average[full_name]
+        projected_value = average[projected_name]
+        print(f"{label:<28}{full_value:>12,.0f}{projected_value:>12,.0f}{full_value / projected_value:>11.1f}x")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Микро-бенчмарк поиска вопросов и мнений в транскрипте из 10 000 предложений
+
+Сравнивает прежнюю схему (три re.search на предложение и пять re.findall по всему
+транскрипту) с однопроходным сканером src.patterns.scan_dialogue.
+
+Запуск: python benchmarks/bench_qa_scanner.py [--sentences 10000] [--repeat 5]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.patterns import scan_dialogue
+
+WORDS = [
+    'видео', 'канал', 'контент', 'сегодня', 'расскажу', 'интересно', 'почему', 'как', 'это',
+    'работает', 'нейросеть', 'пример', 'проблема', 'решение', 'смотрите', 'дальше', 'важно'
+]
+OPENERS = ['', '', '', '', 'Я думаю ', 'Я считаю ', 'По моему мнению ', 'Что ', 'Как ']
+
+def generate_sentences(count: int, seed: int = 42) -> list:
+    """Синтетический транскрипт с долей вопросов и мнений"""
+    rng = random.Random(seed)
+    sentences = []
+    for _ in range(count):
+        body = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(6, 18)))
+        sentences.append(rng.choice(OPENERS) + body + rng.choice('....!?'))
+    return sentences
+
+def legacy_scan(sentences: list, transcript: str):
+    """Прежняя реализация extract_qa_pairs + extract_speaker_opinion"""
+    question_patterns = [
+        r'[?？]',
+        r'\b(что|как|где|когда|почему|зачем|какой|какая|какие)\b.*?[.!?]',
+        r'\b(вопрос|спрашивают|интересно)\b.*?[.!?]'
+    ]
+    questions = []
+    answers = []
+    for i, sentence in enumerate(sentences):
+        if any(re.search(pattern, sentence, re.IGNORECASE) for pattern in question_patterns):
+            questions.append(sentence.strip())
+            if i + 1 < len(sentences):
+                answers.append(sentences[i + 1].strip())
+    
+    opinion_patterns = [
+        r'я думаю.*?[.!?]',
+        r'по моему мнению.*?[.!?]',
+        r'я считаю.*?[.!?]',
+        r'моя точка зрения.*?[.!?]',
+        r'я убежден.*?[.!?]'
+    ]
+    opinions = []
+    for pattern in opinion_patterns:
+        opinions.extend(re.findall(pattern, transcript, re.IGNORECASE))
+    
+    return questions[:10], answers[:10], opinions[:3]
+
+def measure(func, repeat: int) -> float:
+    """Лучшее время из нескольких запусков, секунды"""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Бенчмарк поиска вопросов и мнений')
+    parser.add_argument('--sentences', type=int, default=10000, help='Количество предложений')
+    parser.add_argument('--repeat', type=int, default=5, help='Количество повторов')
+    args = parser.parse_args()
+    
+    sentences = generate_sentences(args.sentences)
+    transcript = ' '.join(sentences)
+    lowered = [sentence.lower() for sentence in sentences]
+    unlimited = 10 ** 9
+    
+    legacy = measure(lambda: legacy_scan(sentences, transcript), args.repeat)
+    full_pass = measure(lambda: scan_dialogue(sentences, lowered, unlimited, unlimited), args.repeat)
+    capped = measure(lambda: scan_dialogue(sentences, lowered), args.repeat)
+    
+    print(f"Предложений: {len(sentences):,}, символов: {len(transcript):,}")
+    print(f"Прежняя схема (8 проходов):         {legacy * 1000:8.2f} мс")
+    print(f"Сканер, полный проход:              {full_pass * 1000:8.2f} мс  (x{legacy / full_pass:.1f})")
+    print(f"Сканер с лимитами 10 вопросов/3 мнения: {capped * 1000:8.2f} мс  (x{legacy / capped:.1f})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
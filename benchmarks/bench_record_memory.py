@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бенчмарк памяти записей: байт на VideoData для 100 000 синтетических видео
+
+Сравнивает прежнее представление (dataclass с __dict__, теги списком, строки
+канала и категории у каждой записи свои) с текущим VideoData (слоты, кортежи,
+интернированные строки). Строки создаются заново для каждой записи, как при
+разборе ответа yt-dlp или API.
+
+Запуск: python benchmarks/bench_record_memory.py [--records 100000] [--channels 500]
+"""
+
+import argparse
+import gc
+import random
+import sys
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.analyzer import VideoData
+
+TAGS = ['python', 'курс', 'обучение', 'урок', 'нейросеть', 'обзор', 'гайд', 'программирование',
+        'с нуля', 'для начинающих', 'django', 'анализ данных']
+CATEGORIES = ['Education', 'Science & Technology', 'People & Blogs', 'Howto & Style']
+
+# Прежний VideoData: обычный dataclass с теми же полями и значениями по умолчанию
+LegacyVideoData = make_dataclass(
+    'LegacyVideoData',
+    [(field.name, field.type, field) for field in fields(VideoData)]
+)
+
+def fresh(value: str) -> str:
+    """Новый объект строки с тем же значением (как после разбора JSON)"""
+    return value.encode('utf-8').decode('utf-8')
+
+def generate_records(record_type, count: int, channels: int, seed: int = 42) -> list:
+    """Синтетические видео: канал, категория, дата и теги повторяются"""
+    rng = random.Random(seed)
+    records = []
+    for index in range(count):
+        channel = index % channels
+        records.append(record_type(
+            url=f"https://www.youtube.com/watch?v={index:011d}",
+            title=f"Видео {index}: python с нуля",
+            description='',
+            duration=rng.randint(60, 3600),
+            views=rng.randint(100, 5000000),
+            likes=rng.randint(0, 100000),
+            comments_count=rng.randint(0, 5000),
+            upload_date=fresh(f"2025{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}"),
+            channel_name=fresh(f"Канал {channel}"),
+            channel_id=fresh(f"UC{channel:022d}"),
+            tags=[fresh(tag) for tag in rng.sample(TAGS, 6)],
+            transcript='',
+            thumbnail_url='',
+            category=fresh(rng.choice(CATEGORIES)),
+            viewer_questions=[],
+            speaker_answers=[]
+        ))
+    return records
+
+def measure(record_type, count: int, channels: int) -> float:
+    """Удерживаемая память (байт) на одну запись"""
+    gc.collect()
+    tracemalloc.start()
+    records = generate_records(record_type, count, channels)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return current / count
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Бенчмарк памяти VideoData')
+    parser.add_argument('--records', type=int, default=100000, help='Количество записей')
+    parser.add_argument('--channels', type=int, default=500, help='Количество различных каналов')
+    args = parser.parse_args()
+    
+    print(f"Записей: {args.records:,}, каналов: {args.channels}")
+    legacy = measure(LegacyVideoData, args.records, args.channels)
+    compact = measure(VideoData, args.records, args.channels)
+    
+    print(f"{'Прежний dataclass':<20} {legacy:8.0f} байт/запись   {legacy * args.records / 1024 / 1024:8.1f} МБ")
+    print(f"{'VideoData (слоты)':<20} {compact:8.0f} байт/запись   {compact * args.records / 1024 / 1024:8.1f} МБ")
+    print(f"Экономия: {(1 - compact / legacy) * 100:.0f}%")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Проверка бюджета времени запуска: main.py --dry-run
+
+Запускает main.py --dry-run в отдельном процессе несколько раз и завершается
+с кодом 1, если медианное время превышает бюджет или при запуске были
+импортированы тяжелые библиотеки, которые должны загружаться лениво.
+
+Запуск: python benchmarks/bench_startup.py [--budget 1.0] [--runs 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Модули, которые не должны импортироваться при показе плана
+LAZY_MODULES = [
+    'pandas', 'numpy', 'pyarrow', 'openpyxl', 'nltk', 'spacy', 'yt_dlp', 'googleapiclient',
+    'youtube_transcript_api', 'bs4', 'matplotlib', 'seaborn', 'wordcloud', 'textstat'
+]
+
+def run_dry_run(importtime: bool = False) -> subprocess.CompletedProcess:
+    """Один запуск main.py --dry-run"""
+    command = [sys.executable]
+    if importtime:
+        command += ['-X', 'importtime']
+    command += [str(PROJECT_ROOT / 'main.py'), '--offer', 'Онлайн курсы Python', '--dry-run']
+    
+    env = dict(os.environ, PYTHONIOENCODING='utf-8')
+    return subprocess.run(
+        command, cwd=str(PROJECT_ROOT), env=env, stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding='utf-8'
+    )
+
+def parse_importtime(stderr: str):
+    """Модули верхнего уровня и их суммарное время импорта (мкс) из вывода -X importtime"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        try:
+            _, cumulative, name = line[len('import time:'):].split('|')
+            cumulative = int(cumulative.strip())
+        except ValueError:
+            continue
+        top_level = name.strip().split('.')[0]
+        modules[top_level] = max(modules.get(top_level, 0), cumulative)
+    return modules
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Бюджет времени запуска main.py --dry-run')
+    parser.add_argument('--budget', type=float, default=1.0, help='Бюджет в секундах (по умолчанию: 1.0)')
+    parser.add_argument('--runs', type=int, default=5, help='Количество запусков (по умолчанию: 5)')
+    parser.add_argument('--top', type=int, default=10, help='Сколько самых медленных импортов показать')
+    args = parser.parse_args()
+    
+    timings = []
+    for _ in range(max(1, args.runs)):
+        started = time.perf_counter()
+        result = run_dry_run()
+        timings.append(time.perf_counter() - started)
+        if result.returncode != 0:
+            print(f"❌ main.py --dry-run завершился с кодом {result.returncode}")
+            print(result.stderr[-2000:])
+            return 1
+    
+    median = statistics.median(timings)
+    print(f"Запусков: {len(timings)}, медиана: {median:.3f} с, минимум: {min(timings):.3f} с, "
+          f"бюджет: {args.budget:.3f} с")
+    
+    imports = parse_importtime(run_dry_run(importtime=True).stderr)
+    slowest = sorted(imports.items(), key=lambda item: item[1], reverse=True)[:args.top]
+    print("\nСамые медленные импорты:")
+    for name, microseconds in slowest:
+        print(f"   {name:<30} {microseconds / 1000:8.1f} мс")
+    
+    failed = False
+    eager = [name for name in LAZY_MODULES if name in imports]
+    if eager:
+        print(f"\n❌ При запуске импортированы тяжелые модули: {', '.join(eager)}")
+        failed = True
+    
+    if median > args.budget:
+        print(f"\n❌ Бюджет времени запуска превышен: {median:.3f} с > {args.budget:.3f} с")
+        failed = True
+    
+    if not failed:
+        print("\n✅ Запуск укладывается в бюджет")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -34,15 +34,20 @@ class Config:
     request_delay: float = float(os.getenv('REQUEST_DELAY', '2.0'))
     api_request_delay: float = float(os.getenv('API_REQUEST_DELAY', '1.0'))
     error_retry_delay: float = float(os.getenv('ERROR_RETRY_DELAY', '5.0'))
+    rate_limit_burst: int = int(os.getenv('RATE_LIMIT_BURST', '4'))
     
     # === ОБРАБОТКА КОНТЕНТА ===
     enable_transcript_extraction: bool = os.getenv('ENABLE_TRANSCRIPT_EXTRACTION', 'true').lower() == 'true'
     enable_content_analysis: bool = os.getenv('ENABLE_CONTENT_ANALYSIS', 'true').lower() == 'true'
     enable_sentiment_analysis: bool = os.getenv('ENABLE_SENTIMENT_ANALYSIS', 'false').lower() == 'true'
+    # Субтитры хранятся в файле data/transcripts, в памяти - только дескрипторы
+    transcript_store_enabled: bool = os.getenv('TRANSCRIPT_STORE_ENABLED', 'true').lower() == 'true'
     
     # === ФОРМАТЫ ВЫВОДА ===
     excel_output_enabled: bool = os.getenv('EXCEL_OUTPUT_ENABLED', 'true').lower() == 'true'
     json_output_enabled: bool = os.getenv('JSON_OUTPUT_ENABLED', 'true').lower() == 'true'
+    # Сжатие JSON отчетов (NDJSON) gzip
+    json_reports_gzip: bool = os.getenv('JSON_REPORTS_GZIP', 'false').lower() == 'true'
     charts_enabled: bool = os.getenv('CHARTS_ENABLED', 'true').lower() == 'true'
     
     # === ЛОГИРОВАНИЕ ===
@@ -52,14 +57,44 @@ class Config:
     # === ПАРАЛЛЕЛЬНАЯ ОБРАБОТКА ===
     max_workers: int = int(os.getenv('MAX_WORKERS', '4'))
     enable_parallel_processing: bool = os.getenv('ENABLE_PARALLEL_PROCESSING', 'true').lower() == 'true'
+    search_concurrency: int = int(os.getenv('SEARCH_CONCURRENCY', '8'))
+    http_pool_size: int = int(os.getenv('HTTP_POOL_SIZE', os.getenv('MAX_WORKERS', '4')))
+    # Экземпляров YoutubeDL на набор опций (потоки сверх предела ждут свободный экземпляр)
+    ydl_pool_size: int = int(os.getenv('YDL_POOL_SIZE', '8'))
+    pipeline_queue_size: int = int(os.getenv('PIPELINE_QUEUE_SIZE', '32'))
+    analysis_processes: int = int(os.getenv('ANALYSIS_PROCESSES', '0'))
+    analysis_batch_size: int = int(os.getenv('ANALYSIS_BATCH_SIZE', '8'))
+    # Одновременных запросов videos.list (по 50 ID) при получении метаданных через API
+    api_batch_concurrency: int = int(os.getenv('API_BATCH_CONCURRENCY', '4'))
     
     # === КЭШИРОВАНИЕ ===
     enable_caching: bool = os.getenv('ENABLE_CACHING', 'true').lower() == 'true'
     cache_duration_hours: int = int(os.getenv('CACHE_DURATION_HOURS', '24'))
+    # Записей в LRU кэше в памяти перед дисковым кэшем
+    cache_memory_items: int = int(os.getenv('CACHE_MEMORY_ITEMS', '1024'))
+    # Бюджет LRU кэша в памяти (байт, по размеру pickle) и предел для одной записи:
+    # более крупные значения хранятся только на диске
+    cache_memory_bytes: int = int(os.getenv('CACHE_MEMORY_BYTES', str(64 * 1024 * 1024)))
+    cache_memory_entry_bytes: int = int(os.getenv('CACHE_MEMORY_ENTRY_BYTES', str(4 * 1024 * 1024)))
+    # Время жизни по типам данных (часы)
+    cache_search_ttl_hours: int = int(os.getenv('CACHE_SEARCH_TTL_HOURS', '6'))
+    cache_video_ttl_hours: int = int(os.getenv('CACHE_VIDEO_TTL_HOURS', os.getenv('CACHE_DURATION_HOURS', '24')))
+    cache_transcript_ttl_hours: int = int(os.getenv('CACHE_TRANSCRIPT_TTL_HOURS', '720'))
+    cache_channel_ttl_hours: int = int(os.getenv('CACHE_CHANNEL_TTL_HOURS', os.getenv('CACHE_DURATION_HOURS', '24')))
+    
+    # === ИНКРЕМЕНТАЛЬНЫЙ РЕЖИМ ===
+    # Окно свежести (часы): более старые видео и каналы обновляются при повторном запуске
+    incremental_freshness_hours: float = float(os.getenv('INCREMENTAL_FRESHNESS_HOURS', '24'))
+    
+    # === БАЗА РЕЗУЛЬТАТОВ ===
+    # Строк в одной транзакции пакетной вставки
+    results_batch_size: int = int(os.getenv('RESULTS_BATCH_SIZE', '100'))
     
     # === ПУТИ К ПАПКАМ ===
     project_root: Path = Path(r'C:\youtube-analyzer')
     data_dir: Path = Path(r'C:\youtube-analyzer\data')
+    # База результатов всех запусков (SQLite)
+    results_db: Path = Path(r'C:\youtube-analyzer\data\results.db')
     reports_dir: Path = Path(r'C:\youtube-analyzer\reports')
     logs_dir: Path = Path(r'C:\youtube-analyzer\logs')
     cache_dir: Path = Path(r'C:\youtube-analyzer\.cache')
@@ -104,6 +139,16 @@ class YouTubeConstants:
     API_SEARCH_COST = 100
     API_VIDEO_DETAILS_COST = 1
     API_CHANNEL_DETAILS_COST = 1
+    # Максимум ID в одном запросе videos.list
+    API_VIDEOS_PER_REQUEST = 50
+    
+    # Стандартные категории видео (videos.list возвращает только categoryId)
+    VIDEO_CATEGORIES = {
+        '1': 'Film & Animation', '2': 'Autos & Vehicles', '10': 'Music', '15': 'Pets & Animals',
+        '17': 'Sports', '19': 'Travel & Events', '20': 'Gaming', '22': 'People & Blogs', '23': 'Comedy',
+        '24': 'Entertainment', '25': 'News & Politics', '26': 'Howto & Style', '27': 'Education',
+        '28': 'Science & Technology', '29': 'Nonprofits & Activism'
+    }
     
     # Форматы видео
     VIDEO_DURATION_SHORT = 60  # Shorts <= 60 секунд
@@ -267,8 +312,15 @@ def get_effective_config() -> Dict:
         },
         'Производительность': {
             'Параллельные потоки': config.max_workers,
+            'Параллельные поисковые запросы': config.search_concurrency,
+            'Процессы контент-анализа': config.analysis_processes or 'В потоках',
             'Задержка запросов': f"{config.request_delay}с",
-            'Кэширование': 'Включено' if config.enable_caching else 'Выключено'
+            'Кэширование': 'Включено' if config.enable_caching else 'Выключено',
+            'Окно свежести инкрементального режима': f"{config.incremental_freshness_hours:g} ч",
+            'Время жизни кэша (поиск/видео/субтитры/каналы)': (
+                f"{config.cache_search_ttl_hours}/{config.cache_video_ttl_hours}/"
+                f"{config.cache_transcript_ttl_hours}/{config.cache_channel_ttl_hours} ч"
+            )
         },
         'Функции': {
             'Извлечение субтитров': 'Включено' if config.enable_transcript_extraction else 'Выключено',
@@ -278,6 +330,7 @@ def get_effective_config() -> Dict:
         'Вывод': {
             'Excel отчеты': 'Включено' if config.excel_output_enabled else 'Выключено',
             'JSON отчеты': 'Включено' if config.json_output_enabled else 'Выключено',
+            'Сжатие JSON (gzip)': 'Включено' if config.json_reports_gzip else 'Выключено',
             'Графики': 'Включено' if config.charts_enabled else 'Выключено'
         }
     }
\ No newline at end of file
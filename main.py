@@ -14,10 +14,19 @@ from typing import List, Optional
 from datetime import datetime
 
 # Импорты из проекта
-from src.analyzer import YouTubeAnalyzer
-from src.utils import setup_logging, load_config, validate_environment
+from src.analyzer import YouTubeAnalyzer, VideoData, ChannelData
+from src.pipeline import StreamingPipeline
+from src.incremental import IncrementalStore
+from src.run_journal import RunJournal
+from src.result_store import ResultStore
+from src.batch_metrics import ChannelBatch, VideoBatch
+from src.utils import setup_logging, load_config, validate_environment, cache_manager
+from src.http_client import http_client
 from config import Config
 
+# Параметры, определяющие набор работы: при --resume берутся из журнала запуска
+RESUMABLE_ARGUMENTS = ('offer', 'max_videos', 'max_channels', 'no_transcripts', 'channels_only')
+
 def parse_arguments() -> argparse.Namespace:
     """Парсинг аргументов командной строки"""
     parser = argparse.ArgumentParser(
@@ -28,6 +37,8 @@ def parse_arguments() -> argparse.Namespace:
   %(prog)s --offer "Онлайн курсы Python"
   %(prog)s --offer "Фитнес тренировки" --max-videos 100
   %(prog)s --keywords "python обучение,программирование курс" --max-channels 15
+  %(prog)s --offer "Онлайн курсы Python" --incremental --freshness-hours 12
+  %(prog)s --resume 20250101_120000_a1b2c3
         """
     )
     
@@ -35,7 +46,6 @@ def parse_arguments() -> argparse.Namespace:
     parser.add_argument(
         '--offer', 
         type=str, 
-        required=True,
         help='Описание вашего оффера/продукта для анализа конкурентов'
     )
     
@@ -80,7 +90,40 @@ def parse_arguments() -> argparse.Namespace:
         help='Количество параллельных потоков (по умолчанию: 4)'
     )
     
+    parser.add_argument(
+        '--analysis-processes',
+        type=int,
+        default=None,
+        help='Количество процессов для контент-анализа (0 - в потоках; по умолчанию: ANALYSIS_PROCESSES)'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Инкрементальный режим: извлекать только новые видео, у устаревших обновлять метрики'
+    )
+    
+    parser.add_argument(
+        '--freshness-hours',
+        type=float,
+        default=None,
+        help='Окно свежести для --incremental в часах (по умолчанию: INCREMENTAL_FRESHNESS_HOURS)'
+    )
+    
+    parser.add_argument(
+        '--resume',
+        type=str,
+        metavar='RUN_ID',
+        help='Продолжить прерванный запуск: завершенные видео и каналы берутся из журнала'
+    )
+    
     # Вывод и отчеты
+    parser.add_argument(
+        '--no-results-db',
+        action='store_true',
+        help='Не сохранять результаты в базу результатов (data/results.db)'
+    )
+    
     parser.add_argument(
         '--output-dir',
         type=str,
@@ -90,9 +133,9 @@ def parse_arguments() -> argparse.Namespace:
     
     parser.add_argument(
         '--format',
-        choices=['excel', 'json', 'both'],
+        choices=['excel', 'json', 'parquet', 'both'],
         default='excel',
-        help='Формат выходных файлов (по умолчанию: excel)'
+        help='Формат выходных файлов: both - excel и json (по умолчанию: excel)'
     )
     
     # Отладка
@@ -108,7 +151,11 @@ def parse_arguments() -> argparse.Namespace:
         help='Показать план действий без выполнения'
     )
     
-    return parser.parse_args()
+    args = parser.parse_args()
+    if not args.offer and not args.resume:
+        parser.error("требуется --offer (или --resume RUN_ID для продолжения запуска)")
+    
+    return args
 
 def generate_keywords_from_offer(offer: str, additional_keywords: List[str] = None) -> List[str]:
     """Генерация ключевых запросов из оффера"""
@@ -161,6 +208,8 @@ def display_analysis_plan(args: argparse.Namespace, keywords: List[str]) -> None
     print(f"   • Максимум видео: {args.max_videos}")
     print(f"   • Максимум каналов: {args.max_channels}")
     print(f"   • Параллельные потоки: {args.parallel}")
+    if args.analysis_processes:
+        print(f"   • Процессы контент-анализа: {args.analysis_processes}")
     
     print(f"\n🔍 КЛЮЧЕВЫЕ ЗАПРОСЫ ({len(keywords)}):")
     for i, keyword in enumerate(keywords, 1):
@@ -169,10 +218,13 @@ def display_analysis_plan(args: argparse.Namespace, keywords: List[str]) -> None
     print(f"\n⚙️  НАСТРОЙКИ:")
     print(f"   • Извлечение субтитров: {'Нет' if args.no_transcripts else 'Да'}")
     print(f"   • Только каналы: {'Да' if args.channels_only else 'Нет'}")
+    if args.incremental:
+        freshness_hours = args.freshness_hours if args.freshness_hours is not None else Config.incremental_freshness_hours
+        print(f"   • Инкрементальный режим: Да (окно свежести {freshness_hours:g} ч)")
     print(f"   • Формат отчетов: {args.format}")
     print(f"   • Папка результатов: {args.output_dir}")
     
-    print(f"\n📋 ЭТАПЫ ВЫПОЛНЕНИЯ:")
+    print(f"\n📋 ЭТАПЫ ВЫПОЛНЕНИЯ (этапы 1-4 выполняются одновременно, в потоковом режиме):")
     steps = [
         "1. Поиск видео по ключевым запросам",
         "2. Извлечение данных видео" + ("" if not args.no_transcripts else " (без субтитров)"),
@@ -202,14 +254,15 @@ def main():
     log_level = logging.DEBUG if args.verbose else logging.INFO
     setup_logging(level=log_level)
     logger = logging.getLogger(__name__)
+    analyzer = None
+    store = None
+    journal = None
+    results = None
     
     try:
         # Загрузка конфигурации
         config = load_config()
         
-        # Валидация окружения
-        validate_environment()
-        
         # Проверка что мы в правильной папке
         if not Path.cwd().name == "youtube-analyzer" and not str(Path.cwd()) == r"C:\youtube-analyzer":
             logger.warning(f"Текущая папка: {Path.cwd()}")
@@ -224,15 +277,31 @@ def main():
         if args.keywords:
             additional_keywords = [kw.strip() for kw in args.keywords.split(',')]
         
-        keywords = generate_keywords_from_offer(args.offer, additional_keywords)
+        # Продолжение запуска: параметры и ключевые запросы из журнала
+        if args.resume:
+            journal = RunJournal.resume(args.resume, video_type=VideoData, channel_type=ChannelData)
+            for name in RESUMABLE_ARGUMENTS:
+                if name in journal.meta:
+                    setattr(args, name, journal.meta[name])
+        
+        if journal is not None and journal.meta.get('keywords'):
+            keywords = journal.meta['keywords']
+        else:
+            keywords = generate_keywords_from_offer(args.offer, additional_keywords)
         
         # Отображение плана
         display_analysis_plan(args, keywords)
+        if journal is not None:
+            print(f"\n♻️  Продолжение запуска {journal.run_id}: завершено видео {len(journal.videos)}, "
+                  f"каналов {len(journal.channels)}, найдено URL {len(journal.urls)}")
         
         if args.dry_run:
             print("\n🔍 Режим dry-run: план показан, выполнение пропущено")
             return
         
+        # Валидация окружения (после dry-run: проверка зависимостей не нужна для показа плана)
+        validate_environment()
+        
         # Подтверждение запуска
         if not args.verbose:  # В обычном режиме спрашиваем подтверждение
             response = input("\n▶️  Начать анализ? [y/N]: ").strip().lower()
@@ -243,48 +312,71 @@ def main():
         print("\n🚀 Запуск анализа...")
         start_time = datetime.now()
         
+        # Журнал запуска: завершенные видео и каналы сохраняются по мере готовности
+        if journal is None:
+            journal = RunJournal()
+            journal.start({
+                'offer': args.offer,
+                'keywords': keywords,
+                'max_videos': args.max_videos,
+                'max_channels': args.max_channels,
+                'no_transcripts': args.no_transcripts,
+                'channels_only': args.channels_only
+            })
+        print(f"📒 Журнал запуска: {journal.path} (продолжить: --resume {journal.run_id})")
+        
         # Инициализация анализатора
         analyzer = YouTubeAnalyzer(
             max_workers=args.parallel,
             extract_transcripts=not args.no_transcripts,
-            output_dir=args.output_dir
+            output_dir=args.output_dir,
+            analysis_processes=args.analysis_processes
         )
         
-        # === ЭТАП 1: Поиск видео ===
-        print("\n📹 Этап 1: Поиск видео по ключевым запросам...")
-        video_urls = analyzer.search_videos_by_keywords(
-            keywords=keywords,
-            max_results=args.max_videos
+        # База результатов: видео и каналы всех запусков для запросов через python -m src.result_store
+        sinks = []
+        if not args.no_results_db:
+            results = ResultStore()
+            results.start_run(
+                journal.run_id, offer=args.offer, keywords=keywords,
+                max_videos=args.max_videos, max_channels=args.max_channels
+            )
+            sinks.append(results.sink(journal.run_id, keyword_for=analyzer.get_search_keyword))
+        
+        # JSON отчеты пишутся построчно по мере готовности видео и каналов
+        json_sink = None
+        if args.format in ['json', 'both']:
+            json_sink = analyzer.json_report_sink()
+            sinks.append(json_sink)
+        
+        # === ЭТАПЫ 1-4: Потоковый конвейер ===
+        # Поиск, извлечение видео, контент-анализ и анализ каналов работают одновременно:
+        # каждый этап получает элементы сразу, как только их выдал предыдущий
+        print("\n📹 Этапы 1-4: Поиск видео, анализ видео и каналов (потоковый режим)...")
+        if args.incremental:
+            store = IncrementalStore(freshness_hours=args.freshness_hours)
+        
+        pipeline = StreamingPipeline(
+            analyzer,
+            max_videos=args.max_videos,
+            max_channels=args.max_channels,
+            channels_only=args.channels_only,
+            sinks=sinks,
+            store=store,
+            journal=journal
         )
+        pipeline_result = pipeline.run(keywords)
         
-        if not video_urls:
+        if not pipeline_result.video_urls:
             logger.error("❌ Видео не найдены. Проверьте ключевые слова или соединение")
             return
         
-        print(f"✅ Найдено {len(video_urls)} видео для анализа")
+        videos_data = pipeline_result.videos
+        channels_data = pipeline_result.channels
         
-        # === ЭТАП 2: Анализ видео (если не только каналы) ===
-        videos_data = []
+        print(f"✅ Найдено {len(pipeline_result.video_urls)} видео")
         if not args.channels_only:
-            print(f"\n🔍 Этап 2: Анализ видео (0/{len(video_urls)})...")
-            videos_data = analyzer.analyze_videos_batch(video_urls)
             print(f"✅ Проанализировано {len(videos_data)} видео")
-        
-        # === ЭТАП 3: Определение каналов ===
-        print(f"\n📺 Этап 3: Определение уникальных каналов...")
-        if args.channels_only:
-            # Если анализируем только каналы, извлекаем channel_id из URL
-            channel_ids = analyzer.extract_channel_ids_from_urls(video_urls)
-        else:
-            # Извлекаем из проанализированных видео
-            channel_ids = list(set([v.channel_id for v in videos_data if v.channel_id]))
-        
-        channel_ids = channel_ids[:args.max_channels]  # Ограничиваем количество
-        print(f"✅ Найдено {len(channel_ids)} уникальных каналов")
-        
-        # === ЭТАП 4: Анализ каналов ===
-        print(f"\n🏢 Этап 4: Анализ каналов (0/{len(channel_ids)})...")
-        channels_data = analyzer.analyze_channels_batch(channel_ids)
         print(f"✅ Проанализировано {len(channels_data)} каналов")
         
         # === ЭТАП 5: Контент-анализ ===
@@ -302,9 +394,16 @@ def main():
             excel_files = analyzer.create_excel_reports(videos_data, channels_data)
             report_files.extend(excel_files)
         
-        if args.format in ['json', 'both']:
-            json_files = analyzer.create_json_reports(videos_data, channels_data)
-            report_files.extend(json_files)
+        if json_sink is not None:
+            report_files.extend(json_sink.files)
+        
+        if args.format == 'parquet':
+            parquet_files = analyzer.create_parquet_reports(videos_data, channels_data)
+            report_files.extend(parquet_files)
+        
+        journal.finish()
+        if results is not None:
+            results.finish_run(journal.run_id)
         
         # === ЗАВЕРШЕНИЕ ===
         end_time = datetime.now()
@@ -317,18 +416,47 @@ def main():
         print(f"   • Каналов проанализировано: {len(channels_data)}")
         print(f"   • Отчетов создано: {len(report_files)}")
         
+        http_stats = http_client.get_stats()
+        print(f"   • HTTP запросов: {http_stats['requests']} "
+              f"(новых соединений: {http_stats['connections_opened']}, "
+              f"переиспользовано: {http_stats['connections_reused']})")
+        
+        extraction_stats = analyzer.get_extraction_stats()
+        print(f"   • Извлечений yt-dlp: {extraction_stats['ytdlp_extractions']} "
+              f"(сэкономлено повторных: {extraction_stats['extractions_saved']})")
+        if extraction_stats['api_metadata_requests']:
+            print(f"   • Метаданные через API: {extraction_stats['api_metadata_videos']} видео "
+                  f"за {extraction_stats['api_metadata_requests']} запросов videos.list")
+        
+        cache_stats = cache_manager.get_stats()
+        memory_stats = cache_stats['memory']
+        print(f"   • Кэш в памяти: {memory_stats['items']}/{memory_stats['capacity']} записей, "
+              f"{memory_stats['bytes'] / 1024 / 1024:.1f}/{memory_stats['capacity_bytes'] / 1024 / 1024:.0f} МБ")
+        for namespace, counters in sorted(cache_stats['namespaces'].items()):
+            print(f"     - {namespace}: память {counters['memory_hits']}, диск {counters['disk_hits']}, "
+                  f"промахи {counters['misses']}, вытеснено {counters['evictions']}")
+        
+        if store is not None:
+            labels = {IncrementalStore.VIDEO: 'Видео', IncrementalStore.CHANNEL: 'Каналы'}
+            for kind, counters in sorted(store.get_stats().items()):
+                print(f"   • {labels.get(kind, kind)} (инкрементально): новых {counters[IncrementalStore.NEW]}, "
+                      f"обновлено метрик {counters[IncrementalStore.STALE]}, "
+                      f"из хранилища {counters[IncrementalStore.FRESH]}")
+        
         print(f"\n📁 Результаты сохранены:")
         for file_path in report_files:
             print(f"   • {file_path}")
+        if results is not None:
+            print(f"   • База результатов: {results.db_path} (запрос: python -m src.result_store top-videos --run {journal.run_id})")
         
         print(f"\n💡 Рекомендации:")
         if len(videos_data) > 0:
-            avg_views = sum(v.views for v in videos_data) / len(videos_data)
-            print(f"   • Средние просмотры в нише: {avg_views:,.0f}")
+            videos_batch = VideoBatch(videos_data)
+            print(f"   • Средние просмотры в нише: {videos_batch.mean('views'):,.0f}")
         
         if len(channels_data) > 0:
-            active_channels = [c for c in channels_data if c.videos_last_3_months > 0]
-            print(f"   • Активных каналов (публикации за 3 мес): {len(active_channels)}")
+            channels_batch = ChannelBatch(channels_data)
+            print(f"   • Активных каналов (публикации за 3 мес): {channels_batch.active_count()}")
         
         # Основные инсайты
         print(f"\n🔍 Основные инсайты:")
@@ -339,11 +467,24 @@ def main():
     except KeyboardInterrupt:
         print("\n⏹️  Анализ прерван пользователем")
         logger.info("Анализ прерван пользователем")
+        if journal is not None:
+            print(f"♻️  Продолжить: python main.py --resume {journal.run_id}")
     except Exception as e:
         logger.error(f"Критическая ошибка: {e}", exc_info=True)
         print(f"\n❌ Критическая ошибка: {e}")
         print("📋 Подробности в логе: logs/youtube_analysis.log")
+        if journal is not None:
+            print(f"♻️  Продолжить: python main.py --resume {journal.run_id}")
         sys.exit(1)
+    finally:
+        if analyzer is not None:
+            analyzer.close()
+        if store is not None:
+            store.close()
+        if journal is not None:
+            journal.close()
+        if results is not None:
+            results.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -7,53 +7,44 @@
 import os
 import sys
 import json
-import time
-import re
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 import concurrent.futures
-from threading import Lock
 from pathlib import Path
 
-# Open source библиотеки
-import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-import numpy as np
-from textstat import flesch_reading_ease
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
 from collections import Counter, defaultdict
-import matplotlib.pyplot as plt
-import seaborn as sns
-from wordcloud import WordCloud
-import yt_dlp
-from youtube_transcript_api import YouTubeTranscriptApi
-import googleapiclient.discovery
-from googleapiclient.errors import HttpError
-import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment
-from openpyxl.utils.dataframe import dataframe_to_rows
+from threading import Lock, local
 
-try:
-    import spacy
-    nlp = spacy.load("ru_core_news_sm")
-except:
-    nlp = None
+# Тяжелые библиотеки (pandas, openpyxl, numpy, nltk, spaCy, Google API client, bs4,
+# youtube_transcript_api) импортируются при первом использовании: запуск с --dry-run
+# и планировщики не платят за их загрузку
 
-from config import config, YouTubeConstants, ContentAnalysisConstants, ExcelStylesConfig
+from config import config, YouTubeConstants, ExcelStylesConfig
 from .utils import (
-    ProgressTracker, cached, retry_on_error, safe_request, 
-    save_json, load_json, format_number, format_duration, format_date
+    ProgressTracker, CacheManager, cache_manager, cached, normalize_keyword, retry_on_error,
+    safe_request, ensure_nltk_resources,
+    load_json, format_number, format_duration, format_date
+)
+from .rate_limiter import RateLimiter, rate_limiter
+from .http_client import http_client
+from .ydl_pool import ydl_pool
+from .run_journal import RunJournal
+from .excel_writer import StreamingExcelWriter
+from .records import intern_str, intern_tuple, slotted_dataclass
+from .transcript_store import TranscriptStore
+from .batch_metrics import DURATION_BUCKET_LABELS, ChannelBatch, VideoBatch
+from .ndjson_io import GZIP_SUFFIX, NDJSON_SUFFIX, NDJSONReportSink, write_ndjson
+from .video_info import pack_video_info, project_video_info, unpack_video_info, video_info_from_api
+from .patterns import SEARCH_VIDEO_ID_PATTERNS, VIDEO_ID_PATTERNS, VTT_TIMESTAMP, first_group
+from .content_analyzers import (
+    TEXT_ANALYSIS_FIELDS, ContentAnalysisPool, analyze_text_content, justify_topic
 )
 
-@dataclass
+@slotted_dataclass
 class VideoData:
-    """Структура данных для видео"""
+    """Структура данных для видео (слоты, повторяющиеся строки интернированы)"""
     url: str
     title: str
     description: str
@@ -64,7 +55,8 @@ class VideoData:
     upload_date: str
     channel_name: str
     channel_id: str
-    tags: List[str]
+    tags: Tuple[str, ...]
+    # Строка или TranscriptHandle (текст в TranscriptStore, читается через str())
     transcript: str
     thumbnail_url: str
     category: str
@@ -72,8 +64,8 @@ class VideoData:
     # Дополнительные параметры анализа
     topic_format: str = ""
     global_problem: str = ""
-    viewer_questions: List[str] = None
-    speaker_answers: List[str] = None
+    viewer_questions: Tuple[str, ...] = ()
+    speaker_answers: Tuple[str, ...] = ()
     cta_action: str = ""
     topic_justification: str = ""
     reference_preview_views: str = ""
@@ -81,14 +73,18 @@ class VideoData:
     speaker_opinion: str = ""
     
     def __post_init__(self):
-        if self.viewer_questions is None:
-            self.viewer_questions = []
-        if self.speaker_answers is None:
-            self.speaker_answers = []
+        # Канал, категория и дата повторяются у многих видео пачки
+        self.upload_date = intern_str(self.upload_date)
+        self.channel_name = intern_str(self.channel_name)
+        self.channel_id = intern_str(self.channel_id)
+        self.category = intern_str(self.category)
+        self.tags = intern_tuple(self.tags)
+        self.viewer_questions = tuple(self.viewer_questions or ())
+        self.speaker_answers = tuple(self.speaker_answers or ())
 
-@dataclass
+@slotted_dataclass
 class ChannelData:
-    """Структура данных для канала"""
+    """Структура данных для канала (слоты, повторяющиеся строки интернированы)"""
     channel_id: str
     channel_name: str
     description: str
@@ -104,10 +100,10 @@ class ChannelData:
     short_videos_count: int
     
     # Анализ контента
-    main_topics: List[str] = None
-    keywords: List[str] = None
-    cta_types: List[str] = None
-    links: List[str] = None
+    main_topics: Tuple[str, ...] = ()
+    keywords: Tuple[str, ...] = ()
+    cta_types: Tuple[str, ...] = ()
+    links: Tuple[str, ...] = ()
     funnel_analysis: str = ""
     traffic_videos_count: int = 0
     expert_videos_count: int = 0
@@ -116,41 +112,57 @@ class ChannelData:
     products_offered: str = ""
     positioning: str = ""
     playlists_count: int = 0
-    efficiency_features: List[str] = None
+    efficiency_features: Tuple[str, ...] = ()
     
     def __post_init__(self):
-        if self.main_topics is None:
-            self.main_topics = []
-        if self.keywords is None:
-            self.keywords = []
-        if self.cta_types is None:
-            self.cta_types = []
-        if self.links is None:
-            self.links = []
-        if self.efficiency_features is None:
-            self.efficiency_features = []
+        self.channel_id = intern_str(self.channel_id)
+        self.channel_name = intern_str(self.channel_name)
+        self.target_audience = intern_str(self.target_audience)
+        self.main_topics = intern_tuple(self.main_topics)
+        self.keywords = intern_tuple(self.keywords)
+        self.cta_types = intern_tuple(self.cta_types)
+        self.links = tuple(self.links or ())
+        self.efficiency_features = intern_tuple(self.efficiency_features)
 
 class YouTubeAnalyzer:
     """Основной класс для анализа YouTube"""
     
-    def __init__(self, max_workers: int = 4, extract_transcripts: bool = True, output_dir: str = "reports"):
+    # Языки субтитров в порядке приоритета
+    TRANSCRIPT_LANGUAGES = ('ru', 'en')
+    
+    def __init__(self, max_workers: int = 4, extract_transcripts: bool = True, output_dir: str = "reports",
+                 analysis_processes: int = None):
         self.api_key = config.youtube_api_key
         self.youtube = None
         if self.api_key:
             try:
+                import googleapiclient.discovery
                 self.youtube = googleapiclient.discovery.build('youtube', 'v3', developerKey=self.api_key)
             except Exception as e:
                 logging.warning(f"Не удалось инициализировать YouTube API: {e}")
         
         self.max_workers = max_workers
         self.extract_transcripts = extract_transcripts
+        
+        # Контент-анализ в отдельных процессах (0 - в рабочих потоках)
+        if analysis_processes is None:
+            analysis_processes = config.analysis_processes
+        self.analysis_processes = analysis_processes if config.enable_content_analysis else 0
+        self._analysis_pool = None
+        self._analysis_pool_lock = Lock()
+        
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
+        # Субтитры пишутся на диск сразу после получения, VideoData хранит дескриптор
+        self.transcript_store = (TranscriptStore() if extract_transcripts and config.transcript_store_enabled
+                                 else None)
+        
         # Настройка NLP
         try:
-            nltk.download('punkt', quiet=True)
-            nltk.download('stopwords', quiet=True)
+            # Данные NLTK проверяются по кэшу окружения, сеть нужна только если их нет на диске
+            ensure_nltk_resources()
+            from nltk.corpus import stopwords
             self.stop_words = set(stopwords.words('russian') + stopwords.words('english'))
         except:
             self.stop_words = set()
@@ -163,6 +175,7 @@ class YouTubeAnalyzer:
             'writesubtitles': True,
             'writeautomaticsub': True,
             'subtitleslangs': ['ru', 'en'],
+            'subtitlesformat': 'vtt',
             'skip_download': True,
         }
         
@@ -177,45 +190,121 @@ class YouTubeAnalyzer:
             if 'http' in config.proxies:
                 self.ydl_opts['proxy'] = config.proxies['http']
         
-        self.rate_limit_lock = Lock()
+        # Экземпляры YoutubeDL переиспользуются всеми потоками: пул рассчитан на рабочие потоки
+        self.ydl_pool = ydl_pool
+        self.ydl_pool.configure(max_instances=max(config.ydl_pool_size, max_workers))
+        
+        self.rate_limiter = rate_limiter
+        
+        # Пул HTTP соединений рассчитан на все рабочие потоки
+        http_client.configure(pool_size=max(config.http_pool_size, max_workers))
+        
+        # Ключевой запрос, по которому видео найдено впервые (video_id -> запрос)
+        self.search_keywords: Dict[str, str] = {}
+        
+        # Счетчики извлечений yt-dlp
+        self.extraction_stats = Counter()
+        self.stats_lock = Lock()
+        self._api_local = local()
+        
         self.logger = logging.getLogger(__name__)
     
     def search_videos_by_keywords(self, keywords: List[str], max_results: int = 50) -> List[str]:
-        """Поиск видео по ключевым запросам"""
-        video_urls = set()
+        """Параллельный поиск видео по всем парам (ключевой запрос, метод поиска)"""
+        return list(self.iter_search_videos(keywords, max_results))
+    
+    def iter_search_videos(self, keywords: List[str], max_results: int = 50) -> Iterator[str]:
+        """Потоковый поиск: URL уникальных видео выдаются по мере получения результатов"""
+        if not keywords:
+            return
         
-        progress = ProgressTracker(len(keywords), "Поиск видео")
+        results_per_keyword = max(1, max_results // len(keywords))
+        tasks = [
+            (keyword, backend_name, backend)
+            for keyword in keywords
+            for backend_name, backend in self._get_search_backends()
+        ]
         
-        for keyword in keywords:
-            try:
-                # Метод 1: YouTube Data API (если доступен)
-                if self.youtube:
-                    urls_api = self._search_with_api(keyword, max_results // len(keywords))
-                    video_urls.update(urls_api)
-                
-                # Метод 2: Web scraping
-                urls_scraping = self._search_with_scraping(keyword, max_results // len(keywords))
-                video_urls.update(urls_scraping)
+        # Словарь video_id -> URL сохраняет порядок поступления результатов
+        video_urls: Dict[str, str] = {}
+        progress = ProgressTracker(len(tasks), "Поиск видео")
+        
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(config.search_concurrency, len(tasks)))
+        )
+        future_to_task = {
+            executor.submit(self._search_cached, keyword, backend_name, backend, results_per_keyword): (keyword, backend_name)
+            for keyword, backend_name, backend in tasks
+        }
+        
+        try:
+            for future in concurrent.futures.as_completed(future_to_task):
+                keyword, backend_name = future_to_task[future]
+                try:
+                    urls = future.result()
+                except Exception as e:
+                    self.logger.error(f"Ошибка поиска ({backend_name}) по ключевому слову '{keyword}': {e}")
+                    urls = []
                 
-                # Метод 3: yt-dlp поиск
-                urls_ytdlp = self._search_with_ytdlp(keyword, max_results // len(keywords))
-                video_urls.update(urls_ytdlp)
+                for url in urls:
+                    video_id = self._extract_video_id(url)
+                    if video_id and video_id not in video_urls:
+                        video_urls[video_id] = url
+                        self.search_keywords.setdefault(video_id, keyword)
+                        yield url
+                        if len(video_urls) >= max_results:
+                            break
                 
                 progress.update()
                 
                 if len(video_urls) >= max_results:
+                    self.logger.info(f"Набрано {max_results} уникальных видео, оставшиеся поисковые запросы отменены")
                     break
-                    
-                time.sleep(config.request_delay)
-                
-            except Exception as e:
-                self.logger.error(f"Ошибка поиска по ключевому слову '{keyword}': {e}")
+        finally:
+            # Отмена еще не начатых запросов; выполняющиеся завершатся в фоне
+            for future in future_to_task:
+                future.cancel()
+            executor.shutdown(wait=False)
+    
+    def get_search_keyword(self, video_url: str) -> Optional[str]:
+        """Ключевой запрос, по которому найдено видео"""
+        return self.search_keywords.get(self._extract_video_id(video_url))
+    
+    def _search_cached(self, keyword: str, backend_name: str,
+                       backend: Callable[[str, int], List[str]], max_results: int) -> List[str]:
+        """Поиск одним методом с кэшем по нормализованному запросу и методу"""
+        cache_key = cache_manager.make_key(CacheManager.SEARCH, normalize_keyword(keyword), backend_name)
+        
+        # Результат, полученный с большим лимитом, подходит и для меньшего
+        cached_result = cache_manager.get(cache_key)
+        if cached_result is not None and cached_result['max_results'] >= max_results:
+            return cached_result['urls'][:max_results]
         
-        return list(video_urls)[:max_results]
+        urls = backend(keyword, max_results)
+        if urls:
+            cache_manager.set(cache_key, {'max_results': max_results, 'urls': urls})
+        return urls
+    
+    def _get_search_backends(self) -> List[Tuple[str, Callable[[str, int], List[str]]]]:
+        """Список доступных методов поиска"""
+        backends = []
+        
+        # Метод 1: YouTube Data API (если доступен)
+        if self.youtube:
+            backends.append(('api', self._search_with_api))
+        
+        # Метод 2: Web scraping
+        backends.append(('scraping', self._search_with_scraping))
+        
+        # Метод 3: yt-dlp поиск
+        backends.append(('ytdlp', self._search_with_ytdlp))
+        
+        return backends
     
     def _search_with_api(self, keyword: str, max_results: int) -> List[str]:
         """Поиск через YouTube Data API"""
         try:
+            self.rate_limiter.acquire('googleapis.com')
             search_response = self.youtube.search().list(
                 q=keyword,
                 part='id',
@@ -249,19 +338,14 @@ class YouTubeAnalyzer:
             if not response:
                 return []
             
+            from bs4 import BeautifulSoup
             soup = BeautifulSoup(response.content, 'html.parser')
             
             video_urls = []
             # Поиск video ID в различных местах страницы
-            patterns = [
-                r'"videoId":"([^"]+)"',
-                r'/watch\?v=([a-zA-Z0-9_-]{11})',
-                r'watch\?v=([a-zA-Z0-9_-]{11})'
-            ]
-            
             page_content = str(soup)
-            for pattern in patterns:
-                video_ids = re.findall(pattern, page_content)
+            for pattern in SEARCH_VIDEO_ID_PATTERNS:
+                video_ids = pattern.findall(page_content)
                 for video_id in video_ids:
                     if len(video_id) == 11:  # YouTube video ID всегда 11 символов
                         video_url = f"https://www.youtube.com/watch?v={video_id}"
@@ -283,27 +367,44 @@ class YouTubeAnalyzer:
         try:
             search_url = f"ytsearch{max_results}:{keyword}"
             
-            with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
+            self.rate_limiter.acquire('youtube.com')
+            with self.ydl_pool.acquire(self.ydl_opts) as ydl:
                 search_results = ydl.extract_info(search_url, download=False)
-                
-                video_urls = []
-                for entry in search_results.get('entries', []):
-                    if entry and entry.get('webpage_url'):
-                        video_urls.append(entry['webpage_url'])
-                
-                return video_urls
+            
+            video_urls = []
+            for entry in search_results.get('entries', []):
+                if entry and entry.get('webpage_url'):
+                    video_urls.append(entry['webpage_url'])
+            
+            return video_urls
         except Exception as e:
             self.logger.warning(f"yt-dlp поиск не удался для '{keyword}': {e}")
             return []
     
-    def analyze_videos_batch(self, video_urls: List[str]) -> List[VideoData]:
-        """Пакетный анализ видео"""
+    def analyze_videos_batch(self, video_urls: List[str], journal: Optional[RunJournal] = None) -> List[VideoData]:
+        """Пакетный анализ видео (с журналом - только видео, не завершенные ранее)"""
         videos_data = []
+        if journal is not None:
+            completed = [journal.get_video(url) for url in video_urls]
+            videos_data = [video_data for video_data in completed if video_data is not None]
+            video_urls = [url for url, video_data in zip(video_urls, completed) if video_data is None]
+        
         progress = ProgressTracker(len(video_urls), "Анализ видео")
         
+        # С пулом процессов потоки только извлекают данные, анализ выполняется пачками в процессах
+        analyze_in_threads = self.analysis_processes <= 0
+        # Без пула процессов видео попадает в журнал сразу после анализа
+        record = journal.add_video if journal is not None and analyze_in_threads else None
+        
+        # Метаданные всех видео - пачками по 50 через API, yt-dlp остается только для субтитров
+        prefetched = self.fetch_video_info_batch(video_urls) if self.youtube else {}
+        
         if config.enable_parallel_processing and self.max_workers > 1:
             with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_url = {executor.submit(self.extract_video_data, url): url for url in video_urls}
+                future_to_url = {
+                    executor.submit(self.extract_video_data, url, analyze_in_threads, prefetched.get(url)): url
+                    for url in video_urls
+                }
                 
                 for future in concurrent.futures.as_completed(future_to_url):
                     url = future_to_url[future]
@@ -311,36 +412,53 @@ class YouTubeAnalyzer:
                         video_data = future.result()
                         if video_data:
                             videos_data.append(video_data)
+                            if record:
+                                record(video_data)
                     except Exception as e:
                         self.logger.error(f"Ошибка анализа видео {url}: {e}")
                     
                     progress.update()
         else:
             for url in video_urls:
-                video_data = self.extract_video_data(url)
+                video_data = self.extract_video_data(url, analyze_in_threads, prefetched.get(url))
                 if video_data:
                     videos_data.append(video_data)
+                    if record:
+                        record(video_data)
                 progress.update()
-                time.sleep(config.request_delay)
+        
+        if not analyze_in_threads and videos_data:
+            # Завершенные ранее видео уже проанализированы и записаны в журнал
+            new_videos = [video_data for video_data in videos_data
+                          if journal is None or journal.get_video(video_data.url) is None]
+            if new_videos:
+                self.analyze_videos_content(new_videos)
+                if journal is not None:
+                    for video_data in new_videos:
+                        journal.add_video(video_data)
         
         return videos_data
     
-    def extract_video_data(self, video_url: str) -> Optional[VideoData]:
-        """Извлечение данных видео"""
+    def extract_video_data(self, video_url: str, analyze: bool = True,
+                           video_info: Optional[Dict] = None) -> Optional[VideoData]:
+        """Извлечение данных видео (analyze=False - без контент-анализа, video_info - метаданные из API)"""
         try:
             video_id = self._extract_video_id(video_url)
             if not video_id:
                 return None
             
-            # Получение метаданных через yt-dlp
-            video_info = self._extract_with_ytdlp(video_url)
+            # Метаданные из пакетного запроса API или через yt-dlp (единственное извлечение на видео)
+            if video_info is None:
+                video_info = self._extract_with_ytdlp(video_url)
             if not video_info:
                 return None
             
-            # Получение субтитров
+            # Получение субтитров по дорожкам из того же извлечения (у метаданных из API дорожек нет)
             transcript = ""
             if self.extract_transcripts:
-                transcript = self._get_transcript_multiple_methods(video_id)
+                transcript = self._get_transcript_multiple_methods(
+                    video_id, caption_tracks=video_info.get('caption_tracks')
+                )
             
             # Создание объекта VideoData
             video_data = VideoData(
@@ -359,10 +477,11 @@ class YouTubeAnalyzer:
                 thumbnail_url=video_info.get('thumbnail', ''),
                 category=video_info.get('category', '')
             )
+            self.offload_transcript(video_data)
             
             # Дополнительный анализ
-            if config.enable_content_analysis:
-                self._analyze_video_content(video_data)
+            if analyze and config.enable_content_analysis:
+                self.analyze_video_content(video_data)
             
             return video_data
             
@@ -370,37 +489,200 @@ class YouTubeAnalyzer:
             self.logger.error(f"Ошибка извлечения данных видео {video_url}: {e}")
             return None
     
-    def _extract_with_ytdlp(self, video_url: str) -> Optional[Dict]:
-        """Извлечение данных через yt-dlp"""
+    def _extract_with_ytdlp(self, video_url: str, use_cache: bool = True) -> Optional[Dict]:
+        """Извлечение данных через yt-dlp: проекция info dict с URL дорожек субтитров в 'caption_tracks'
+        (только у свежего извлечения: в кэш дорожки не записываются)"""
+        video_id = self._extract_video_id(video_url)
+        cache_key = cache_manager.make_key(CacheManager.VIDEO, video_id) if video_id else None
+        
+        # use_cache=False - свежие данные из сети (результат все равно записывается в кэш)
+        if cache_key and use_cache:
+            packed_info = cache_manager.get(cache_key)
+            if packed_info is not None:
+                info = unpack_video_info(packed_info)
+                if info is not None:
+                    # Подписанные URL дорожек истекают раньше TTL кэша (и в записях прежних версий):
+                    # субтитры ищутся со свежим извлечением
+                    info.pop('caption_tracks', None)
+                    return info
+        
         try:
-            with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
+            self.rate_limiter.acquire(video_url)
+            with self.ydl_pool.acquire(self.ydl_opts) as ydl:
                 info = ydl.extract_info(video_url, download=False)
-                return info
+            self._count_stat('ytdlp_extractions')
+            
+            if info is not None:
+                # Форматы, миниатюры и заголовки не нужны: в памяти и в кэше только используемые поля
+                info = project_video_info(info, self.TRANSCRIPT_LANGUAGES)
+                if cache_key:
+                    cache_manager.set(cache_key, pack_video_info(
+                        {key: value for key, value in info.items() if key != 'caption_tracks'}
+                    ))
+            return info
         except Exception as e:
             self.logger.warning(f"yt-dlp извлечение не удалось для {video_url}: {e}")
             return None
     
+    def refresh_video_metrics(self, video_data: VideoData, video_info: Optional[Dict] = None) -> bool:
+        """Обновление просмотров, лайков и комментариев без субтитров и контент-анализа
+        (video_info - метаданные из пакетного запроса API, отдельный запрос не нужен)"""
+        video_id = self._extract_video_id(video_data.url)
+        if not video_id:
+            return False
+        
+        # Статистика через API стоит одну единицу квоты, yt-dlp - запасной вариант
+        metrics = None
+        if video_info is None and self.youtube:
+            metrics = self._get_metrics_api(video_id)
+        if metrics is None:
+            info = video_info or self._extract_with_ytdlp(video_data.url, use_cache=False)
+            if not info:
+                return False
+            metrics = {
+                'views': info.get('view_count', 0),
+                'likes': info.get('like_count', 0),
+                'comments_count': info.get('comment_count', 0)
+            }
+        
+        for field_name, value in metrics.items():
+            setattr(video_data, field_name, value or 0)
+        
+        if config.enable_content_analysis:
+            self._update_metric_analysis(video_data)
+        return True
+    
+    def _get_metrics_api(self, video_id: str) -> Optional[Dict[str, int]]:
+        """Метрики видео через YouTube Data API (videos.list, part=statistics)"""
+        try:
+            self.rate_limiter.acquire('googleapis.com')
+            response = self.youtube.videos().list(part='statistics', id=video_id).execute()
+            items = response.get('items', [])
+            if not items:
+                return None
+            
+            statistics = items[0].get('statistics', {})
+            return {
+                'views': int(statistics.get('viewCount', 0)),
+                'likes': int(statistics.get('likeCount', 0)),
+                'comments_count': int(statistics.get('commentCount', 0))
+            }
+        except Exception as e:
+            self.logger.debug(f"API статистика не получена для {video_id}: {e}")
+            return None
+    
+    def fetch_video_info_batch(self, video_urls: List[str], use_cache: bool = True) -> Dict[str, Dict]:
+        """Метаданные видео через YouTube Data API: videos.list на 50 ID, запросы выполняются параллельно
+        (use_cache=False - свежие метрики из сети, результат все равно записывается в кэш)"""
+        if not self.youtube:
+            return {}
+        
+        infos = {}
+        pending: Dict[str, str] = {}
+        for url in video_urls:
+            video_id = self._extract_video_id(url)
+            if not video_id:
+                continue
+            packed_info = cache_manager.get(self._api_info_key(video_id)) if use_cache else None
+            info = unpack_video_info(packed_info) if packed_info is not None else None
+            if info is not None:
+                infos[url] = info
+            else:
+                pending[video_id] = url
+        
+        video_ids = list(pending)
+        size = YouTubeConstants.API_VIDEOS_PER_REQUEST
+        chunks = [video_ids[start:start + size] for start in range(0, len(video_ids), size)]
+        if len(chunks) > 1 and config.api_batch_concurrency > 1:
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(len(chunks), config.api_batch_concurrency)) as executor:
+                results = list(executor.map(self._fetch_video_info_chunk, chunks))
+        else:
+            results = [self._fetch_video_info_chunk(chunk) for chunk in chunks]
+        
+        for chunk_infos in results:
+            for video_id, info in chunk_infos.items():
+                infos[pending[video_id]] = info
+                cache_manager.set(self._api_info_key(video_id), pack_video_info(info))
+        
+        # Видео, которых нет в ответе (ошибка, удалено, ограничено), извлекаются через yt-dlp
+        return infos
+    
+    def _fetch_video_info_chunk(self, video_ids: List[str]) -> Dict[str, Dict]:
+        """Один запрос videos.list (до 50 ID, API_VIDEO_DETAILS_COST единиц квоты)"""
+        try:
+            self.rate_limiter.acquire('googleapis.com')
+            response = self.youtube.videos().list(
+                part='snippet,contentDetails,statistics',
+                id=','.join(video_ids)
+            ).execute(http=self._api_http())
+            
+            infos = {item['id']: video_info_from_api(item) for item in response.get('items', [])}
+            self._count_stat('api_metadata_requests')
+            self._count_stat('api_metadata_videos', len(infos))
+            return infos
+        except Exception as e:
+            self.logger.warning(f"API метаданные не получены для {len(video_ids)} видео: {e}")
+            return {}
+    
+    def _api_http(self):
+        """HTTP клиент API текущего потока (объект httplib2 нельзя использовать из нескольких потоков)"""
+        http = getattr(self._api_local, 'http', None)
+        if http is None:
+            from googleapiclient.http import build_http
+            http = self._api_local.http = build_http()
+        return http
+    
+    @staticmethod
+    def _api_info_key(video_id: str) -> str:
+        """Ключ кэша метаданных из API (отдельно от info dict yt-dlp с дорожками субтитров)"""
+        return cache_manager.make_key(CacheManager.VIDEO, 'api', video_id)
+    
+    def _count_stat(self, name: str, increment: int = 1):
+        """Потокобезопасное увеличение счетчика"""
+        with self.stats_lock:
+            self.extraction_stats[name] += increment
+    
+    def get_extraction_stats(self) -> Dict[str, int]:
+        """Статистика извлечений yt-dlp и запросов метаданных через API"""
+        with self.stats_lock:
+            return {
+                'ytdlp_extractions': self.extraction_stats['ytdlp_extractions'],
+                'extractions_saved': self.extraction_stats['extractions_saved'],
+                'api_metadata_requests': self.extraction_stats['api_metadata_requests'],
+                'api_metadata_videos': self.extraction_stats['api_metadata_videos']
+            }
+    
     def _extract_video_id(self, url: str) -> Optional[str]:
         """Извлечение ID видео из URL"""
-        patterns = [
-            r'(?:youtube\.com\/watch\?v=|youtu\.be\/)([^&\n?#]+)',
-            r'youtube\.com\/embed\/([^&\n?#]+)',
-        ]
+        return first_group(VIDEO_ID_PATTERNS, url)
+    
+    def _get_transcript_multiple_methods(self, video_id: str,
+                                         caption_tracks: Optional[List[Tuple[str, str]]] = None) -> str:
+        """Получение субтитров с множественными методами (с кэшем по видео и языкам)"""
+        cache_key = cache_manager.make_key(CacheManager.TRANSCRIPT, video_id, list(self.TRANSCRIPT_LANGUAGES))
+        transcript = cache_manager.get(cache_key)
+        if transcript is not None:
+            return transcript
         
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        transcript = self._fetch_transcript(video_id, caption_tracks)
+        if transcript:
+            cache_manager.set(cache_key, transcript)
+        return transcript
     
-    def _get_transcript_multiple_methods(self, video_id: str) -> str:
-        """Получение субтитров с множественными методами"""
+    def _fetch_transcript(self, video_id: str, caption_tracks: Optional[List[Tuple[str, str]]] = None) -> str:
+        """Получение субтитров из сети"""
         # Метод 1: YouTube Transcript API
         transcript = self._get_transcript_api(video_id)
         if transcript:
             return transcript
         
-        # Метод 2: Извлечение из yt-dlp
+        # Метод 2: Дорожки из уже выполненного извлечения yt-dlp
+        if caption_tracks is not None:
+            self._count_stat('extractions_saved')
+            return self._download_caption_tracks(caption_tracks)
+        
+        # Метод 3: Отдельное извлечение через yt-dlp
         transcript = self._get_transcript_ytdlp(video_id)
         if transcript:
             return transcript
@@ -410,9 +692,11 @@ class YouTubeAnalyzer:
     def _get_transcript_api(self, video_id: str) -> str:
         """Получение субтитров через YouTube Transcript API"""
         try:
+            from youtube_transcript_api import YouTubeTranscriptApi
+            self.rate_limiter.acquire(RateLimiter.TIMEDTEXT_BUCKET)
             transcript_list = YouTubeTranscriptApi.get_transcript(
                 video_id, 
-                languages=['ru', 'en']
+                languages=list(self.TRANSCRIPT_LANGUAGES)
             )
             transcript = ' '.join([item['text'] for item in transcript_list])
             return transcript
@@ -425,34 +709,24 @@ class YouTubeAnalyzer:
         try:
             video_url = f"https://www.youtube.com/watch?v={video_id}"
             
-            subtitle_opts = self.ydl_opts.copy()
-            subtitle_opts.update({
-                'writesubtitles': True,
-                'writeautomaticsub': True,
-                'subtitleslangs': ['ru', 'en'],
-                'subtitlesformat': 'vtt',
-            })
-            
-            with yt_dlp.YoutubeDL(subtitle_opts) as ydl:
-                info = ydl.extract_info(video_url, download=False)
-                
-                # Поиск субтитров в метаданных
-                subtitles = info.get('subtitles', {})
-                auto_subtitles = info.get('automatic_captions', {})
-                
-                for lang in ['ru', 'en']:
-                    if lang in subtitles and subtitles[lang]:
-                        subtitle_url = subtitles[lang][0]['url']
-                        return self._download_subtitle_content(subtitle_url)
-                    elif lang in auto_subtitles and auto_subtitles[lang]:
-                        subtitle_url = auto_subtitles[lang][0]['url']
-                        return self._download_subtitle_content(subtitle_url)
-                
+            # Свежее извлечение: у info dict из кэша нет дорожек субтитров
+            info = self._extract_with_ytdlp(video_url, use_cache=False)
+            if info:
+                return self._download_caption_tracks(info.get('caption_tracks', []))
+        
         except Exception as e:
             self.logger.debug(f"yt-dlp субтитры не получены для {video_id}: {e}")
         
         return ""
     
+    def _download_caption_tracks(self, caption_tracks: List[Tuple[str, str]]) -> str:
+        """Скачивание субтитров с первой доступной дорожки по приоритету"""
+        for lang, subtitle_url in caption_tracks:
+            transcript = self._download_subtitle_content(subtitle_url)
+            if transcript:
+                return transcript
+        return ""
+    
     def _download_subtitle_content(self, subtitle_url: str) -> str:
         """Скачивание и парсинг содержимого субтитров"""
         try:
@@ -465,7 +739,7 @@ class YouTubeAnalyzer:
             transcript_lines = []
             for line in lines:
                 # Пропускаем временные метки и служебную информацию
-                if not re.match(r'^\d+:\d+:\d+', line) and not line.startswith('WEBVTT') and line.strip():
+                if not VTT_TIMESTAMP.match(line) and not line.startswith('WEBVTT') and line.strip():
                     transcript_lines.append(line.strip())
             
             return ' '.join(transcript_lines)
@@ -474,159 +748,84 @@ class YouTubeAnalyzer:
             self.logger.debug(f"Ошибка скачивания субтитров с {subtitle_url}: {e}")
             return ""
     
-    def _analyze_video_content(self, video_data: VideoData):
+    def offload_transcript(self, video_data: VideoData) -> None:
+        """Перенос субтитров видео в TranscriptStore (в VideoData остается дескриптор)"""
+        if self.transcript_store is None or not isinstance(video_data.transcript, str) or not video_data.transcript:
+            return
+        video_data.transcript = self.transcript_store.put(video_data.url, video_data.transcript)
+    
+    def analyze_video_content(self, video_data: VideoData):
         """Анализ контента видео"""
-        # Анализ темы и формата
-        video_data.topic_format = self._extract_topic_format(video_data.title, video_data.description)
-        
-        # Определение глобальной проблемы
-        video_data.global_problem = self._identify_global_problem(video_data.transcript, video_data.description)
-        
-        # Извлечение вопросов и ответов
-        questions, answers = self._extract_qa_pairs(video_data.transcript)
-        video_data.viewer_questions = questions
-        video_data.speaker_answers = answers
+        self.analyze_videos_content([video_data])
+    
+    def analyze_videos_content(self, videos_data: List[VideoData]):
+        """Анализ контента списка видео (пачками в пуле процессов, если он включен)"""
+        # Субтитры читаются из хранилища только на время анализа пачки
+        items = [(video.title, video.description, str(video.transcript)) for video in videos_data]
         
-        # Поиск CTA
-        video_data.cta_action = self._extract_cta(video_data.description, video_data.transcript)
+        # Тема и формат, глобальная проблема, вопросы и ответы, CTA, актуальность, мнение спикера
+        if self.analysis_pool is not None:
+            results = self.analysis_pool.analyze(items)
+        else:
+            results = [analyze_text_content(*item) for item in items]
         
+        for video_data, fields in zip(videos_data, results):
+            for field_name in TEXT_ANALYSIS_FIELDS:
+                setattr(video_data, field_name, fields[field_name])
+            
+            self._update_metric_analysis(video_data)
+    
+    def _update_metric_analysis(self, video_data: VideoData):
+        """Поля анализа, зависящие от метрик видео"""
         # Обоснование темы
-        video_data.topic_justification = self._justify_topic(video_data.title, video_data.views, video_data.likes)
+        video_data.topic_justification = justify_topic(video_data.title, video_data.views, video_data.likes)
         
         # Референс (превью + просмотры)
         video_data.reference_preview_views = f"Просмотры: {video_data.views:,}, Лайки: {video_data.likes:,}"
-        
-        # Проверка темы
-        video_data.topic_verification = self._verify_topic_relevance(video_data.title, video_data.transcript)
-        
-        # Мнение спикера
-        video_data.speaker_opinion = self._extract_speaker_opinion(video_data.transcript)
-    
-    def _extract_topic_format(self, title: str, description: str) -> str:
-        """Извлечение темы и формата видео"""
-        text = (title + ' ' + description).lower()
-        detected_formats = []
-        
-        for format_name, indicators in ContentAnalysisConstants.CONTENT_FORMATS.items():
-            if any(indicator in text for indicator in indicators):
-                detected_formats.append(format_name)
-        
-        return ', '.join(detected_formats) if detected_formats else 'общий контент'
-    
-    def _identify_global_problem(self, transcript: str, description: str) -> str:
-        """Определение глобальной проблемы, которую решает видео"""
-        text = (transcript + ' ' + description).lower()
-        
-        # Поиск предложений с индикаторами проблем
-        sentences = sent_tokenize(text)
-        problem_sentences = []
-        
-        for sentence in sentences:
-            if any(indicator in sentence for indicator in ContentAnalysisConstants.PROBLEM_INDICATORS):
-                problem_sentences.append(sentence.strip())
-        
-        return '. '.join(problem_sentences[:3]) if problem_sentences else 'Проблема не определена'
-    
-    def _extract_qa_pairs(self, transcript: str) -> Tuple[List[str], List[str]]:
-        """Извлечение пар вопрос-ответ из транскрипта"""
-        if not transcript:
-            return [], []
-        
-        question_patterns = [
-            r'[?？]',
-            r'\b(что|как|где|когда|почему|зачем|какой|какая|какие)\b.*?[.!?]',
-            r'\b(вопрос|спрашивают|интересно)\b.*?[.!?]'
-        ]
-        
-        sentences = sent_tokenize(transcript)
-        questions = []
-        answers = []
-        
-        for i, sentence in enumerate(sentences):
-            # Поиск вопросов
-            if any(re.search(pattern, sentence, re.IGNORECASE) for pattern in question_patterns):
-                questions.append(sentence.strip())
-                # Следующее предложение как потенциальный ответ
-                if i + 1 < len(sentences):
-                    answers.append(sentences[i + 1].strip())
-        
-        return questions[:10], answers[:10]  # Ограничиваем количество
     
-    def _extract_cta(self, description: str, transcript: str) -> str:
-        """Извлечение призывов к действию"""
-        text = (description + ' ' + transcript).lower()
-        found_ctas = []
-        
-        for cta_type, patterns in ContentAnalysisConstants.CTA_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in text:
-                    found_ctas.append(f"{cta_type}: {pattern}")
-        
-        return '; '.join(found_ctas[:5]) if found_ctas else 'CTA не найден'
-    
-    def _justify_topic(self, title: str, views: int, likes: int) -> str:
-        """Обоснование выбора темы"""
-        engagement_rate = (likes / views * 100) if views > 0 else 0
-        
-        justification = f"Тема '{title[:50]}...' показывает "
-        
-        if views > 100000:
-            justification += "высокий интерес аудитории (>100K просмотров). "
-        elif views > 10000:
-            justification += "средний интерес аудитории (>10K просмотров). "
-        else:
-            justification += "нишевый интерес аудитории. "
-        
-        if engagement_rate > 1:
-            justification += f"Высокая вовлеченность ({engagement_rate:.2f}% лайков)."
-        else:
-            justification += f"Стандартная вовлеченность ({engagement_rate:.2f}% лайков)."
-        
-        return justification
-    
-    def _verify_topic_relevance(self, title: str, transcript: str) -> str:
-        """Проверка актуальности темы"""
-        text = (title + ' ' + transcript).lower()
-        relevant_keywords = [kw for kw in ContentAnalysisConstants.TRENDING_KEYWORDS if kw in text]
-        
-        if relevant_keywords:
-            return f"Актуальная тема. Содержит трендовые ключевые слова: {', '.join(relevant_keywords)}"
-        else:
-            return "Классическая тема без явных трендовых элементов"
-    
-    def _extract_speaker_opinion(self, transcript: str) -> str:
-        """Извлечение мнения спикера"""
-        opinion_patterns = [
-            r'я думаю.*?[.!?]',
-            r'по моему мнению.*?[.!?]',
-            r'я считаю.*?[.!?]',
-            r'моя точка зрения.*?[.!?]',
-            r'я убежден.*?[.!?]'
-        ]
-        
-        opinions = []
-        for pattern in opinion_patterns:
-            matches = re.findall(pattern, transcript, re.IGNORECASE)
-            opinions.extend(matches)
+    @property
+    def analysis_pool(self) -> Optional[ContentAnalysisPool]:
+        """Пул процессов контент-анализа (создается при первом обращении)"""
+        if self.analysis_processes <= 0:
+            return None
         
-        return '. '.join(opinions[:3]) if opinions else 'Мнение спикера не выражено явно'
+        with self._analysis_pool_lock:
+            if self._analysis_pool is None:
+                self._analysis_pool = ContentAnalysisPool(self.analysis_processes)
+        return self._analysis_pool
     
-    def analyze_channels_batch(self, channel_ids: List[str]) -> List[ChannelData]:
-        """Пакетный анализ каналов"""
+    def analyze_channels_batch(self, channel_ids: List[str], journal: Optional[RunJournal] = None) -> List[ChannelData]:
+        """Пакетный анализ каналов (с журналом - только каналы, не завершенные ранее)"""
         channels_data = []
         progress = ProgressTracker(len(channel_ids), "Анализ каналов")
         
         for channel_id in channel_ids:
-            channel_data = self.analyze_channel(channel_id)
+            channel_data = journal.get_channel(channel_id) if journal is not None else None
+            if channel_data is None:
+                channel_data = self.analyze_channel(channel_id)
+                if channel_data and journal is not None:
+                    journal.add_channel(channel_data)
             if channel_data:
                 channels_data.append(channel_data)
             progress.update()
-            time.sleep(config.request_delay)
         
         return channels_data
     
-    def analyze_channel(self, channel_id: str) -> Optional[ChannelData]:
-        """Анализ канала"""
+    def analyze_channel(self, channel_id: str, use_cache: bool = True) -> Optional[ChannelData]:
+        """Анализ канала (с кэшем по channel_id)"""
+        cache_key = cache_manager.make_key(CacheManager.CHANNEL, channel_id)
+        if use_cache:
+            channel_data = cache_manager.get(cache_key)
+            if channel_data is not None:
+                return channel_data
+        
+        channel_data = self._fetch_channel_data(channel_id)
+        if channel_data:
+            cache_manager.set(cache_key, channel_data)
+        return channel_data
+    
+    def _fetch_channel_data(self, channel_id: str) -> Optional[ChannelData]:
+        """Получение данных канала"""
         try:
             # Здесь должен быть код анализа канала
             # Для краткости показываю основную структуру
@@ -664,6 +863,16 @@ class YouTubeAnalyzer:
         
         return list(set(channel_ids))
     
+    def close(self):
+        """Освобождение ресурсов (экземпляры YoutubeDL, HTTP соединения, пул процессов, файл субтитров)"""
+        self.ydl_pool.close()
+        http_client.close()
+        if self._analysis_pool is not None:
+            self._analysis_pool.close()
+            self._analysis_pool = None
+        if self.transcript_store is not None:
+            self.transcript_store.close()
+    
     def enhance_video_analysis(self, videos_data: List[VideoData]):
         """Дополнительный анализ видео"""
         self.logger.info("Выполнение дополнительного анализа видео...")
@@ -702,195 +911,188 @@ class YouTubeAnalyzer:
             self.logger.error(f"Ошибка создания Excel отчетов: {e}")
             return []
     
+    # Столбцы отчета по видео в порядке вывода
+    VIDEO_REPORT_HEADERS = (
+        'URL', 'Название', 'Описание', 'Длительность (сек)', 'Просмотры', 'Лайки', 'Комментарии', 'Канал',
+        'Дата загрузки', 'Тема + формат', 'Глобальная проблема', 'Вопросы зрителей', 'Ответы спикера', 'CTA',
+        'Обоснование темы', 'Референс', 'Проверка актуальности', 'Мнение спикера', 'Теги', 'Категория'
+    )
+    
+    # Столбцы отчета по каналам в порядке вывода
+    CHANNEL_REPORT_HEADERS = (
+        'ID канала', 'Название', 'Описание', 'Подписчики', 'Всего видео', 'Видео за год', 'Видео за 3 месяца',
+        'Длинных видео', 'Коротких видео', 'Основные темы', 'Целевая аудитория', 'Позиционирование',
+        'Продукты', 'Воронка', 'Фишки эффективности'
+    )
+    
+    @staticmethod
+    def _video_report_row(video: VideoData) -> tuple:
+        """Строка отчета по видео (порядок VIDEO_REPORT_HEADERS)"""
+        return (
+            video.url,
+            video.title,
+            video.description[:500] + '...' if len(video.description) > 500 else video.description,
+            video.duration,
+            video.views,
+            video.likes,
+            video.comments_count,
+            video.channel_name,
+            format_date(video.upload_date),
+            video.topic_format,
+            video.global_problem,
+            '\n'.join(video.viewer_questions),
+            '\n'.join(video.speaker_answers),
+            video.cta_action,
+            video.topic_justification,
+            video.reference_preview_views,
+            video.topic_verification,
+            video.speaker_opinion,
+            ', '.join(video.tags),
+            video.category
+        )
+    
+    @staticmethod
+    def _channel_report_row(channel: ChannelData) -> tuple:
+        """Строка отчета по каналам (порядок CHANNEL_REPORT_HEADERS)"""
+        return (
+            channel.channel_id,
+            channel.channel_name,
+            channel.description[:200] + '...' if len(channel.description) > 200 else channel.description,
+            channel.subscriber_count,
+            channel.total_videos,
+            channel.videos_last_year,
+            channel.videos_last_3_months,
+            channel.long_videos_count,
+            channel.short_videos_count,
+            ', '.join(channel.main_topics),
+            channel.target_audience,
+            channel.positioning,
+            channel.products_offered,
+            channel.funnel_analysis,
+            ', '.join(channel.efficiency_features)
+        )
+    
     def _create_videos_excel_report(self, videos_data: List[VideoData], filepath: Path):
-        """Создание Excel отчета по видео"""
-        df_data = []
-        for video in videos_data:
-            row = {
-                'URL': video.url,
-                'Название': video.title,
-                'Описание': video.description[:500] + '...' if len(video.description) > 500 else video.description,
-                'Длительность (сек)': video.duration,
-                'Просмотры': video.views,
-                'Лайки': video.likes,
-                'Комментарии': video.comments_count,
-                'Канал': video.channel_name,
-                'Дата загрузки': format_date(video.upload_date),
-                'Тема + формат': video.topic_format,
-                'Глобальная проблема': video.global_problem,
-                'Вопросы зрителей': '\n'.join(video.viewer_questions),
-                'Ответы спикера': '\n'.join(video.speaker_answers),
-                'CTA': video.cta_action,
-                'Обоснование темы': video.topic_justification,
-                'Референс': video.reference_preview_views,
-                'Проверка актуальности': video.topic_verification,
-                'Мнение спикера': video.speaker_opinion,
-                'Теги': ', '.join(video.tags),
-                'Категория': video.category
-            }
-            df_data.append(row)
-        
-        df = pd.DataFrame(df_data)
-        
-        # Создание Excel файла с форматированием
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Анализ видео', index=False)
-            
-            # Применение стилей
-            workbook = writer.book
-            worksheet = writer.sheets['Анализ видео']
-            
-            # Настройка ширины столбцов
-            for column in df.columns:
-                column_width = ExcelStylesConfig.COLUMN_WIDTHS.get(column, 20)
-                column_letter = openpyxl.utils.get_column_letter(df.columns.get_loc(column) + 1)
-                worksheet.column_dimensions[column_letter].width = column_width
-            
-            # Стилизация заголовков
-            header_font = Font(name=ExcelStylesConfig.FONT_NAME, 
-                             size=ExcelStylesConfig.HEADER_FONT_SIZE, 
-                             bold=True, color="FFFFFF")
-            header_fill = PatternFill(start_color=ExcelStylesConfig.HEADER_COLOR, 
-                                    end_color=ExcelStylesConfig.HEADER_COLOR, 
-                                    fill_type="solid")
-            
-            for cell in worksheet[1]:
-                cell.font = header_font
-                cell.fill = header_fill
-                cell.alignment = Alignment(horizontal="center", vertical="center")
-            
-            # Автоподбор высоты строк
-            for row in worksheet.iter_rows(min_row=2):
-                for cell in row:
-                    cell.alignment = Alignment(wrap_text=True, vertical="top")
+        """Создание Excel отчета по видео (потоковая запись, общие стили)"""
+        columns = [(header, ExcelStylesConfig.COLUMN_WIDTHS.get(header, 20)) for header in self.VIDEO_REPORT_HEADERS]
+        
+        with StreamingExcelWriter(filepath) as writer:
+            writer.write_sheet('Анализ видео', columns, (self._video_report_row(video) for video in videos_data))
         
         self.logger.info(f"Отчет по видео создан: {filepath}")
     
     def _create_channels_excel_report(self, channels_data: List[ChannelData], filepath: Path):
-        """Создание Excel отчета по каналам"""
-        df_data = []
-        for channel in channels_data:
-            row = {
-                'ID канала': channel.channel_id,
-                'Название': channel.channel_name,
-                'Описание': channel.description[:200] + '...' if len(channel.description) > 200 else channel.description,
-                'Подписчики': channel.subscriber_count,
-                'Всего видео': channel.total_videos,
-                'Видео за год': channel.videos_last_year,
-                'Видео за 3 месяца': channel.videos_last_3_months,
-                'Длинных видео': channel.long_videos_count,
-                'Коротких видео': channel.short_videos_count,
-                'Основные темы': ', '.join(channel.main_topics),
-                'Целевая аудитория': channel.target_audience,
-                'Позиционирование': channel.positioning,
-                'Продукты': channel.products_offered,
-                'Воронка': channel.funnel_analysis,
-                'Фишки эффективности': ', '.join(channel.efficiency_features)
-            }
-            df_data.append(row)
+        """Создание Excel отчета по каналам (потоковая запись)"""
+        columns = [(header, 25) for header in self.CHANNEL_REPORT_HEADERS]
         
-        df = pd.DataFrame(df_data)
-        
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Анализ каналов', index=False)
-            
-            # Применение базового форматирования
-            workbook = writer.book
-            worksheet = writer.sheets['Анализ каналов']
-            
-            for column in df.columns:
-                column_letter = openpyxl.utils.get_column_letter(df.columns.get_loc(column) + 1)
-                worksheet.column_dimensions[column_letter].width = 25
+        with StreamingExcelWriter(filepath) as writer:
+            writer.write_sheet('Анализ каналов', columns,
+                               (self._channel_report_row(channel) for channel in channels_data), wrap=False)
         
         self.logger.info(f"Отчет по каналам создан: {filepath}")
     
     def _create_summary_excel_report(self, videos_data: List[VideoData], channels_data: List[ChannelData], filepath: Path):
-        """Создание сводного Excel отчета"""
-        
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            # Лист 1: Общая статистика
-            summary_data = {
-                'Метрика': [
-                    'Всего видео проанализировано',
-                    'Всего каналов проанализировано',
-                    'Общие просмотры',
-                    'Общие лайки',
-                    'Средняя длительность видео (мин)',
-                    'Самое популярное видео',
-                    'Самый активный канал'
-                ],
-                'Значение': [
-                    len(videos_data),
-                    len(channels_data),
-                    sum(v.views for v in videos_data) if videos_data else 0,
-                    sum(v.likes for v in videos_data) if videos_data else 0,
-                    round(np.mean([v.duration for v in videos_data]) / 60, 1) if videos_data else 0,
-                    max(videos_data, key=lambda x: x.views).title if videos_data else 'Нет данных',
-                    max(channels_data, key=lambda x: x.total_videos).channel_name if channels_data else 'Нет данных'
-                ]
-            }
-            
-            summary_df = pd.DataFrame(summary_data)
-            summary_df.to_excel(writer, sheet_name='Сводка', index=False)
+        """Создание сводного Excel отчета (метрики считаются по колоночным пачкам VideoBatch/ChannelBatch)"""
+        videos = VideoBatch(videos_data)
+        channels = ChannelBatch(channels_data)
+        top_videos = videos.top('views', 20)
+        top_channel = channels.top('total_videos', 1)
+        
+        # Лист 1: Общая статистика
+        summary_rows = [
+            ('Всего видео проанализировано', len(videos)),
+            ('Всего каналов проанализировано', len(channels)),
+            ('Общие просмотры', videos.total('views')),
+            ('Общие лайки', videos.total('likes')),
+            ('Средняя длительность видео (мин)', round(videos.mean('duration') / 60, 1)),
+            ('Средняя вовлеченность (лайки и комментарии / просмотры), %',
+             round(float(videos.engagement_rate().mean()) * 100, 2) if len(videos) else 0),
+            ('Самое популярное видео', top_videos[0].title if top_videos else 'Нет данных'),
+            ('Самый активный канал', top_channel[0].channel_name if top_channel else 'Нет данных'),
+            ('Активных каналов (публикации за 3 мес)', channels.active_count())
+        ]
+        for key, count in videos.duration_distribution().items():
+            summary_rows.append((f"Видео {DURATION_BUCKET_LABELS[key]}", count))
+        
+        # Лист 3: Рекомендации
+        best_bucket = videos.best_duration_bucket('views')
+        if best_bucket is not None:
+            duration_advice = (f"{DURATION_BUCKET_LABELS[best_bucket]}: наибольшая медиана просмотров "
+                               f"(на основе анализа {len(videos)} видео)")
+        else:
+            duration_advice = f"8-12 минут (на основе анализа {len(videos)} видео)"
+        recommendation_rows = [
+            ('Оптимальная длительность видео', duration_advice),
+            ('Рекомендуемая частота публикаций', "2-3 видео в неделю (средняя частота лидеров)"),
+            ('Популярные форматы контента', "Туториалы, обзоры, кейсы"),
+            ('Эффективные CTA', "Ссылка в описании, подписка на канал"),
+            ('Трендовые темы', "AI, технологии, онлайн-образование")
+        ]
+        
+        with StreamingExcelWriter(filepath) as writer:
+            writer.write_sheet('Сводка', [('Метрика', 60), ('Значение', 50)], summary_rows, wrap=False)
             
             # Лист 2: Топ видео
-            if videos_data:
-                top_videos = sorted(videos_data, key=lambda x: x.views, reverse=True)[:20]
-                top_videos_data = []
-                for video in top_videos:
-                    top_videos_data.append({
-                        'Название': video.title,
-                        'Канал': video.channel_name,
-                        'Просмотры': video.views,
-                        'Лайки': video.likes,
-                        'Тема': video.topic_format,
-                        'URL': video.url
-                    })
-                
-                top_videos_df = pd.DataFrame(top_videos_data)
-                top_videos_df.to_excel(writer, sheet_name='Топ видео', index=False)
-            
-            # Лист 3: Рекомендации
-            recommendations_data = {
-                'Рекомендация': [
-                    'Оптимальная длительность видео',
-                    'Рекомендуемая частота публикаций',
-                    'Популярные форматы контента',
-                    'Эффективные CTA',
-                    'Трендовые темы'
-                ],
-                'Описание': [
-                    f"8-12 минут (на основе анализа {len(videos_data)} видео)",
-                    "2-3 видео в неделю (средняя частота лидеров)",
-                    "Туториалы, обзоры, кейсы",
-                    "Ссылка в описании, подписка на канал",
-                    "AI, технологии, онлайн-образование"
-                ]
-            }
+            if top_videos:
+                writer.write_sheet(
+                    'Топ видео',
+                    [('Название', 50), ('Канал', 25), ('Просмотры', 15), ('Лайки', 12), ('Тема', 40), ('URL', 45)],
+                    ((video.title, video.channel_name, video.views, video.likes, video.topic_format, video.url)
+                     for video in top_videos),
+                    wrap=False
+                )
             
-            recommendations_df = pd.DataFrame(recommendations_data)
-            recommendations_df.to_excel(writer, sheet_name='Рекомендации', index=False)
+            writer.write_sheet('Рекомендации', [('Рекомендация', 40), ('Описание', 80)], recommendation_rows)
         
         self.logger.info(f"Сводный отчет создан: {filepath}")
     
+    def json_report_sink(self) -> NDJSONReportSink:
+        """Приемник конвейера, пишущий JSON отчеты по мере готовности видео и каналов"""
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return NDJSONReportSink(self.output_dir, timestamp, compress=config.json_reports_gzip)
+    
+    def create_parquet_reports(self, videos_data: List[VideoData], channels_data: List[ChannelData]) -> List[str]:
+        """Создание Parquet отчетов (загрузка: src.parquet_io.load_videos/load_channels)"""
+        from .parquet_io import write_channels_parquet, write_videos_parquet
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        report_files = []
+        
+        try:
+            if videos_data:
+                videos_file = self.output_dir / f"videos_data_{timestamp}.parquet"
+                write_videos_parquet(videos_data, videos_file)
+                report_files.append(str(videos_file))
+            
+            if channels_data:
+                channels_file = self.output_dir / f"channels_data_{timestamp}.parquet"
+                write_channels_parquet(channels_data, channels_file)
+                report_files.append(str(channels_file))
+            
+            self.logger.info(f"Parquet отчеты созданы: {len(report_files)} файлов")
+            return report_files
+        
+        except Exception as e:
+            self.logger.error(f"Ошибка создания Parquet отчетов: {e}")
+            return []
+    
     def create_json_reports(self, videos_data: List[VideoData], channels_data: List[ChannelData]) -> List[str]:
-        """Создание JSON отчетов"""
+        """Создание JSON отчетов (NDJSON: одна запись на строку, записи сериализуются по одной)"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_files = []
+        suffix = NDJSON_SUFFIX + (GZIP_SUFFIX if config.json_reports_gzip else '')
         
         try:
             # JSON отчет по видео
             if videos_data:
-                videos_file = self.output_dir / f"videos_data_{timestamp}.json"
-                videos_json = [asdict(video) for video in videos_data]
-                save_json(videos_json, videos_file)
+                videos_file = self.output_dir / f"videos_data_{timestamp}{suffix}"
+                write_ndjson(videos_data, videos_file)
                 report_files.append(str(videos_file))
             
             # JSON отчет по каналам
             if channels_data:
-                channels_file = self.output_dir / f"channels_data_{timestamp}.json"
-                channels_json = [asdict(channel) for channel in channels_data]
-                save_json(channels_json, channels_file)
+                channels_file = self.output_dir / f"channels_data_{timestamp}{suffix}"
+                write_ndjson(channels_data, channels_file)
                 report_files.append(str(channels_file))
             
             self.logger.info(f"JSON отчеты созданы: {len(report_files)} файлов")
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Колоночные пачки видео и каналов для YouTube Competitor Analysis Tool
+
+VideoBatch/ChannelBatch хранят числовые поля результатов в массивах NumPy: суммы,
+средние, топ-k (argpartition), распределение по длительности и вовлеченность
+считаются векторно, без повторных проходов по списку объектов.
+numpy импортируется при построении пачки.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+
+from config import YouTubeConstants
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Корзины длительности: (ключ, верхняя граница в секундах включительно)
+DURATION_BUCKETS = (
+    ('short', YouTubeConstants.VIDEO_DURATION_SHORT),
+    ('medium', YouTubeConstants.VIDEO_DURATION_MEDIUM),
+    ('long', YouTubeConstants.VIDEO_DURATION_LONG),
+    ('very_long', None),
+)
+
+DURATION_BUCKET_LABELS = {
+    'short': 'Shorts (до 1 мин)',
+    'medium': 'до 10 мин',
+    'long': 'до 1 часа',
+    'very_long': 'более 1 часа',
+}
+
+def _column(records: Sequence[Any], attribute: str, dtype: str) -> 'np.ndarray':
+    """Массив значений поля (None -> 0)"""
+    import numpy as np
+    
+    return np.fromiter((getattr(record, attribute) or 0 for record in records), dtype=dtype, count=len(records))
+
+def _top_indices(values: 'np.ndarray', k: int) -> 'np.ndarray':
+    """Индексы k наибольших значений по убыванию: argpartition O(n) + сортировка k элементов"""
+    import numpy as np
+    
+    k = min(k, len(values))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k < len(values):
+        # Кандидаты по порядку в пачке: при равных значениях порядок как у sorted()
+        candidates = np.sort(np.argpartition(values, len(values) - k)[len(values) - k:])
+    else:
+        candidates = np.arange(len(values))
+    return candidates[np.argsort(-values[candidates], kind='stable')]
+
+class VideoBatch:
+    """Колоночное представление списка VideoData"""
+    
+    def __init__(self, videos: Sequence[Any]):
+        self.records = videos if isinstance(videos, list) else list(videos)
+        self.views = _column(self.records, 'views', 'int64')
+        self.likes = _column(self.records, 'likes', 'int64')
+        self.comments = _column(self.records, 'comments_count', 'int64')
+        self.duration = _column(self.records, 'duration', 'int64')
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def total(self, column: str) -> int:
+        """Сумма столбца (views, likes, comments, duration)"""
+        return int(getattr(self, column).sum())
+    
+    def mean(self, column: str) -> float:
+        """Среднее столбца (0 для пустой пачки)"""
+        values = getattr(self, column)
+        return float(values.mean()) if len(values) else 0.0
+    
+    def top_indices(self, column: str = 'views', k: int = 20) -> 'np.ndarray':
+        """Индексы k видео с наибольшим значением столбца"""
+        return _top_indices(getattr(self, column), k)
+    
+    def top(self, column: str = 'views', k: int = 20) -> List[Any]:
+        """k видео с наибольшим значением столбца, по убыванию"""
+        return [self.records[index] for index in self.top_indices(column, k)]
+    
+    def duration_buckets(self) -> 'np.ndarray':
+        """Номер корзины длительности каждого видео (индекс в DURATION_BUCKETS)"""
+        import numpy as np
+        
+        bounds = [bound for _, bound in DURATION_BUCKETS if bound is not None]
+        # Граница включается в корзину: 60 с - еще Shorts
+        return np.searchsorted(np.array(bounds), self.duration, side='left')
+    
+    def duration_distribution(self) -> Dict[str, int]:
+        """Число видео в каждой корзине длительности"""
+        import numpy as np
+        
+        counts = np.bincount(self.duration_buckets(), minlength=len(DURATION_BUCKETS))
+        return {key: int(count) for (key, _), count in zip(DURATION_BUCKETS, counts)}
+    
+    def engagement_rate(self) -> 'np.ndarray':
+        """(лайки + комментарии) / просмотры для каждого видео (0 при нуле просмотров)"""
+        import numpy as np
+        
+        engagement = (self.likes + self.comments).astype(np.float64)
+        return np.divide(engagement, self.views, out=np.zeros(len(self.views)), where=self.views > 0)
+    
+    def best_duration_bucket(self, column: str = 'views') -> Optional[str]:
+        """Корзина длительности с наибольшей медианой столбца (None для пустой пачки)"""
+        import numpy as np
+        
+        if not len(self):
+            return None
+        
+        values = self.engagement_rate() if column == 'engagement' else getattr(self, column)
+        buckets = self.duration_buckets()
+        best_key, best_median = None, None
+        for index, (key, _) in enumerate(DURATION_BUCKETS):
+            selected = values[buckets == index]
+            if not len(selected):
+                continue
+            median = float(np.median(selected))
+            if best_median is None or median > best_median:
+                best_key, best_median = key, median
+        return best_key
+
+class ChannelBatch:
+    """Колоночное представление списка ChannelData"""
+    
+    def __init__(self, channels: Sequence[Any]):
+        self.records = channels if isinstance(channels, list) else list(channels)
+        self.subscribers = _column(self.records, 'subscriber_count', 'int64')
+        self.total_videos = _column(self.records, 'total_videos', 'int64')
+        self.videos_last_year = _column(self.records, 'videos_last_year', 'int64')
+        self.videos_last_3_months = _column(self.records, 'videos_last_3_months', 'int64')
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def total(self, column: str) -> int:
+        """Сумма столбца"""
+        return int(getattr(self, column).sum())
+    
+    def mean(self, column: str) -> float:
+        """Среднее столбца (0 для пустой пачки)"""
+        values = getattr(self, column)
+        return float(values.mean()) if len(values) else 0.0
+    
+    def top(self, column: str = 'subscribers', k: int = 20) -> List[Any]:
+        """k каналов с наибольшим значением столбца, по убыванию"""
+        return [self.records[index] for index in _top_indices(getattr(self, column), k)]
+    
+    def active_count(self) -> int:
+        """Каналы с публикациями за последние 3 месяца"""
+        return int((self.videos_last_3_months > 0).sum())
+
+# === ЭКСПОРТ ===
+
+__all__ = [
+    'DURATION_BUCKETS',
+    'DURATION_BUCKET_LABELS',
+    'VideoBatch',
+    'ChannelBatch'
+]
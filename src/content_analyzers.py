@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+NLP анализ контента видео для YouTube Competitor Analysis Tool
+
+Функции модуля не зависят от YouTubeAnalyzer и могут выполняться в дочерних процессах.
+"""
+
+import bisect
+import logging
+import threading
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+from functools import cached_property
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from config import config, ContentAnalysisConstants
+from .pattern_matcher import MultiPatternMatcher, PatternHit
+from .patterns import DialogueScan, scan_dialogue
+
+# Входные данные анализа: (название, описание, транскрипт)
+ContentInput = Tuple[str, str, str]
+
+# Поля VideoData, вычисляемые анализом текста
+TEXT_ANALYSIS_FIELDS = [
+    'topic_format', 'global_problem', 'viewer_questions', 'speaker_answers',
+    'cta_action', 'topic_verification', 'speaker_opinion'
+]
+
+# === СЛОВАРИ ИНДИКАТОРОВ ===
+
+def build_content_matcher() -> MultiPatternMatcher:
+    """Компиляция всех индикаторов ContentAnalysisConstants в один автомат"""
+    matcher = MultiPatternMatcher()
+    
+    for format_name, indicators in ContentAnalysisConstants.CONTENT_FORMATS.items():
+        for indicator in indicators:
+            matcher.add(indicator, 'format', format_name)
+    
+    for indicator in ContentAnalysisConstants.PROBLEM_INDICATORS:
+        matcher.add(indicator, 'problem')
+    
+    for cta_type, patterns in ContentAnalysisConstants.CTA_PATTERNS.items():
+        for pattern in patterns:
+            matcher.add(pattern, 'cta', cta_type)
+    
+    for keyword in ContentAnalysisConstants.TRENDING_KEYWORDS:
+        matcher.add(keyword, 'trending')
+    
+    for audience, indicators in ContentAnalysisConstants.AUDIENCE_INDICATORS.items():
+        for indicator in indicators:
+            matcher.add(indicator, 'audience', audience)
+    
+    return matcher.build()
+
+# Автомат компилируется один раз при импорте (в каждом процессе)
+CONTENT_MATCHER = build_content_matcher()
+
+# === КОНТЕКСТ АНАЛИЗА ===
+
+class Sentence(NamedTuple):
+    """Предложение со смещениями в исходном поле"""
+    text: str
+    lower: str
+    span: Optional[Tuple[int, int]]
+
+class AnalysisContext:
+    """Тексты одного видео: нормализация, токенизация и поиск индикаторов выполняются один раз"""
+    
+    def __init__(self, title: str, description: str, transcript: str):
+        self.title = title or ''
+        self.description = description or ''
+        self.transcript = transcript or ''
+        self._hits_cache: Dict[str, Dict[str, List[PatternHit]]] = {}
+    
+    @cached_property
+    def title_lower(self) -> str:
+        return self.title.lower()
+    
+    @cached_property
+    def description_lower(self) -> str:
+        return self.description.lower()
+    
+    @cached_property
+    def transcript_lower(self) -> str:
+        return self.transcript.lower()
+    
+    @cached_property
+    def transcript_sentences(self) -> List[Sentence]:
+        """Предложения транскрипта"""
+        return _split_sentences(self.transcript, self.transcript_lower)
+    
+    @cached_property
+    def description_sentences(self) -> List[Sentence]:
+        """Предложения описания"""
+        return _split_sentences(self.description, self.description_lower)
+    
+    @cached_property
+    def dialogue(self) -> DialogueScan:
+        """Вопросы, ответы и мнения спикера (один проход сканера по предложениям)"""
+        sentences = self.transcript_sentences
+        return scan_dialogue([sentence.text for sentence in sentences],
+                             [sentence.lower for sentence in sentences])
+    
+    @cached_property
+    def tokens(self) -> List[str]:
+        """Токены транскрипта в нижнем регистре"""
+        from nltk.tokenize import word_tokenize
+        return word_tokenize(self.transcript_lower)
+    
+    def hits(self, field_name: str, category: str) -> List[PatternHit]:
+        """Вхождения индикаторов категории в поле (автомат проходит поле один раз)"""
+        return self._field_hits(field_name).get(category, [])
+    
+    def _field_hits(self, field_name: str) -> Dict[str, List[PatternHit]]:
+        by_category = self._hits_cache.get(field_name)
+        if by_category is None:
+            by_category = {}
+            for hit in CONTENT_MATCHER.find_all(getattr(self, f"{field_name}_lower")):
+                by_category.setdefault(hit.category, []).append(hit)
+            self._hits_cache[field_name] = by_category
+        return by_category
+
+def _split_sentences(text: str, text_lower: str) -> List[Sentence]:
+    """Разбиение на предложения со смещениями; нижний регистр берется срезом общей строки"""
+    if not text:
+        return []
+    
+    from nltk.tokenize import sent_tokenize
+    sentences = sent_tokenize(text)
+    # lower() может изменить длину строки (например, для 'İ'), тогда срезы неприменимы
+    aligned = len(text_lower) == len(text)
+    
+    result = []
+    for sentence, span in zip(sentences, _sentence_spans(text, sentences)):
+        if aligned and span is not None:
+            sentence_lower = text_lower[span[0]:span[1]]
+        else:
+            sentence_lower = sentence.lower()
+        result.append(Sentence(sentence, sentence_lower, span if aligned else None))
+    return result
+
+def _sentence_spans(text: str, sentences: List[str]) -> List[Optional[Tuple[int, int]]]:
+    """Смещения предложений в исходном тексте (None, если предложение не найдено дословно)"""
+    spans = []
+    position = 0
+    for sentence in sentences:
+        start = text.find(sentence, position)
+        if start < 0:
+            spans.append(None)
+            continue
+        position = start + len(sentence)
+        spans.append((start, position))
+    return spans
+
+def _has_hit_within(hits: List[PatternHit], hit_starts: List[int], sentence: Sentence) -> bool:
+    """Есть ли вхождение, целиком лежащее внутри предложения"""
+    if sentence.span is None:
+        return any(hit.pattern in sentence.lower for hit in hits)
+    
+    start, end = sentence.span
+    index = bisect.bisect_left(hit_starts, start)
+    while index < len(hits) and hits[index].start < end:
+        if hits[index].end <= end:
+            return True
+        index += 1
+    return False
+
+# === АНАЛИЗАТОРЫ ===
+
+def extract_topic_format(ctx: AnalysisContext) -> str:
+    """Извлечение темы и формата видео"""
+    found_formats = {hit.label for hit in ctx.hits('title', 'format')}
+    found_formats.update(hit.label for hit in ctx.hits('description', 'format'))
+    
+    # Порядок форматов как в CONTENT_FORMATS
+    detected_formats = [
+        format_name for format_name in ContentAnalysisConstants.CONTENT_FORMATS
+        if format_name in found_formats
+    ]
+    
+    return ', '.join(detected_formats) if detected_formats else 'общий контент'
+
+def identify_global_problem(ctx: AnalysisContext) -> str:
+    """Определение глобальной проблемы, которую решает видео"""
+    problem_sentences = []
+    
+    # Вхождения индикаторов сопоставляются с уже разбитыми предложениями транскрипта и описания
+    for field_name, sentences in (('transcript', ctx.transcript_sentences),
+                                  ('description', ctx.description_sentences)):
+        hits = ctx.hits(field_name, 'problem')
+        if not hits:
+            continue
+        
+        hit_starts = [hit.start for hit in hits]
+        for sentence in sentences:
+            if _has_hit_within(hits, hit_starts, sentence):
+                problem_sentences.append(sentence.lower.strip())
+                if len(problem_sentences) >= 3:
+                    break
+        if len(problem_sentences) >= 3:
+            break
+    
+    return '. '.join(problem_sentences[:3]) if problem_sentences else 'Проблема не определена'
+
+def extract_qa_pairs(ctx: AnalysisContext) -> Tuple[List[str], List[str]]:
+    """Извлечение пар вопрос-ответ из транскрипта"""
+    if not ctx.transcript:
+        return [], []
+    
+    return ctx.dialogue.questions, ctx.dialogue.answers
+
+def extract_cta(ctx: AnalysisContext) -> str:
+    """Извлечение призывов к действию"""
+    found_patterns = {
+        (hit.label, hit.pattern)
+        for field_name in ('description', 'transcript')
+        for hit in ctx.hits(field_name, 'cta')
+    }
+    
+    # Порядок как в CTA_PATTERNS
+    found_ctas = [
+        f"{cta_type}: {pattern}"
+        for cta_type, patterns in ContentAnalysisConstants.CTA_PATTERNS.items()
+        for pattern in patterns
+        if (cta_type, pattern) in found_patterns
+    ]
+    
+    return '; '.join(found_ctas[:5]) if found_ctas else 'CTA не найден'
+
+def justify_topic(title: str, views: int, likes: int) -> str:
+    """Обоснование выбора темы"""
+    engagement_rate = (likes / views * 100) if views > 0 else 0
+    
+    justification = f"Тема '{title[:50]}...' показывает "
+    
+    if views > 100000:
+        justification += "высокий интерес аудитории (>100K просмотров). "
+    elif views > 10000:
+        justification += "средний интерес аудитории (>10K просмотров). "
+    else:
+        justification += "нишевый интерес аудитории. "
+    
+    if engagement_rate > 1:
+        justification += f"Высокая вовлеченность ({engagement_rate:.2f}% лайков)."
+    else:
+        justification += f"Стандартная вовлеченность ({engagement_rate:.2f}% лайков)."
+    
+    return justification
+
+def verify_topic_relevance(ctx: AnalysisContext) -> str:
+    """Проверка актуальности темы"""
+    found_keywords = {
+        hit.pattern
+        for field_name in ('title', 'transcript')
+        for hit in ctx.hits(field_name, 'trending')
+    }
+    relevant_keywords = [kw for kw in ContentAnalysisConstants.TRENDING_KEYWORDS if kw in found_keywords]
+    
+    if relevant_keywords:
+        return f"Актуальная тема. Содержит трендовые ключевые слова: {', '.join(relevant_keywords)}"
+    else:
+        return "Классическая тема без явных трендовых элементов"
+
+def extract_speaker_opinion(ctx: AnalysisContext) -> str:
+    """Извлечение мнения спикера"""
+    opinions = ctx.dialogue.opinions
+    
+    return '. '.join(opinions) if opinions else 'Мнение спикера не выражено явно'
+
+# === ПАКЕТНЫЙ АНАЛИЗ ===
+
+def analyze_text_content(title: str, description: str, transcript: str) -> Dict[str, Any]:
+    """Анализ текста видео, возвращает только вычисленные поля"""
+    ctx = AnalysisContext(title, description, transcript)
+    questions, answers = extract_qa_pairs(ctx)
+    
+    return {
+        'topic_format': extract_topic_format(ctx),
+        'global_problem': identify_global_problem(ctx),
+        'viewer_questions': tuple(questions),
+        'speaker_answers': tuple(answers),
+        'cta_action': extract_cta(ctx),
+        'topic_verification': verify_topic_relevance(ctx),
+        'speaker_opinion': extract_speaker_opinion(ctx)
+    }
+
+def analyze_text_content_batch(items: Sequence[ContentInput]) -> List[Dict[str, Any]]:
+    """Анализ пачки видео (точка входа дочернего процесса)"""
+    return [analyze_text_content(title, description, transcript) for title, description, transcript in items]
+
+class ContentAnalysisPool:
+    """Пул процессов для CPU-нагруженного контент-анализа"""
+    
+    def __init__(self, processes: int, batch_size: int = None):
+        if batch_size is None:
+            batch_size = config.analysis_batch_size
+        
+        self.processes = max(1, processes)
+        self.batch_size = max(1, batch_size)
+        self.executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.processes)
+        self.restarts = 0
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+        self.logger.info(f"Контент-анализ выполняется в {self.processes} процессах")
+    
+    def submit(self, items: Sequence[ContentInput]) -> concurrent.futures.Future:
+        """Отправка пачки (название, описание, транскрипт) в пул процессов"""
+        return self.executor.submit(analyze_text_content_batch, list(items))
+    
+    def analyze(self, items: Sequence[ContentInput]) -> List[Dict[str, Any]]:
+        """Анализ списка видео пачками, результаты в исходном порядке
+        
+        Если рабочий процесс завершился аварийно (например, по нехватке памяти), пул
+        пересоздается и пачка повторяется; при повторном сбое она анализируется в текущем процессе.
+        """
+        executor = self.executor
+        try:
+            return self._analyze_with(executor, items)
+        except BrokenProcessPool as e:
+            self.logger.warning(f"Пул процессов контент-анализа неработоспособен ({e}), пересоздание")
+        
+        try:
+            return self._analyze_with(self._restart(executor), items)
+        except BrokenProcessPool as e:
+            self.logger.error(f"Пул процессов контент-анализа неработоспособен после пересоздания ({e}): "
+                              f"{len(items)} видео анализируются в текущем процессе")
+            return [analyze_text_content(*item) for item in items]
+    
+    def _analyze_with(self, executor: concurrent.futures.ProcessPoolExecutor,
+                      items: Sequence[ContentInput]) -> List[Dict[str, Any]]:
+        """Отправка пачек в указанный пул и сбор результатов"""
+        futures = [
+            executor.submit(analyze_text_content_batch, list(items[start:start + self.batch_size]))
+            for start in range(0, len(items), self.batch_size)
+        ]
+        
+        results = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+    
+    def _restart(self, broken: concurrent.futures.ProcessPoolExecutor) -> concurrent.futures.ProcessPoolExecutor:
+        """Замена неработоспособного пула (один раз, даже если сбой видели несколько потоков)"""
+        with self._lock:
+            if self.executor is broken:
+                broken.shutdown(wait=False)
+                self.executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.processes)
+                self.restarts += 1
+            return self.executor
+    
+    def close(self) -> None:
+        """Остановка пула процессов"""
+        self.executor.shutdown(wait=True)
+
+# === ЭКСПОРТ ===
+
+__all__ = [
+    'TEXT_ANALYSIS_FIELDS',
+    'CONTENT_MATCHER',
+    'build_content_matcher',
+    'AnalysisContext',
+    'extract_topic_format',
+    'identify_global_problem',
+    'extract_qa_pairs',
+    'extract_cta',
+    'justify_topic',
+    'verify_topic_relevance',
+    'extract_speaker_opinion',
+    'analyze_text_content',
+    'analyze_text_content_batch',
+    'ContentAnalysisPool'
+]
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Потоковая запись Excel отчетов для YouTube Competitor Analysis Tool
+
+Книга openpyxl в режиме write-only: строки записываются на диск по мере добавления,
+оформление задается общими именованными стилями, а не объектами на каждую ячейку.
+Лист, превысивший лимит строк xlsx, продолжается на следующем.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union
+
+from config import ExcelStylesConfig
+
+# Лимит строк листа xlsx (вместе со строкой заголовков)
+XLSX_MAX_ROWS = 1048576
+
+# Лимит длины имени листа
+SHEET_TITLE_LIMIT = 31
+
+# Именованные стили книги
+HEADER_STYLE = 'report_header'
+BODY_STYLE = 'report_body'
+
+class StreamingExcelWriter:
+    """Запись xlsx с постоянным расходом памяти (openpyxl write_only)"""
+    
+    def __init__(self, filepath: Union[str, Path], max_rows: int = XLSX_MAX_ROWS):
+        from openpyxl import Workbook
+        
+        self.filepath = Path(filepath)
+        # Одна строка листа занята заголовками
+        self.max_rows = max(2, min(max_rows, XLSX_MAX_ROWS))
+        self.workbook = Workbook(write_only=True)
+        self.logger = logging.getLogger(__name__)
+        self._register_styles()
+    
+    def _register_styles(self) -> None:
+        """Общие стили: ячейки ссылаются на них по имени"""
+        from openpyxl.styles import Alignment, Font, NamedStyle, PatternFill
+        
+        header = NamedStyle(name=HEADER_STYLE)
+        header.font = Font(name=ExcelStylesConfig.FONT_NAME, size=ExcelStylesConfig.HEADER_FONT_SIZE,
+                           bold=True, color="FFFFFF")
+        header.fill = PatternFill(start_color=ExcelStylesConfig.HEADER_COLOR,
+                                  end_color=ExcelStylesConfig.HEADER_COLOR, fill_type="solid")
+        header.alignment = Alignment(horizontal="center", vertical="center")
+        self.workbook.add_named_style(header)
+        
+        body = NamedStyle(name=BODY_STYLE)
+        body.alignment = Alignment(wrap_text=True, vertical="top")
+        self.workbook.add_named_style(body)
+    
+    def write_sheet(self, title: str, columns: Sequence[Tuple[str, float]], rows: Iterable[Sequence[Any]],
+                    wrap: bool = True) -> int:
+        """Запись таблицы (заголовок, ширина) на лист title, при переполнении - на 'title (2)' и далее"""
+        from openpyxl.cell import WriteOnlyCell
+        
+        written = 0
+        sheet_number = 0
+        sheet = None
+        body_cells: Optional[List[Any]] = None
+        sheet_rows = 0
+        
+        for row in rows:
+            if sheet is None or sheet_rows >= self.max_rows:
+                sheet_number += 1
+                sheet = self._create_sheet(title, sheet_number, columns)
+                sheet_rows = 1
+                if wrap:
+                    # Строка уходит на диск сразу при append, поэтому ячейки столбцов переиспользуются
+                    body_cells = [WriteOnlyCell(sheet) for _ in columns]
+                    for cell in body_cells:
+                        cell.style = BODY_STYLE
+            
+            if body_cells is not None:
+                for cell, value in zip(body_cells, row):
+                    cell.value = value
+                sheet.append(body_cells)
+            else:
+                sheet.append(row)
+            
+            sheet_rows += 1
+            written += 1
+        
+        if sheet is None:
+            # Пустая таблица: только заголовки
+            self._create_sheet(title, 1, columns)
+        elif sheet_number > 1:
+            self.logger.info(f"Таблица '{title}' разделена на {sheet_number} листа(ов): {written} строк")
+        
+        return written
+    
+    def _create_sheet(self, title: str, number: int, columns: Sequence[Tuple[str, float]]):
+        """Новый лист с шириной столбцов и строкой заголовков"""
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.utils import get_column_letter
+        
+        if number > 1:
+            suffix = f" ({number})"
+            title = title[:SHEET_TITLE_LIMIT - len(suffix)] + suffix
+        sheet = self.workbook.create_sheet(title[:SHEET_TITLE_LIMIT])
+        
+        # Ширина столбцов задается до первой строки: в режиме write-only она пишется в начало листа
+        for index, (_, width) in enumerate(columns, 1):
+            sheet.column_dimensions[get_column_letter(index)].width = width
+        
+        header_cells = []
+        for header, _ in columns:
+            cell = WriteOnlyCell(sheet, value=header)
+            cell.style = HEADER_STYLE
+            header_cells.append(cell)
+        sheet.append(header_cells)
+        return sheet
+    
+    def save(self) -> Path:
+        """Запись книги на диск (после save книга закрыта)"""
+        self.workbook.save(str(self.filepath))
+        return self.filepath
+    
+    def __enter__(self) -> 'StreamingExcelWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.save()
+
+# === ЭКСПОРТ ===
+
+__all__ = [
+    'XLSX_MAX_ROWS',
+    'StreamingExcelWriter'
+]
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HTTP клиент с пулом keep-alive соединений для YouTube Competitor Analysis Tool
+"""
+
+import logging
+import threading
+from http.cookiejar import MozillaCookieJar
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+
+from config import config, YouTubeConstants
+
+class HttpClient:
+    """Общая requests.Session с пулом соединений, сжатием и статистикой"""
+    
+    def __init__(self, pool_size: int = None):
+        if pool_size is None:
+            pool_size = config.http_pool_size
+        
+        self.pool_size = max(1, pool_size)
+        self.logger = logging.getLogger(__name__)
+        
+        self._session: Optional[requests.Session] = None
+        self._adapter: Optional[HTTPAdapter] = None
+        self._lock = threading.Lock()
+        
+        # Статистика
+        self._requests_count = 0
+        self._errors_count = 0
+        self._compressed_count = 0
+    
+    @property
+    def session(self) -> requests.Session:
+        """Ленивое создание общей сессии"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+    
+    def _create_session(self) -> requests.Session:
+        """Создание сессии с пулом соединений"""
+        session = requests.Session()
+        
+        # Пул на каждый хост рассчитан на одновременную работу всех потоков
+        self._adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            pool_block=False
+        )
+        session.mount('https://', self._adapter)
+        session.mount('http://', self._adapter)
+        
+        session.headers.update({
+            'User-Agent': YouTubeConstants.USER_AGENTS[0],
+            'Accept-Encoding': make_headers(accept_encoding=True)['accept-encoding'],
+            'Connection': 'keep-alive'
+        })
+        
+        # Прокси и cookies настраиваются один раз на всю сессию
+        if config.proxies:
+            session.proxies.update(config.proxies)
+        
+        if config.has_cookies:
+            try:
+                cookie_jar = MozillaCookieJar(config.youtube_cookies_file)
+                cookie_jar.load(ignore_discard=True, ignore_expires=True)
+                session.cookies.update(cookie_jar)
+            except Exception as e:
+                self.logger.warning(f"Не удалось загрузить cookies для HTTP сессии: {e}")
+        
+        self.logger.debug(f"HTTP сессия создана, размер пула: {self.pool_size}")
+        return session
+    
+    def configure(self, pool_size: int) -> None:
+        """Изменение размера пула (пересоздает сессию при необходимости)"""
+        pool_size = max(1, pool_size)
+        if pool_size == self.pool_size:
+            return
+        
+        with self._lock:
+            self.pool_size = pool_size
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+                self._adapter = None
+    
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET запрос через общую сессию"""
+        if config.proxies:
+            # Явная передача прокси, чтобы переменные окружения не перекрывали настройки сессии
+            kwargs.setdefault('proxies', config.proxies)
+        
+        try:
+            response = self.session.get(url, **kwargs)
+        except requests.exceptions.RequestException:
+            with self._lock:
+                self._errors_count += 1
+            raise
+        
+        with self._lock:
+            self._requests_count += 1
+            if response.headers.get('Content-Encoding'):
+                self._compressed_count += 1
+        
+        return response
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Статистика запросов и переиспользования соединений"""
+        connections = 0
+        pool_requests = 0
+        
+        if self._adapter is not None:
+            pools = self._adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is None:
+                    continue
+                connections += getattr(pool, 'num_connections', 0)
+                pool_requests += getattr(pool, 'num_requests', 0)
+        
+        return {
+            'requests': self._requests_count,
+            'errors': self._errors_count,
+            'compressed_responses': self._compressed_count,
+            'connections_opened': connections,
+            'connections_reused': max(0, pool_requests - connections),
+            'pool_size': self.pool_size
+        }
+    
+    def close(self) -> None:
+        """Закрытие сессии и всех соединений"""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+                self._adapter = None
+
+# Глобальный HTTP клиент
+http_client = HttpClient()
+
+# === ЭКСПОРТ ===
+
+__all__ = [
+    'HttpClient',
+    'http_client'
+]
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Хранилище результатов прошлых запусков для инкрементального режима YouTube Competitor Analysis Tool
+
+Каждый VideoData/ChannelData сохраняется вместе со временем получения. При повторном
+запуске новые видео извлекаются полностью, устаревшие - только обновляют метрики,
+свежие берутся из хранилища без обращения к сети.
+"""
+
+import logging
+import threading
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+from diskcache import Cache
+
+from config import config
+
+class IncrementalStore:
+    """Результаты анализа видео и каналов со временем получения (fetched_at)"""
+    
+    # Типы записей
+    VIDEO = 'video'
+    CHANNEL = 'channel'
+    
+    # Состояние записи относительно окна свежести
+    NEW = 'new'
+    STALE = 'stale'
+    FRESH = 'fresh'
+    
+    def __init__(self, store_dir: Union[str, Path] = None, freshness_hours: float = None):
+        if store_dir is None:
+            store_dir = config.data_dir / 'incremental'
+        
+        if freshness_hours is None:
+            freshness_hours = config.incremental_freshness_hours
+        
+        # Хранилище в папке данных: в отличие от кэша, записи не истекают и не очищаются
+        self.store = Cache(str(store_dir))
+        self.freshness = timedelta(hours=freshness_hours)
+        self.logger = logging.getLogger(__name__)
+        
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Counter] = defaultdict(Counter)
+    
+    @staticmethod
+    def _key(kind: str, item_id: str) -> str:
+        return f"{kind}:{item_id}"
+    
+    def lookup(self, kind: str, item_id: str, count: bool = True) -> Tuple[str, Optional[Any]]:
+        """Состояние записи (NEW, STALE, FRESH) и сохраненные данные (count=False - без учета в статистике)"""
+        try:
+            entry = self.store.get(self._key(kind, item_id))
+        except Exception as e:
+            self.logger.warning(f"Ошибка чтения инкрементального хранилища: {e}")
+            entry = None
+        
+        if entry is None:
+            status, data = self.NEW, None
+        else:
+            fetched_at, data = entry
+            status = self.FRESH if datetime.now() - fetched_at < self.freshness else self.STALE
+        
+        if count:
+            with self._lock:
+                self._stats[kind][status] += 1
+        return status, data
+    
+    def save(self, kind: str, item_id: str, data: Any, fetched_at: datetime = None) -> None:
+        """Сохранение данных с временем получения"""
+        if fetched_at is None:
+            fetched_at = datetime.now()
+        
+        try:
+            self.store.set(self._key(kind, item_id), (fetched_at, data))
+        except Exception as e:
+            self.logger.warning(f"Ошибка записи в инкрементальное хранилище: {e}")
+    
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Количество новых, устаревших и свежих записей по типам за текущий запуск"""
+        with self._lock:
+            return {
+                kind: {status: counters[status] for status in (self.NEW, self.STALE, self.FRESH)}
+                for kind, counters in self._stats.items()
+            }
+    
+    def close(self) -> None:
+        """Закрытие хранилища"""
+        self.store.close()
+
+# === ЭКСПОРТ ===
+
+__all__ = [
+    'IncrementalStore'
+]
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Потоковые JSON отчеты (NDJSON) для YouTube Competitor Analysis Tool
+
+Одна запись VideoData/ChannelData на строку: запись сериализуется и уходит в файл
+сразу после получения, чтение выдает записи по одной. Если установлен orjson,
+разбор при чтении выполняется им, файлы с суффиксом .gz сжимаются gzip.
+"""
+
+import io
+import gzip
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from .records import record_dict
+
+try:
+    import orjson  # Быстрый разбор JSON, реализация на Rust
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Суффиксы файлов отчетов
+NDJSON_SUFFIX = '.ndjson'
+GZIP_SUFFIX = '.gz'
+
+# Размер буфера записи: сжатие и системные вызовы выполняются крупными блоками
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+def dumps(record: Any) -> bytes:
+    """Одна строка NDJSON (UTF-8, с переводом строки)"""
+    # Запись - стандартным json: orjson кэширует UTF-8 копию каждой не-ASCII строки
+    # в самом объекте str, и субтитры на кириллице, которые остаются в памяти до отчетов, удвоились бы
+    line = json.dumps(record_dict(record), ensure_ascii=False, default=str, separators=(',', ':'))
+    return (line + '\n').encode('utf-8')
+
+def loads(line: bytes) -> Any:
+    """Разбор одной строки NDJSON"""
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line.decode('utf-8'))
+
+def _is_gzip(filepath: Path) -> bool:
+    return filepath.suffix == GZIP_SUFFIX
+
+class NDJSONWriter:
+    """Запись NDJSON по одной записи: в памяти только буфер записи"""
+    
+    def __init__(self, filepath: Union[str, Path]):
+        self.filepath = Path(filepath)
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self.count = 0
+        self._lock = threading.Lock()
+        
+        if _is_gzip(self.filepath):
+            self._raw = gzip.open(self.filepath, 'wb', compresslevel=6)
+            self._file = io.BufferedWriter(self._raw, buffer_size=WRITE_BUFFER_SIZE)
+        else:
+            self._raw = None
+            self._file = open(self.filepath, 'wb', buffering=WRITE_BUFFER_SIZE)
+    
+    def write(self, record: Any) -> None:
+        """Сериализация и запись одной записи (dataclass или словарь)"""
+        line = dumps(record)
+        with self._lock:
+            self._file.write(line)
+            self.count += 1
+    
+    def close(self) -> None:
+        """Сброс буфера и закрытие файла"""
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.close()
+            if self._raw is not None:
+                self._raw.close()
+    
+    def __enter__(self) -> 'NDJSONWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+class NDJSONReportSink:
+    """Приемник конвейера: видео и каналы пишутся в отчеты по мере готовности"""
+    
+    def __init__(self, output_dir: Union[str, Path], timestamp: str, compress: bool = False):
+        suffix = NDJSON_SUFFIX + (GZIP_SUFFIX if compress else '')
+        self.videos_file = Path(output_dir) / f"videos_data_{timestamp}{suffix}"
+        self.channels_file = Path(output_dir) / f"channels_data_{timestamp}{suffix}"
+        # Файлы создаются при первой записи: пустые отчеты не появляются
+        self._videos: Optional[NDJSONWriter] = None
+        self._channels: Optional[NDJSONWriter] = None
+        self._lock = threading.Lock()
+    
+    def add_video(self, video_data) -> None:
+        with self._lock:
+            if self._videos is None:
+                self._videos = NDJSONWriter(self.videos_file)
+        self._videos.write(video_data)
+    
+    def add_channel(self, channel_data) -> None:
+        with self._lock:
+            if self._channels is None:
+                self._channels = NDJSONWriter(self.channels_file)
+        self._channels.write(channel_data)
+    
+    @property
+    def files(self) -> List[str]:
+        """Созданные файлы отчетов"""
+        return [str(writer.filepath) for writer in (self._videos, self._channels) if writer is not None]
+    
+    def close(self) -> None:
+        for writer in (self._videos, self._channels):
+            if writer is not None:
+                writer.close()
+
+def write_ndjson(records: Any, filepath: Union[str, Path]) -> int:
+    """Запись последовательности записей в файл NDJSON; возвращает число записей"""
+    with NDJSONWriter(filepath) as writer:
+        for record in records:
+            writer.write(record)
+    return writer.count
+
+def iter_ndjson(filepath: Union[str, Path],
+                record_type: Optional[Callable[..., Any]] = None) -> Iterator[Any]:
+    """Ленивое чтение NDJSON: словари или record_type(**запись); поврежденные строки пропускаются"""
+    filepath = Path(filepath)
+    opener = gzip.open if _is_gzip(filepath) else open
+    
+    with opener(filepath, 'rb') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record: Dict[str, Any] = loads(line)
+            except ValueError:
+                # Недописанная последняя строка (прерванный запуск) или поврежденная запись
+                logger.warning(f"Пропущена поврежденная строка {line_number} в {filepath.name}")
+                continue
+            yield record_type(**record) if record_type is not None else record
+
+# === ЭКСПОРТ ===
+
+__all__ = [
+    'NDJSONWriter',
+    'NDJSONReportSink',
+    'write_ndjson',
+    'iter_ndjson'
+]
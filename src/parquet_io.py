@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Колоночный экспорт и загрузка VideoData/ChannelData в Parquet для YouTube Competitor Analysis Tool
+
+Повторяющиеся строки (канал, категория, теги) хранятся со словарным кодированием,
+субтитры - отдельным столбцом, который загрузчик по умолчанию не читает.
+pyarrow импортируется при первом использовании.
+"""
+
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple, Union
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# Типы столбцов: 'string', 'int', 'float', 'dict' (строка со словарным кодированием),
+# 'list' (список строк), 'dict_list' (список строк со словарным кодированием)
+VIDEO_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ('url', 'string'),
+    ('title', 'string'),
+    ('description', 'string'),
+    ('duration', 'int'),
+    ('views', 'int'),
+    ('likes', 'int'),
+    ('comments_count', 'int'),
+    ('upload_date', 'string'),
+    ('channel_name', 'dict'),
+    ('channel_id', 'dict'),
+    ('tags', 'dict_list'),
+    ('thumbnail_url', 'string'),
+    ('category', 'dict'),
+    ('topic_format', 'string'),
+    ('global_problem', 'string'),
+    ('viewer_questions', 'list'),
+    ('speaker_answers', 'list'),
+    ('cta_action', 'string'),
+    ('topic_justification', 'string'),
+    ('reference_preview_views', 'string'),
+    ('topic_verification', 'string'),
+    ('speaker_opinion', 'string'),
+    # Последний столбец: самый тяжелый, загружается только по явному запросу
+    ('transcript', 'string'),
+)
+
+CHANNEL_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ('channel_id', 'string'),
+    ('channel_name', 'string'),
+    ('description', 'string'),
+    ('subscriber_count', 'int'),
+    ('total_videos', 'int'),
+    ('creation_date', 'string'),
+    ('first_video_date', 'string'),
+    ('videos_last_year', 'int'),
+    ('videos_last_3_months', 'int'),
+    ('avg_long_video_duration', 'float'),
+    ('avg_short_video_duration', 'float'),
+    ('long_videos_count', 'int'),
+    ('short_videos_count', 'int'),
+    ('main_topics', 'dict_list'),
+    ('keywords', 'dict_list'),
+    ('cta_types', 'dict_list'),
+    ('links', 'list'),
+    ('funnel_analysis', 'string'),
+    ('traffic_videos_count', 'int'),
+    ('expert_videos_count', 'int'),
+    ('sales_videos_count', 'int'),
+    ('target_audience', 'dict'),
+    ('products_offered', 'string'),
+    ('positioning', 'string'),
+    ('playlists_count', 'int'),
+    ('efficiency_features', 'dict_list'),
+)
+
+# Столбцы, которые загрузчик пропускает, если столбцы не указаны явно
+HEAVY_VIDEO_COLUMNS = ('transcript',)
+
+# Шаблоны имен файлов отчетов (create_parquet_reports)
+VIDEO_FILES_PATTERN = 'videos_data_*.parquet'
+CHANNEL_FILES_PATTERN = 'channels_data_*.parquet'
+
+COMPRESSION = 'zstd'
+
+def _arrow_type(kind: str) -> 'pa.DataType':
+    import pyarrow as pa
+    
+    dictionary = pa.dictionary(pa.int32(), pa.string())
+    return {
+        'string': pa.string(),
+        'int': pa.int64(),
+        'float': pa.float64(),
+        'dict': dictionary,
+        'list': pa.list_(pa.string()),
+        'dict_list': pa.list_(dictionary),
+    }[kind]
+
+def build_schema(columns: Sequence[Tuple[str, str]]) -> 'pa.Schema':
+    """Схема Arrow для описания столбцов"""
+    import pyarrow as pa
+    
+    return pa.schema([pa.field(name, _arrow_type(kind)) for name, kind in columns])
+
+def _column(values: List[Any], kind: str) -> 'pa.Array':
+    """Столбец Arrow из значений полей объектов"""
+    import pyarrow as pa
+    
+    if kind in ('list', 'dict_list'):
+        values = [list(value) if value is not None else [] for value in values]
+        array = pa.array(values, type=pa.list_(pa.string()))
+        if kind == 'dict_list':
+            # Словарь строится по всем элементам списков столбца, смещения списков сохраняются
+            array = pa.ListArray.from_arrays(array.offsets, array.flatten().dictionary_encode())
+        return array
+    
+    if kind == 'string':
+        # Субтитры могут храниться как TranscriptHandle
+        values = [value if value is None or isinstance(value, str) else str(value) for value in values]
+    array = pa.array(values, type=_arrow_type('string' if kind == 'dict' else kind))
+    return array.dictionary_encode() if kind == 'dict' else array
+
+def records_to_table(records: Sequence[Any], columns: Sequence[Tuple[str, str]]) -> 'pa.Table':
+    """Таблица Arrow из объектов VideoData/ChannelData (столбец за столбцом)"""
+    import pyarrow as pa
+    
+    arrays = [_column([getattr(record, name, None) for record in records], kind) for name, kind in columns]
+    return pa.Table.from_arrays(arrays, schema=build_schema(columns))
+
+def write_parquet(records: Sequence[Any], columns: Sequence[Tuple[str, str]],
+                  filepath: Union[str, Path]) -> Path:
+    """Запись объектов в Parquet (zstd, словарное кодирование, статистика для фильтров)"""
+    import pyarrow.parquet as pq
+    
+    filepath = Path(filepath)
+    table = records_to_table(records, columns)
+    pq.write_table(table, str(filepath), compression=COMPRESSION, use_dictionary=True, write_statistics=True)
+    return filepath
+
+def write_videos_parquet(videos: Sequence[Any], filepath: Union[str, Path]) -> Path:
+    """Запись VideoData в Parquet"""
+    return write_parquet(videos, VIDEO_COLUMNS, filepath)
+
+def write_channels_parquet(channels: Sequence[Any], filepath: Union[str, Path]) -> Path:
+    """Запись ChannelData в Parquet"""
+    return write_parquet(channels, CHANNEL_COLUMNS, filepath)
+
+def _resolve_files(source: Union[str, Path, Sequence[Union[str, Path]]], pattern: str) -> List[str]:
+    """Файлы Parquet: путь к файлу, папка с отчетами или список путей"""
+    if isinstance(source, (str, Path)):
+        path = Path(source)
+        if path.is_dir():
+            return [str(file) for file in sorted(path.glob(pattern))]
+        return [str(path)] if path.exists() else []
+    return [str(Path(file)) for file in source]
+
+def load_parquet(source: Union[str, Path, Sequence[Union[str, Path]]], pattern: str,
+                 columns: Optional[Sequence[str]] = None, filters: Optional[List[Tuple[str, str, Any]]] = None,
+                 default_columns: Optional[Sequence[str]] = None) -> 'pd.DataFrame':
+    """Загрузка файлов Parquet в DataFrame: читаются только нужные столбцы и группы строк"""
+    import pandas as pd
+    import pyarrow.parquet as pq
+    
+    files = _resolve_files(source, pattern)
+    if not files:
+        logger.warning(f"Файлы Parquet не найдены: {source}")
+        return pd.DataFrame(columns=list(columns or default_columns or []))
+    
+    if columns is None:
+        columns = default_columns
+    
+    # filters в формате pyarrow: [('views', '>=', 10000)]; группы строк отсекаются по статистике
+    table = pq.ParquetDataset(files, filters=filters).read(columns=list(columns) if columns else None)
+    return table.to_pandas()
+
+def load_videos(source: Union[str, Path, Sequence[Union[str, Path]]] = 'reports',
+                columns: Optional[Sequence[str]] = None,
+                filters: Optional[List[Tuple[str, str, Any]]] = None) -> 'pd.DataFrame':
+    """DataFrame видео из отчетов Parquet (без субтитров, если столбцы не указаны)"""
+    default_columns = [name for name, _ in VIDEO_COLUMNS if name not in HEAVY_VIDEO_COLUMNS]
+    return load_parquet(source, VIDEO_FILES_PATTERN, columns, filters, default_columns)
+
+def load_channels(source: Union[str, Path, Sequence[Union[str, Path]]] = 'reports',
+                  columns: Optional[Sequence[str]] = None,
+                  filters: Optional[List[Tuple[str, str, Any]]] = None) -> 'pd.DataFrame':
+    """DataFrame каналов из отчетов Parquet"""
+    return load_parquet(source, CHANNEL_FILES_PATTERN, columns, filters)
+
+# === ЭКСПОРТ ===
+
+__all__ = [
+    'VIDEO_COLUMNS',
+    'CHANNEL_COLUMNS',
+    'build_schema',
+    'records_to_table',
+    'write_videos_parquet',
+    'write_channels_parquet',
+    'load_videos',
+    'load_channels'
+]
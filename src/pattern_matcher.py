@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Поиск множества подстрок за один проход (Aho–Corasick) для YouTube Competitor Analysis Tool
+"""
+
+from collections import deque
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+try:
+    import ahocorasick  # pyahocorasick, реализация на C
+except ImportError:
+    ahocorasick = None
+
+class PatternHit(NamedTuple):
+    """Найденное вхождение шаблона"""
+    category: str
+    label: str
+    pattern: str
+    start: int
+    end: int
+
+# Правило шаблона: (категория, метка)
+Rule = Tuple[str, str]
+
+class MultiPatternMatcher:
+    """Автомат Aho–Corasick: все вхождения всех шаблонов за один проход по тексту"""
+    
+    def __init__(self):
+        self._rules: Dict[str, List[Rule]] = {}
+        self._built = False
+        
+        # Автомат pyahocorasick или собственная реализация
+        self._automaton = None
+        self._goto: List[Dict[str, int]] = []
+        self._fail: List[int] = []
+        self._output: List[List[str]] = []
+    
+    def add(self, pattern: str, category: str, label: Optional[str] = None) -> None:
+        """Добавление шаблона (до вызова build)"""
+        if not pattern:
+            return
+        rules = self._rules.setdefault(pattern, [])
+        rule = (category, label if label is not None else pattern)
+        if rule not in rules:
+            rules.append(rule)
+        self._built = False
+    
+    def build(self) -> 'MultiPatternMatcher':
+        """Компиляция автомата"""
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for pattern in self._rules:
+                automaton.add_word(pattern, pattern)
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            self._build_python_automaton()
+        
+        self._built = True
+        return self
+    
+    def _build_python_automaton(self) -> None:
+        """Построение автомата на чистом Python (без pyahocorasick)"""
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        
+        # Бор шаблонов
+        for pattern in self._rules:
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(pattern)
+        
+        # Суффиксные ссылки обходом в ширину
+        states = deque(self._goto[0].values())
+        while states:
+            state = states.popleft()
+            for char, next_state in self._goto[state].items():
+                states.append(next_state)
+                
+                fail_state = self._fail[state]
+                while fail_state and char not in self._goto[fail_state]:
+                    fail_state = self._fail[fail_state]
+                self._fail[next_state] = self._goto[fail_state].get(char, 0)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+    
+    def _iter_matches(self, text: str) -> Iterable[Tuple[int, str]]:
+        """Пары (индекс последнего символа, шаблон)"""
+        if self._automaton is not None:
+            yield from self._automaton.iter(text)
+            return
+        
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern in output[state]:
+                yield index, pattern
+    
+    def find_all(self, text: str, categories: Optional[Set[str]] = None) -> List[PatternHit]:
+        """Все вхождения шаблонов в тексте (с категорией и смещением)"""
+        if not self._built:
+            self.build()
+        if not text or not self._rules:
+            return []
+        
+        hits = []
+        for end_index, pattern in self._iter_matches(text):
+            start = end_index - len(pattern) + 1
+            for category, label in self._rules[pattern]:
+                if categories is None or category in categories:
+                    hits.append(PatternHit(category, label, pattern, start, end_index + 1))
+        
+        hits.sort(key=lambda hit: (hit.start, hit.end))
+        return hits
+
+# === ЭКСПОРТ ===
+
+__all__ = [
+    'PatternHit',
+    'MultiPatternMatcher'
+]
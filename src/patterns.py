@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Реестр скомпилированных регулярных выражений для YouTube Competitor Analysis Tool
+
+Все шаблоны компилируются один раз при импорте модуля.
+"""
+
+import re
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+# === URL YOUTUBE ===
+
+VIDEO_ID_PATTERNS: Tuple[re.Pattern, ...] = (
+    re.compile(r'(?:youtube\.com\/watch\?v=|youtu\.be\/)([^&\n?#]+)'),
+    re.compile(r'youtube\.com\/embed\/([^&\n?#]+)'),
+)
+
+CHANNEL_ID_PATTERNS: Tuple[re.Pattern, ...] = (
+    re.compile(r'youtube\.com\/channel\/([^&\n?#\/]+)'),
+    re.compile(r'youtube\.com\/@([^&\n?#\/]+)'),
+    re.compile(r'youtube\.com\/c\/([^&\n?#\/]+)'),
+    re.compile(r'youtube\.com\/user\/([^&\n?#\/]+)'),
+)
+
+# Ссылки на видео и каналы (/channel/ и @handle), которые считаются корректными
+YOUTUBE_URL_PATTERNS: Tuple[re.Pattern, ...] = VIDEO_ID_PATTERNS + CHANNEL_ID_PATTERNS[:2]
+
+# ID видео на странице результатов поиска
+SEARCH_VIDEO_ID_PATTERNS: Tuple[re.Pattern, ...] = (
+    re.compile(r'"videoId":"([^"]+)"'),
+    re.compile(r'/watch\?v=([a-zA-Z0-9_-]{11})'),
+    re.compile(r'watch\?v=([a-zA-Z0-9_-]{11})'),
+)
+
+# === YOUTUBE DATA API ===
+
+# Длительность ISO 8601 из contentDetails.duration: P1DT2H3M4S, PT15M, P0D
+ISO8601_DURATION = re.compile(r'^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$')
+
+# === СУБТИТРЫ ===
+
+VTT_TIMESTAMP = re.compile(r'^\d+:\d+:\d+')
+
+# === ВОПРОСЫ И МНЕНИЯ ===
+
+QUESTION_WORDS = ('что', 'как', 'где', 'когда', 'почему', 'зачем', 'какой', 'какая', 'какие')
+QUESTION_TOPIC_WORDS = ('вопрос', 'спрашивают', 'интересно')
+OPINION_MARKERS = ('я думаю', 'по моему мнению', 'я считаю', 'моя точка зрения', 'я убежден')
+
+# Текст до ближайшего знака конца предложения в пределах строки: то же, что
+# ленивое '.*?[.!?]', но без посимвольных возвратов
+_UNTIL_TERMINATOR = r'[^.!?\n]*[.!?]'
+
+# Одна альтернация вместо восьми отдельных поисков: мнение захватывается внутри
+# опережающей проверки, поэтому оно не поглощает текст и не скрывает вопросы.
+# Сканер работает по тексту в нижнем регистре: с re.IGNORECASE движок sre теряет
+# быстрый поиск по первому символу и работает в разы медленнее
+DIALOGUE_SCANNER = re.compile(
+    r'(?P<question_mark>[?？])'
+    r'|\b(?P<question_word>' + '|'.join(QUESTION_WORDS + QUESTION_TOPIC_WORDS) + r')\b(?=' + _UNTIL_TERMINATOR + r')'
+    r'|(?=(?P<opinion>(?P<opinion_marker>' + '|'.join(OPINION_MARKERS) + r')' + _UNTIL_TERMINATOR + r'))'
+)
+
+class DialogueScan(NamedTuple):
+    """Вопросы, ответы и мнения, найденные в потоке предложений"""
+    questions: List[str]
+    answers: List[str]
+    opinions: List[str]
+
+def scan_dialogue(sentences: Sequence[str], lowered: Optional[Sequence[str]] = None,
+                  max_questions: int = 10, max_opinions: int = 3) -> DialogueScan:
+    """Поиск вопросов и мнений за один проход сканера по каждому предложению"""
+    if lowered is None:
+        lowered = [sentence.lower() for sentence in sentences]
+    
+    questions = []
+    answers = []
+    opinions = []
+    
+    for index, (sentence, sentence_lower) in enumerate(zip(sentences, lowered)):
+        need_question = len(questions) < max_questions
+        need_opinion = len(opinions) < max_opinions
+        if not need_question and not need_opinion:
+            break
+        
+        # Поиск подстроки дешевле регулярного выражения: без маркеров мнения
+        # достаточно первого совпадения-вопроса
+        need_opinion = need_opinion and any(marker in sentence_lower for marker in OPINION_MARKERS)
+        # Мнение возвращается в исходном регистре, если смещения совпадают
+        source = sentence if len(sentence) == len(sentence_lower) else sentence_lower
+        
+        is_question = False
+        opinion_ends = {}
+        for match in DIALOGUE_SCANNER.finditer(sentence_lower):
+            opinion_start, opinion_end = match.span('opinion')
+            if opinion_start >= 0:
+                # Мнения с одним маркером не перекрываются, как при findall по каждому шаблону
+                marker = match.group('opinion_marker')
+                if need_opinion and opinion_start >= opinion_ends.get(marker, 0):
+                    opinions.append(source[opinion_start:opinion_end])
+                    opinion_ends[marker] = opinion_end
+                    need_opinion = len(opinions) < max_opinions
+            elif need_question:
+                is_question = True
+                need_question = False
+            
+            if not need_question and not need_opinion:
+                break
+        
+        if is_question:
+            questions.append(sentence.strip())
+            # Следующее предложение как потенциальный ответ
+            if index + 1 < len(sentences):
+                answers.append(sentences[index + 1].strip())
+    
+    return DialogueScan(questions, answers, opinions)
+
+# === ПОИСК ПО URL ===
+
+def first_group(patterns: Sequence[re.Pattern], text: str) -> Optional[str]:
+    """Первая группа первого совпавшего шаблона"""
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
+    return None
+
+# === ЭКСПОРТ ===
+
+__all__ = [
+    'VIDEO_ID_PATTERNS',
+    'CHANNEL_ID_PATTERNS',
+    'YOUTUBE_URL_PATTERNS',
+    'SEARCH_VIDEO_ID_PATTERNS',
+    'ISO8601_DURATION',
+    'VTT_TIMESTAMP',
+    'DIALOGUE_SCANNER',
+    'DialogueScan',
+    'scan_dialogue',
+    'first_group'
+]
@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Потоковый конвейер анализа для YouTube Competitor Analysis Tool
+
+Поиск → (метаданные через API) → извлечение видео → контент-анализ → анализ каналов → приемник отчетов.
+Этапы связаны ограниченными очередями и работают одновременно.
+"""
+
+import logging
+import queue
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+from config import config, YouTubeConstants
+from .utils import ProgressTracker, extract_video_id
+from .incremental import IncrementalStore
+from .run_journal import RunJournal
+
+# Маркер завершения входной очереди этапа
+_STOP = object()
+
+@dataclass
+class PipelineResult:
+    """Результат работы конвейера"""
+    video_urls: List[str] = field(default_factory=list)
+    videos: List[Any] = field(default_factory=list)
+    channels: List[Any] = field(default_factory=list)
+
+class CollectingSink:
+    """Приемник, собирающий результаты в списки для отчетов"""
+    
+    def __init__(self):
+        self.videos = []
+        self.channels = []
+    
+    def add_video(self, video_data) -> None:
+        self.videos.append(video_data)
+    
+    def add_channel(self, channel_data) -> None:
+        self.channels.append(channel_data)
+    
+    def close(self) -> None:
+        pass
+
+class PipelineStage:
+    """Этап конвейера: пул потоков, обрабатывающих элементы входной очереди"""
+    
+    def __init__(self, name: str, handler: Callable[[Any], None], input_queue: queue.Queue,
+                 workers: int = 1, on_finish: Optional[Callable[[], None]] = None, batch_size: int = 1):
+        self.name = name
+        self.handler = handler
+        self.input_queue = input_queue
+        self.workers = max(1, workers)
+        # При batch_size > 1 обработчик получает список из уже накопившихся в очереди элементов
+        self.batch_size = max(1, batch_size)
+        self.on_finish = on_finish
+        self.logger = logging.getLogger(__name__)
+        
+        self._remaining = self.workers
+        self._lock = threading.Lock()
+    
+    def start(self) -> None:
+        """Запуск рабочих потоков этапа"""
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"{self.name}-{index + 1}", daemon=True)
+            thread.start()
+    
+    def close_input(self) -> None:
+        """Сигнал о том, что новых элементов не будет"""
+        for _ in range(self.workers):
+            self.input_queue.put(_STOP)
+    
+    def _run(self) -> None:
+        try:
+            stopped = False
+            while not stopped:
+                item = self.input_queue.get()
+                if item is _STOP:
+                    break
+                
+                if self.batch_size > 1:
+                    item = [item]
+                    # Добор пачки без ожидания: не задерживаем обработку ради полной пачки
+                    while len(item) < self.batch_size:
+                        try:
+                            next_item = self.input_queue.get_nowait()
+                        except queue.Empty:
+                            break
+                        if next_item is _STOP:
+                            stopped = True
+                            break
+                        item.append(next_item)
+                
+                self._handle(item)
+        finally:
+            with self._lock:
+                self._remaining -= 1
+                is_last = self._remaining == 0
+            
+            # Последний завершившийся поток закрывает следующий этап
+            if is_last and self.on_finish:
+                self.on_finish()
+    
+    def _handle(self, item: Any) -> None:
+        """Обработка элемента или пачки: при ошибке пачки элементы повторяются по одному"""
+        try:
+            self.handler(item)
+            return
+        except Exception as e:
+            if self.batch_size <= 1 or len(item) <= 1:
+                self.logger.error(f"Ошибка этапа '{self.name}': {e}", exc_info=True)
+                return
+            self.logger.warning(f"Ошибка пачки этапа '{self.name}' ({len(item)} элементов): {e}. "
+                                f"Повтор по одному")
+        
+        # Ошибка одного элемента не теряет остальные элементы пачки
+        for single in item:
+            try:
+                self.handler([single])
+            except Exception as e:
+                self.logger.error(f"Ошибка этапа '{self.name}': {e}", exc_info=True)
+
+class StreamingPipeline:
+    """Конвейер, в котором каждый этап обрабатывает элементы по мере их появления"""
+    
+    def __init__(self, analyzer, max_videos: int = 50, max_channels: int = 20,
+                 channels_only: bool = False, queue_size: int = None, sinks: List[Any] = None,
+                 store: Optional[IncrementalStore] = None, journal: Optional[RunJournal] = None):
+        if queue_size is None:
+            queue_size = config.pipeline_queue_size
+        
+        self.analyzer = analyzer
+        self.max_videos = max_videos
+        self.max_channels = max_channels
+        self.channels_only = channels_only
+        self.queue_size = max(1, queue_size)
+        
+        self.collector = CollectingSink()
+        self.sinks = [self.collector] + list(sinks or [])
+        
+        # Инкрементальный режим: повторно извлекаются только новые и устаревшие элементы
+        self.store = store
+        
+        # Журнал запуска: каждое завершенное видео и канал записываются сразу,
+        # завершенные в прерванном запуске берутся из журнала
+        self.journal = journal
+        if journal is not None:
+            self.sinks.append(journal)
+        
+        self.logger = logging.getLogger(__name__)
+        self._stop_event = threading.Event()
+        
+        self._seen_channels: Set[str] = set()
+        # Метаданные из API, ожидающие этапа извлечения (URL -> info dict)
+        self._prefetched: Dict[str, Dict[str, Any]] = {}
+        self._prefetched_lock = threading.Lock()
+        self._channels_lock = threading.Lock()
+        self._video_urls: List[str] = []
+    
+    def stop(self) -> None:
+        """Прерывание поиска (уже запущенные этапы завершат текущие элементы)"""
+        self._stop_event.set()
+    
+    def run(self, keywords: List[str]) -> PipelineResult:
+        """Запуск конвейера и ожидание завершения всех этапов"""
+        # Ограниченные очереди обеспечивают обратное давление между этапами
+        # С метаданными через API очередь URL вмещает полную пачку videos.list
+        url_queue_size = self.queue_size
+        if self.analyzer.youtube and not self.channels_only:
+            url_queue_size = max(url_queue_size, YouTubeConstants.API_VIDEOS_PER_REQUEST)
+        url_queue = queue.Queue(maxsize=url_queue_size)
+        analysis_queue = queue.Queue(maxsize=self.queue_size)
+        channel_queue = queue.Queue(maxsize=self.queue_size)
+        sink_queue = queue.Queue(maxsize=self.queue_size)
+        
+        def finish_to_sink():
+            sink_queue.put(_STOP)
+        
+        channel_stage = PipelineStage(
+            'channels', lambda channel_id: self._analyze_channel(channel_id, sink_queue),
+            channel_queue, workers=1, on_finish=finish_to_sink
+        )
+        terminal_stages = 1
+        
+        if self.channels_only:
+            first_stage_input = None
+            on_search_finish = channel_stage.close_input
+            stages = [channel_stage]
+        else:
+            # С пулом процессов анализ идет пачками, по одному потоку-диспетчеру на процесс
+            analysis_processes = self.analyzer.analysis_processes
+            analysis_stage = PipelineStage(
+                'analysis', lambda videos: self._analyze_videos(videos, sink_queue),
+                analysis_queue, workers=max(1, analysis_processes), on_finish=finish_to_sink,
+                batch_size=config.analysis_batch_size if analysis_processes > 0 else 1
+            )
+            terminal_stages += 1
+            
+            def finish_extraction():
+                analysis_stage.close_input()
+                channel_stage.close_input()
+            
+            if self.analyzer.youtube:
+                # Метаданные через API: пачки до 50 URL из уже накопившихся в очереди,
+                # извлечение получает готовые метаданные и загружает только субтитры
+                extract_queue = queue.Queue(maxsize=self.queue_size)
+                extract_stage = PipelineStage(
+                    'extract', lambda url: self._extract_video(url, analysis_queue, channel_queue, sink_queue),
+                    extract_queue, workers=self.analyzer.max_workers, on_finish=finish_extraction
+                )
+                metadata_stage = PipelineStage(
+                    'metadata', lambda urls: self._prefetch_metadata(urls, extract_queue),
+                    url_queue, workers=config.api_batch_concurrency, on_finish=extract_stage.close_input,
+                    batch_size=YouTubeConstants.API_VIDEOS_PER_REQUEST
+                )
+                on_search_finish = metadata_stage.close_input
+                stages = [metadata_stage, extract_stage, analysis_stage, channel_stage]
+            else:
+                extract_stage = PipelineStage(
+                    'extract', lambda url: self._extract_video(url, analysis_queue, channel_queue, sink_queue),
+                    url_queue, workers=self.analyzer.max_workers, on_finish=finish_extraction
+                )
+                on_search_finish = extract_stage.close_input
+                stages = [extract_stage, analysis_stage, channel_stage]
+            first_stage_input = url_queue
+        
+        for stage in stages:
+            stage.start()
+        
+        search_thread = threading.Thread(
+            target=self._search,
+            args=(keywords, first_stage_input, channel_queue, on_search_finish),
+            name='search', daemon=True
+        )
+        search_thread.start()
+        
+        try:
+            self._drain_sink(sink_queue, terminal_stages)
+        except KeyboardInterrupt:
+            self.stop()
+            raise
+        finally:
+            for sink in self.sinks:
+                sink.close()
+        
+        return PipelineResult(
+            video_urls=list(self._video_urls),
+            videos=self.collector.videos,
+            channels=self.collector.channels
+        )
+    
+    def _search(self, keywords: List[str], url_queue: Optional[queue.Queue],
+                channel_queue: queue.Queue, on_finish: Callable[[], None]) -> None:
+        """Этап 1: поиск, URL передаются дальше сразу после получения"""
+        search_complete = False
+        try:
+            for url in self._iter_urls(keywords):
+                if self._stop_event.is_set():
+                    break
+                
+                self._video_urls.append(url)
+                if url_queue is not None:
+                    url_queue.put(url)
+                else:
+                    # Режим "только каналы": ID канала определяется по URL без извлечения видео
+                    for channel_id in self.analyzer.extract_channel_ids_from_urls([url]):
+                        self._dispatch_channel(channel_id, channel_queue)
+            search_complete = not self._stop_event.is_set()
+        except Exception as e:
+            self.logger.error(f"Ошибка этапа поиска: {e}", exc_info=True)
+        finally:
+            if search_complete and self.journal is not None and not self.journal.search_done:
+                self.journal.record_search_done()
+            self.logger.info(f"Поиск завершен: найдено {len(self._video_urls)} видео")
+            on_finish()
+    
+    def _iter_urls(self, keywords: List[str]) -> Iterator[str]:
+        """URL для обработки: сначала найденные прерванным запуском, затем новые результаты поиска"""
+        if self.journal is None:
+            yield from self.analyzer.iter_search_videos(keywords, self.max_videos)
+            return
+        
+        seen = set()
+        for url in self.journal.urls[:self.max_videos]:
+            seen.add(url)
+            yield url
+        
+        if self.journal.search_done or len(seen) >= self.max_videos:
+            return
+        
+        for url in self.analyzer.iter_search_videos(keywords, self.max_videos):
+            if url in seen:
+                continue
+            seen.add(url)
+            self.journal.record_url(url)
+            yield url
+            if len(seen) >= self.max_videos:
+                break
+    
+    def _prefetch_metadata(self, urls: List[str], extract_queue: queue.Queue) -> None:
+        """Этап 2а: метаданные пачки видео одним запросом videos.list"""
+        try:
+            # Видео, завершенные прерванным запуском, и свежие видео хранилища не запрашиваются
+            pending = [url for url in urls
+                       if (self.journal is None or self.journal.get_video(url) is None) and not self._is_fresh(url)]
+            if pending:
+                # В инкрементальном режиме кэшем служит хранилище: устаревшим видео нужны свежие метрики
+                infos = self.analyzer.fetch_video_info_batch(pending, use_cache=self.store is None)
+                with self._prefetched_lock:
+                    self._prefetched.update(infos)
+        except Exception as e:
+            # Без метаданных из API видео пачки извлекаются через yt-dlp
+            self.logger.warning(f"Метаданные пачки из {len(urls)} видео не получены: {e}")
+        finally:
+            for url in urls:
+                extract_queue.put(url)
+    
+    def _is_fresh(self, url: str) -> bool:
+        """Свежее видео инкрементального хранилища (используется без извлечения)"""
+        if self.store is None:
+            return False
+        video_id = extract_video_id(url)
+        if not video_id:
+            return False
+        status, _ = self.store.lookup(IncrementalStore.VIDEO, video_id, count=False)
+        return status == IncrementalStore.FRESH
+    
+    def _extract_video(self, url: str, analysis_queue: queue.Queue, channel_queue: queue.Queue,
+                       sink_queue: queue.Queue) -> None:
+        """Этап 2: извлечение данных видео"""
+        with self._prefetched_lock:
+            video_info = self._prefetched.pop(url, None)
+        
+        video_data = self.journal.get_video(url) if self.journal is not None else None
+        if video_data is not None:
+            # Видео, завершенное прерванным запуском
+            self._emit_video(video_data, channel_queue, sink_queue)
+            return
+        
+        if self.store is not None and self._reuse_video(url, video_info, channel_queue, sink_queue):
+            return
+        
+        video_data = self.analyzer.extract_video_data(url, analyze=False, video_info=video_info)
+        if not video_data:
+            return
+        
+        # Анализ канала стартует при первом появлении его ID
+        if video_data.channel_id:
+            self._dispatch_channel(video_data.channel_id, channel_queue)
+        
+        analysis_queue.put(video_data)
+    
+    def _reuse_video(self, url: str, video_info: Optional[Dict[str, Any]], channel_queue: queue.Queue,
+                     sink_queue: queue.Queue) -> bool:
+        """Видео из хранилища: свежее - как есть, устаревшее - с обновленными метриками
+        (из метаданных пакетного запроса API, без них - отдельным запросом)"""
+        video_id = extract_video_id(url)
+        if not video_id:
+            return False
+        
+        status, video_data = self.store.lookup(IncrementalStore.VIDEO, video_id)
+        if status == IncrementalStore.NEW:
+            return False
+        
+        # Субтитры и контент-анализ не меняются, обновляются только метрики
+        if status == IncrementalStore.STALE:
+            if self.analyzer.refresh_video_metrics(video_data, video_info):
+                self.store.save(IncrementalStore.VIDEO, video_id, video_data)
+            else:
+                self.logger.warning(f"Метрики не обновлены, используются сохраненные данные: {url}")
+        
+        self._emit_video(video_data, channel_queue, sink_queue)
+        return True
+    
+    def _emit_video(self, video_data, channel_queue: queue.Queue, sink_queue: queue.Queue) -> None:
+        """Готовое видео без извлечения и анализа: канал на анализ, видео в приемник"""
+        # Видео из журнала или хранилища приходит с субтитрами в виде строки
+        self.analyzer.offload_transcript(video_data)
+        
+        if video_data.channel_id:
+            self._dispatch_channel(video_data.channel_id, channel_queue)
+        
+        sink_queue.put(('video', video_data))
+    
+    def _analyze_videos(self, videos_data, sink_queue: queue.Queue) -> None:
+        """Этап 3: контент-анализ (одно видео или пачка)"""
+        if not isinstance(videos_data, list):
+            videos_data = [videos_data]
+        
+        if config.enable_content_analysis:
+            self.analyzer.analyze_videos_content(videos_data)
+        
+        for video_data in videos_data:
+            if self.store is not None:
+                video_id = extract_video_id(video_data.url)
+                if video_id:
+                    self.store.save(IncrementalStore.VIDEO, video_id, video_data)
+            sink_queue.put(('video', video_data))
+    
+    def _analyze_channel(self, channel_id: str, sink_queue: queue.Queue) -> None:
+        """Этап 4: анализ канала"""
+        # Канал, завершенный прерванным запуском
+        channel_data = self.journal.get_channel(channel_id) if self.journal is not None else None
+        if channel_data is None:
+            channel_data = self._fetch_channel(channel_id)
+        
+        if channel_data:
+            sink_queue.put(('channel', channel_data))
+    
+    def _fetch_channel(self, channel_id: str):
+        """Анализ канала с учетом инкрементального хранилища"""
+        if self.store is None:
+            return self.analyzer.analyze_channel(channel_id)
+        
+        status, channel_data = self.store.lookup(IncrementalStore.CHANNEL, channel_id)
+        if status != IncrementalStore.FRESH:
+            # Устаревший канал анализируется заново, минуя кэш; при ошибке остаются сохраненные данные
+            refreshed = self.analyzer.analyze_channel(channel_id, use_cache=status == IncrementalStore.NEW)
+            if refreshed:
+                channel_data = refreshed
+                self.store.save(IncrementalStore.CHANNEL, channel_id, channel_data)
+        return channel_data
+    
+    def _dispatch_channel(self, channel_id: str, channel_queue: queue.Queue) -> None:
+        """Передача нового канала на анализ с учетом лимита каналов"""
+        with self._channels_lock:
+            if channel_id in self._seen_channels or len(self._seen_channels) >= self.max_channels:
+                return
+            self._seen_channels.add(channel_id)
+        
+        channel_queue.put(channel_id)
+    
+    def _drain_sink(self, sink_queue: queue.Queue, terminal_stages: int) -> None:
+        """Этап 5: приемник результатов (выполняется в вызывающем потоке)"""
+        video_progress = ProgressTracker(self.max_videos, "Анализ видео")
+        finished = 0
+        
+        while finished < terminal_stages:
+            item = sink_queue.get()
+            if item is _STOP:
+                finished += 1
+                continue
+            
+            kind, data = item
+            for sink in self.sinks:
+                if kind == 'video':
+                    sink.add_video(data)
+                else:
+                    sink.add_channel(data)
+            
+            if kind == 'video':
+                video_progress.update()
+
+# === ЭКСПОРТ ===
+
+__all__ = [
+    'PipelineResult',
+    'CollectingSink',
+    'PipelineStage',
+    'StreamingPipeline'
+]
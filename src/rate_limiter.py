@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ограничение частоты запросов (token bucket) для YouTube Competitor Analysis Tool
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from config import config
+
+class TokenBucket:
+    """Потокобезопасное ведро токенов с резервированием очереди"""
+    
+    def __init__(self, rate: float, capacity: float = 1.0, name: str = ""):
+        self.rate = rate  # Токенов в секунду (<= 0 - без ограничений)
+        self.capacity = max(1.0, float(capacity))
+        self.name = name
+        
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        
+        # Статистика
+        self.acquired = 0
+        self.total_wait = 0.0
+    
+    def _reserve(self, tokens: float = 1.0) -> float:
+        """Резервирование токенов, возвращает время ожидания в секундах"""
+        with self._lock:
+            self.acquired += 1
+            
+            if self.rate <= 0:
+                return 0.0
+            
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            
+            # Токены могут уйти в минус: это очередь уже зарезервированных запросов,
+            # каждый следующий поток ждет ровно до своего слота
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            
+            wait_time = -self._tokens / self.rate
+            self.total_wait += wait_time
+            return wait_time
+    
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Блокирующее получение токена (для потоков)"""
+        wait_time = self._reserve(tokens)
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+    
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """Неблокирующее получение токена (для asyncio)"""
+        wait_time = self._reserve(tokens)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        return wait_time
+
+class RateLimiter:
+    """Набор ведер токенов по хостам"""
+    
+    DEFAULT_BUCKET = 'default'
+    TIMEDTEXT_BUCKET = 'timedtext'
+    
+    # Суффикс хоста -> имя ведра
+    HOST_BUCKETS = {
+        'googleapis.com': 'googleapis.com',
+        'youtube.com': 'youtube.com',
+        'youtu.be': 'youtube.com',
+    }
+    
+    def __init__(self, limits: Optional[Dict[str, Tuple[float, float]]] = None):
+        if limits is None:
+            limits = self.default_limits()
+        
+        self.buckets = {
+            name: TokenBucket(rate, capacity, name)
+            for name, (rate, capacity) in limits.items()
+        }
+        if self.DEFAULT_BUCKET not in self.buckets:
+            self.buckets[self.DEFAULT_BUCKET] = TokenBucket(0, 1, self.DEFAULT_BUCKET)
+        
+        self.logger = logging.getLogger(__name__)
+    
+    @staticmethod
+    def default_limits() -> Dict[str, Tuple[float, float]]:
+        """Лимиты по умолчанию из конфигурации: имя ведра -> (запросов в секунду, размер всплеска)"""
+        def rate(delay: float) -> float:
+            return 1.0 / delay if delay > 0 else 0
+        
+        burst = config.rate_limit_burst
+        return {
+            'youtube.com': (rate(config.request_delay), burst),
+            'googleapis.com': (rate(config.api_request_delay), burst),
+            RateLimiter.TIMEDTEXT_BUCKET: (rate(config.request_delay), burst),
+            RateLimiter.DEFAULT_BUCKET: (rate(config.request_delay), burst),
+        }
+    
+    def resolve_bucket(self, target: str) -> str:
+        """Определение имени ведра по URL или имени ведра"""
+        if target in self.buckets:
+            return target
+        
+        parsed = urlparse(target if '://' in target else f"https://{target}")
+        host = (parsed.hostname or '').lower()
+        
+        if 'timedtext' in parsed.path or host.startswith('timedtext'):
+            return self.TIMEDTEXT_BUCKET
+        
+        for suffix, bucket_name in self.HOST_BUCKETS.items():
+            if host == suffix or host.endswith('.' + suffix):
+                return bucket_name
+        
+        return self.DEFAULT_BUCKET
+    
+    def acquire(self, target: str) -> float:
+        """Получение токена для URL или ведра, возвращает время ожидания"""
+        bucket = self.buckets[self.resolve_bucket(target)]
+        wait_time = bucket.acquire()
+        if wait_time > 0:
+            self.logger.debug(f"Ограничение частоты [{bucket.name}]: ожидание {wait_time:.2f}с")
+        return wait_time
+    
+    async def acquire_async(self, target: str) -> float:
+        """Асинхронное получение токена для URL или ведра"""
+        bucket = self.buckets[self.resolve_bucket(target)]
+        return await bucket.acquire_async()
+    
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Статистика по ведрам"""
+        return {
+            name: {
+                'rate': bucket.rate,
+                'acquired': bucket.acquired,
+                'total_wait': round(bucket.total_wait, 2)
+            }
+            for name, bucket in self.buckets.items()
+        }
+
+# Глобальный ограничитель частоты запросов
+rate_limiter = RateLimiter()
+
+# === ЭКСПОРТ ===
+
+__all__ = [
+    'TokenBucket',
+    'RateLimiter',
+    'rate_limiter'
+]
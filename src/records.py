@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Компактные записи данных для YouTube Competitor Analysis Tool
+
+Dataclass со __slots__ (без __dict__ у экземпляра) для Python 3.8+, интернирование
+повторяющихся строк и поверхностное преобразование записи в словарь.
+"""
+
+import sys
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+def slotted_dataclass(cls: type = None, **kwargs):
+    """@dataclass со __slots__ по полям (аналог dataclass(slots=True) из Python 3.10)"""
+    def wrap(cls: type) -> type:
+        cls = dataclass(cls, **kwargs)
+        field_names = tuple(field.name for field in fields(cls))
+        
+        namespace = dict(cls.__dict__)
+        # Значения по умолчанию остаются в __init__ и __dataclass_fields__, атрибуты класса мешают слотам
+        for name in field_names:
+            namespace.pop(name, None)
+        namespace.pop('__dict__', None)
+        namespace.pop('__weakref__', None)
+        namespace['__slots__'] = field_names
+        namespace['__getstate__'] = _getstate
+        namespace['__setstate__'] = _setstate
+        
+        slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+        slotted.__qualname__ = cls.__qualname__
+        return slotted
+    
+    return wrap if cls is None else wrap(cls)
+
+def _getstate(self) -> Dict[str, Any]:
+    return record_dict(self)
+
+def _setstate(self, state: Any) -> None:
+    # Принимается и состояние прежних экземпляров с __dict__ (записи в кэше до перехода на слоты)
+    if isinstance(state, tuple):
+        dict_state, slot_state = state
+        state = dict(dict_state or {}, **(slot_state or {}))
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
+    # Интернирование при распаковке не сохраняется: нормализация повторяется
+    post_init = getattr(self, '__post_init__', None)
+    if post_init is not None:
+        post_init()
+
+def record_dict(record: Any) -> Dict[str, Any]:
+    """Поля записи в словарь без глубокого копирования (ключи как у asdict)"""
+    if isinstance(record, dict):
+        return record
+    if is_dataclass(record) and not isinstance(record, type):
+        return {field.name: getattr(record, field.name) for field in fields(record)}
+    return dict(vars(record))
+
+def intern_str(value: Optional[str]) -> Optional[str]:
+    """Интернированная строка: одинаковые значения разных записей - один объект"""
+    return sys.intern(value) if type(value) is str else value
+
+def intern_tuple(values: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """Кортеж интернированных строк (теги, темы)"""
+    if not values:
+        return ()
+    return tuple(intern_str(value) for value in values)
+
+# === ЭКСПОРТ ===
+
+__all__ = [
+    'slotted_dataclass',
+    'record_dict',
+    'intern_str',
+    'intern_tuple'
+]
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQLite хранилище результатов для YouTube Competitor Analysis Tool
+
+Видео, каналы и параметры каждого запуска в одной базе (режим WAL): запросы по всем
+запускам выполняются по индексам, без перечитывания JSON отчетов.
+
+Запуск: python -m src.result_store top-videos --channel UC... --since 2025-03-01
+"""
+
+import argparse
+import json
+import logging
+import sqlite3
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from config import config
+from .patterns import VIDEO_ID_PATTERNS, first_group
+from .records import record_dict
+
+# Столбцы таблиц в порядке вставки (субтитры не хранятся: они остаются в кэше субтитров)
+VIDEO_COLUMNS = (
+    'run_id', 'video_id', 'url', 'keyword', 'title', 'description', 'duration', 'views', 'likes',
+    'comments_count', 'upload_date', 'channel_name', 'channel_id', 'tags', 'thumbnail_url', 'category',
+    'topic_format', 'global_problem', 'viewer_questions', 'speaker_answers', 'cta_action',
+    'topic_justification', 'reference_preview_views', 'topic_verification', 'speaker_opinion', 'stored_at'
+)
+
+CHANNEL_COLUMNS = (
+    'run_id', 'channel_id', 'channel_name', 'description', 'subscriber_count', 'total_videos', 'creation_date',
+    'first_video_date', 'videos_last_year', 'videos_last_3_months', 'avg_long_video_duration',
+    'avg_short_video_duration', 'long_videos_count', 'short_videos_count', 'main_topics', 'keywords',
+    'cta_types', 'links', 'funnel_analysis', 'traffic_videos_count', 'expert_videos_count',
+    'sales_videos_count', 'target_audience', 'products_offered', 'positioning', 'playlists_count',
+    'efficiency_features', 'stored_at'
+)
+
+# Списки хранятся как JSON
+JSON_COLUMNS = frozenset({
+    'keywords', 'tags', 'viewer_questions', 'speaker_answers', 'main_topics', 'cta_types', 'links',
+    'efficiency_features'
+})
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started_at TEXT,
+    finished_at TEXT,
+    offer TEXT,
+    keywords TEXT,
+    max_videos INTEGER,
+    max_channels INTEGER,
+    videos_count INTEGER,
+    channels_count INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS videos (
+    run_id TEXT NOT NULL,
+    video_id TEXT NOT NULL,
+    url TEXT,
+    keyword TEXT,
+    title TEXT,
+    description TEXT,
+    duration INTEGER,
+    views INTEGER,
+    likes INTEGER,
+    comments_count INTEGER,
+    upload_date TEXT,
+    channel_name TEXT,
+    channel_id TEXT,
+    tags TEXT,
+    thumbnail_url TEXT,
+    category TEXT,
+    topic_format TEXT,
+    global_problem TEXT,
+    viewer_questions TEXT,
+    speaker_answers TEXT,
+    cta_action TEXT,
+    topic_justification TEXT,
+    reference_preview_views TEXT,
+    topic_verification TEXT,
+    speaker_opinion TEXT,
+    stored_at TEXT,
+    PRIMARY KEY (run_id, video_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_videos_channel_id ON videos (channel_id);
+CREATE INDEX IF NOT EXISTS idx_videos_upload_date ON videos (upload_date);
+CREATE INDEX IF NOT EXISTS idx_videos_views ON videos (views);
+CREATE INDEX IF NOT EXISTS idx_videos_keyword ON videos (keyword);
+CREATE INDEX IF NOT EXISTS idx_videos_video_id ON videos (video_id);
+
+CREATE TABLE IF NOT EXISTS channels (
+    run_id TEXT NOT NULL,
+    channel_id TEXT NOT NULL,
+    channel_name TEXT,
+    description TEXT,
+    subscriber_count INTEGER,
+    total_videos INTEGER,
+    creation_date TEXT,
+    first_video_date TEXT,
+    videos_last_year INTEGER,
+    videos_last_3_months INTEGER,
+    avg_long_video_duration REAL,
+    avg_short_video_duration REAL,
+    long_videos_count INTEGER,
+    short_videos_count INTEGER,
+    main_topics TEXT,
+    keywords TEXT,
+    cta_types TEXT,
+    links TEXT,
+    funnel_analysis TEXT,
+    traffic_videos_count INTEGER,
+    expert_videos_count INTEGER,
+    sales_videos_count INTEGER,
+    target_audience TEXT,
+    products_offered TEXT,
+    positioning TEXT,
+    playlists_count INTEGER,
+    efficiency_features TEXT,
+    stored_at TEXT,
+    PRIMARY KEY (run_id, channel_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_channels_channel_id ON channels (channel_id);
+CREATE INDEX IF NOT EXISTS idx_channels_subscriber_count ON channels (subscriber_count);
+"""
+
+def _upsert_sql(table: str, columns: Sequence[str], key: Sequence[str]) -> str:
+    """INSERT ... ON CONFLICT DO UPDATE: ключевое слово не затирается значением NULL при --resume"""
+    updates = ', '.join(
+        f"{column} = COALESCE(excluded.{column}, {table}.{column})" if column == 'keyword'
+        else f"{column} = excluded.{column}"
+        for column in columns if column not in key
+    )
+    return (f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)}) "
+            f"ON CONFLICT ({', '.join(key)}) DO UPDATE SET {updates}")
+
+def _to_db(column: str, value: Any) -> Any:
+    if column in JSON_COLUMNS and value is not None:
+        return json.dumps(list(value), ensure_ascii=False)
+    return value
+
+def _from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        key: json.loads(row[key]) if key in JSON_COLUMNS and row[key] is not None else row[key]
+        for key in row.keys()
+    }
+
+def _to_upload_date(date: str) -> str:
+    """Дата 'YYYY-MM-DD' или 'YYYYMMDD' в формате upload_date yt-dlp (YYYYMMDD)"""
+    return date.replace('-', '')
+
+class ResultStore:
+    """Хранилище результатов всех запусков: соединение на поток, WAL, пакетные вставки"""
+    
+    def __init__(self, db_path: Union[str, Path] = None, batch_size: int = None):
+        if db_path is None:
+            db_path = config.results_db
+        if batch_size is None:
+            batch_size = config.results_batch_size
+        
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = max(1, batch_size)
+        self.logger = logging.getLogger(__name__)
+        
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        
+        self._video_sql = _upsert_sql('videos', VIDEO_COLUMNS, ('run_id', 'video_id'))
+        self._channel_sql = _upsert_sql('channels', CHANNEL_COLUMNS, ('run_id', 'channel_id'))
+        
+        with self.connection() as connection:
+            connection.executescript(SCHEMA)
+    
+    def connection(self) -> sqlite3.Connection:
+        """Соединение текущего потока (sqlite3 не разделяет соединения между потоками)"""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            # Соединение используется только своим потоком; check_same_thread=False нужен для close()
+            connection = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+            connection.row_factory = sqlite3.Row
+            # WAL: читатели не блокируют писателя, писатели из разных потоков ждут друг друга
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+    
+    def start_run(self, run_id: str, offer: str = None, keywords: List[str] = None,
+                  max_videos: int = None, max_channels: int = None) -> None:
+        """Запись о запуске (повторный вызов для --resume сохраняет время начала)"""
+        with self.connection() as connection:
+            connection.execute(
+                "INSERT INTO runs (run_id, started_at, offer, keywords, max_videos, max_channels) "
+                "VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (run_id) DO NOTHING",
+                (run_id, datetime.now().isoformat(timespec='seconds'), offer,
+                 _to_db('keywords', keywords), max_videos, max_channels)
+            )
+    
+    def finish_run(self, run_id: str) -> None:
+        """Время завершения и итоговые количества видео и каналов"""
+        with self.connection() as connection:
+            connection.execute(
+                "UPDATE runs SET finished_at = ?, "
+                "videos_count = (SELECT COUNT(*) FROM videos WHERE run_id = ?), "
+                "channels_count = (SELECT COUNT(*) FROM channels WHERE run_id = ?) "
+                "WHERE run_id = ?",
+                (datetime.now().isoformat(timespec='seconds'), run_id, run_id, run_id)
+            )
+    
+    def add_videos(self, run_id: str, videos: Sequence[Any],
+                   keyword_for: Callable[[str], Optional[str]] = None) -> None:
+        """Пакетная вставка видео одной транзакцией (executemany)"""
+        stored_at = datetime.now().isoformat(timespec='seconds')
+        rows = []
+        for video in videos:
+            values = record_dict(video)
+            values.update(
+                run_id=run_id,
+                video_id=first_group(VIDEO_ID_PATTERNS, video.url) or video.url,
+                keyword=keyword_for(video.url) if keyword_for else None,
+                stored_at=stored_at
+            )
+            rows.append(tuple(_to_db(column, values.get(column)) for column in VIDEO_COLUMNS))
+        
+        with self.connection() as connection:
+            connection.executemany(self._video_sql, rows)
+    
+    def add_channels(self, run_id: str, channels: Sequence[Any]) -> None:
+        """Пакетная вставка каналов одной транзакцией (executemany)"""
+        stored_at = datetime.now().isoformat(timespec='seconds')
+        rows = []
+        for channel in channels:
+            values = record_dict(channel)
+            values.update(run_id=run_id, stored_at=stored_at)
+            rows.append(tuple(_to_db(column, values.get(column)) for column in CHANNEL_COLUMNS))
+        
+        with self.connection() as connection:
+            connection.executemany(self._channel_sql, rows)
+    
+    def sink(self, run_id: str, keyword_for: Callable[[str], Optional[str]] = None) -> 'ResultStoreSink':
+        """Приемник конвейера, записывающий результаты запуска пачками"""
+        return ResultStoreSink(self, run_id, keyword_for)
+    
+    def top_videos(self, channel_id: str = None, since: str = None, until: str = None, keyword: str = None,
+                   run_id: str = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """Самые просматриваемые видео по всем запускам (каждое видео - один раз, с максимумом просмотров)"""
+        conditions = []
+        params: List[Any] = []
+        if channel_id:
+            conditions.append('channel_id = ?')
+            params.append(channel_id)
+        if since:
+            conditions.append('upload_date >= ?')
+            params.append(_to_upload_date(since))
+        if until:
+            conditions.append('upload_date <= ?')
+            params.append(_to_upload_date(until))
+        if keyword:
+            conditions.append('keyword = ?')
+            params.append(keyword)
+        if run_id:
+            conditions.append('run_id = ?')
+            params.append(run_id)
+        
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        # При MAX() SQLite берет остальные столбцы из той же строки
+        query = (
+            "SELECT video_id, url, title, channel_name, channel_id, upload_date, keyword, likes, "
+            "MAX(views) AS views, run_id "
+            f"FROM videos {where} GROUP BY video_id ORDER BY views DESC LIMIT ?"
+        )
+        params.append(limit)
+        return [_from_row(row) for row in self.connection().execute(query, params)]
+    
+    def top_channels(self, run_id: str = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """Каналы с наибольшим числом подписчиков (последние данные по каждому каналу)"""
+        where = 'WHERE run_id = ?' if run_id else ''
+        params: List[Any] = [run_id] if run_id else []
+        query = (
+            "SELECT channel_id, channel_name, MAX(stored_at) AS stored_at, subscriber_count, total_videos, "
+            "videos_last_3_months, run_id "
+            f"FROM channels {where} GROUP BY channel_id ORDER BY subscriber_count DESC LIMIT ?"
+        )
+        params.append(limit)
+        return [_from_row(row) for row in self.connection().execute(query, params)]
+    
+    def video_history(self, video_id: str) -> List[Dict[str, Any]]:
+        """Метрики видео во всех запусках, по времени"""
+        query = ("SELECT run_id, stored_at, views, likes, comments_count FROM videos "
+                 "WHERE video_id = ? ORDER BY stored_at")
+        return [_from_row(row) for row in self.connection().execute(query, (video_id,))]
+    
+    def runs(self, limit: int = 20) -> List[Dict[str, Any]]:
+        """Последние запуски"""
+        query = "SELECT * FROM runs ORDER BY started_at DESC LIMIT ?"
+        return [_from_row(row) for row in self.connection().execute(query, (limit,))]
+    
+    def close(self) -> None:
+        """Закрытие соединений всех потоков"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
+        self._local = threading.local()
+
+class ResultStoreSink:
+    """Приемник конвейера: видео и каналы накапливаются и вставляются пачками по batch_size"""
+    
+    def __init__(self, store: ResultStore, run_id: str, keyword_for: Callable[[str], Optional[str]] = None):
+        self.store = store
+        self.run_id = run_id
+        self.keyword_for = keyword_for
+        self.logger = logging.getLogger(__name__)
+        self._videos: List[Any] = []
+        self._channels: List[Any] = []
+    
+    def add_video(self, video_data) -> None:
+        self._videos.append(video_data)
+        if len(self._videos) >= self.store.batch_size:
+            self._flush_videos()
+    
+    def add_channel(self, channel_data) -> None:
+        self._channels.append(channel_data)
+        if len(self._channels) >= self.store.batch_size:
+            self._flush_channels()
+    
+    def _flush_videos(self) -> None:
+        videos, self._videos = self._videos, []
+        try:
+            self.store.add_videos(self.run_id, videos, self.keyword_for)
+        except sqlite3.Error as e:
+            self.logger.error(f"Ошибка записи видео в базу результатов: {e}")
+    
+    def _flush_channels(self) -> None:
+        channels, self._channels = self._channels, []
+        try:
+            self.store.add_channels(self.run_id, channels)
+        except sqlite3.Error as e:
+            self.logger.error(f"Ошибка записи каналов в базу результатов: {e}")
+    
+    def close(self) -> None:
+        """Запись оставшейся неполной пачки"""
+        if self._videos:
+            self._flush_videos()
+        if self._channels:
+            self._flush_channels()
+
+# === КОМАНДНАЯ СТРОКА ===
+
+def _print_table(rows: List[Dict[str, Any]], columns: Sequence[str]) -> None:
+    if not rows:
+        print("Нет данных")
+        return
+    
+    widths = {
+        column: min(60, max(len(column), *(len(str(row.get(column, ''))) for row in rows)))
+        for column in columns
+    }
+    print('  '.join(column.ljust(widths[column]) for column in columns))
+    for row in rows:
+        print('  '.join(str(row.get(column, ''))[:widths[column]].ljust(widths[column]) for column in columns))
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m src.result_store', description='Запросы к базе результатов')
+    parser.add_argument('--db', type=Path, default=None, help='Файл базы (по умолчанию: config.results_db)')
+    commands = parser.add_subparsers(dest='command')
+    
+    top_videos = commands.add_parser('top-videos', help='Самые просматриваемые видео по всем запускам')
+    top_videos.add_argument('--channel', help='ID канала')
+    top_videos.add_argument('--since', help='Загружены не раньше даты (YYYY-MM-DD)')
+    top_videos.add_argument('--until', help='Загружены не позже даты (YYYY-MM-DD)')
+    top_videos.add_argument('--keyword', help='Ключевой запрос, по которому найдено видео')
+    top_videos.add_argument('--run', help='ID запуска')
+    top_videos.add_argument('--limit', type=int, default=20)
+    
+    top_channels = commands.add_parser('top-channels', help='Каналы по числу подписчиков')
+    top_channels.add_argument('--run', help='ID запуска')
+    top_channels.add_argument('--limit', type=int, default=20)
+    
+    history = commands.add_parser('history', help='Метрики видео во всех запусках')
+    history.add_argument('video_id')
+    
+    runs = commands.add_parser('runs', help='Последние запуски')
+    runs.add_argument('--limit', type=int, default=20)
+    
+    args = parser.parse_args(argv)
+    if not args.command:
+        parser.print_help()
+        return 2
+    
+    store = ResultStore(args.db)
+    try:
+        if args.command == 'top-videos':
+            rows = store.top_videos(args.channel, args.since, args.until, args.keyword, args.run, args.limit)
+            _print_table(rows, ('views', 'likes', 'upload_date', 'channel_name', 'keyword', 'title', 'url'))
+        elif args.command == 'top-channels':
+            rows = store.top_channels(args.run, args.limit)
+            _print_table(rows, ('subscriber_count', 'total_videos', 'videos_last_3_months', 'channel_name',
+                                'channel_id'))
+        elif args.command == 'history':
+            _print_table(store.video_history(args.video_id), ('run_id', 'stored_at', 'views', 'likes',
+                                                                'comments_count'))
+        else:
+            _print_table(store.runs(args.limit), ('run_id', 'started_at', 'finished_at', 'videos_count',
+                                                  'channels_count', 'offer'))
+    finally:
+        store.close()
+    return 0
+
+# === ЭКСПОРТ ===
+
+__all__ = [
+    'ResultStore',
+    'ResultStoreSink'
+]
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Журнал запуска для YouTube Competitor Analysis Tool
+
+Append-only JSONL файл в config.data_dir/runs: параметры запуска, найденные URL,
+каждое завершенное видео и канал. Прерванный запуск продолжается с --resume <run-id>.
+"""
+
+import os
+import json
+import logging
+import threading
+import uuid
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from config import config
+
+class RunJournal:
+    """Журнал запуска: одна JSON запись на строку, каждая запись сбрасывается на диск (fsync)"""
+    
+    # Типы записей
+    RUN = 'run'
+    URL = 'url'
+    SEARCH_DONE = 'search_done'
+    VIDEO = 'video'
+    CHANNEL = 'channel'
+    FINISHED = 'finished'
+    
+    def __init__(self, run_id: str = None, runs_dir: Union[str, Path] = None):
+        if runs_dir is None:
+            runs_dir = config.data_dir / 'runs'
+        if run_id is None:
+            run_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        
+        self.run_id = run_id
+        self.runs_dir = Path(runs_dir)
+        self.runs_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.runs_dir / f"{run_id}.jsonl"
+        self.logger = logging.getLogger(__name__)
+        
+        # Состояние, восстановленное из журнала (для --resume)
+        self.meta: Dict[str, Any] = {}
+        self.urls: List[str] = []
+        self.search_done = False
+        self.finished = False
+        self.videos: Dict[str, Any] = {}
+        self.channels: Dict[str, Any] = {}
+        
+        self._lock = threading.Lock()
+        self._file = None
+    
+    @classmethod
+    def resume(cls, run_id: str, video_type: Callable[..., Any] = dict, channel_type: Callable[..., Any] = dict,
+               runs_dir: Union[str, Path] = None) -> 'RunJournal':
+        """Открытие существующего журнала с восстановлением завершенной работы"""
+        journal = cls(run_id, runs_dir)
+        if not journal.path.exists():
+            raise FileNotFoundError(f"Журнал запуска не найден: {journal.path}")
+        
+        journal._load(video_type, channel_type)
+        return journal
+    
+    def _load(self, video_type: Callable[..., Any], channel_type: Callable[..., Any]) -> None:
+        """Чтение журнала; недописанная последняя строка (сбой во время записи) отбрасывается"""
+        with open(self.path, 'rb') as f:
+            content = f.read()
+        
+        valid_length = 0
+        position = 0
+        while position < len(content):
+            line_end = content.find(b'\n', position)
+            if line_end < 0:
+                # Строка без перевода строки - запись прервана сбоем
+                break
+            
+            line = content[position:line_end]
+            position = line_end + 1
+            if not line.strip():
+                valid_length = position
+                continue
+            
+            try:
+                record = json.loads(line.decode('utf-8'))
+            except ValueError:
+                self.logger.warning(f"Пропущена поврежденная запись журнала {self.path.name} (байт {line_end})")
+                valid_length = position
+                continue
+            
+            self._apply(record, video_type, channel_type)
+            valid_length = position
+        
+        if valid_length < len(content):
+            self.logger.warning(f"Журнал {self.path.name}: отброшена недописанная запись "
+                                f"({len(content) - valid_length} байт)")
+            with open(self.path, 'r+b') as f:
+                f.truncate(valid_length)
+        
+        self.logger.info(f"Журнал {self.run_id} загружен: URL {len(self.urls)}, видео {len(self.videos)}, "
+                         f"каналов {len(self.channels)}")
+    
+    def _apply(self, record: Dict[str, Any], video_type: Callable[..., Any],
+               channel_type: Callable[..., Any]) -> None:
+        """Применение одной записи журнала к восстановленному состоянию"""
+        record_type = record.get('type')
+        if record_type == self.RUN:
+            self.meta = record.get('meta', {})
+        elif record_type == self.URL:
+            if record['url'] not in self.urls:
+                self.urls.append(record['url'])
+        elif record_type == self.SEARCH_DONE:
+            self.search_done = True
+        elif record_type == self.VIDEO:
+            data = record['data']
+            self.videos[data['url']] = video_type(**data)
+        elif record_type == self.CHANNEL:
+            data = record['data']
+            self.channels[data['channel_id']] = channel_type(**data)
+        elif record_type == self.FINISHED:
+            self.finished = True
+    
+    def _write(self, record: Dict[str, Any]) -> None:
+        """Дозапись одной строки: запись целиком, flush и fsync под блокировкой"""
+        line = json.dumps(record, ensure_ascii=False, default=str) + '\n'
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+    
+    def start(self, meta: Dict[str, Any]) -> None:
+        """Параметры запуска (ключевые запросы, лимиты) для последующего --resume"""
+        self.meta = dict(meta)
+        self._write({'type': self.RUN, 'run_id': self.run_id, 'started_at': datetime.now(), 'meta': self.meta})
+    
+    def record_url(self, url: str) -> None:
+        """URL, найденный поиском"""
+        with self._lock:
+            if url in self.urls:
+                return
+            self.urls.append(url)
+        self._write({'type': self.URL, 'url': url})
+    
+    def record_search_done(self) -> None:
+        """Поиск завершен: при продолжении список URL берется из журнала"""
+        self.search_done = True
+        self._write({'type': self.SEARCH_DONE})
+    
+    def add_video(self, video_data) -> None:
+        """Завершенное видео (интерфейс приемника конвейера)"""
+        with self._lock:
+            if video_data.url in self.videos:
+                return
+            self.videos[video_data.url] = video_data
+        self._write({'type': self.VIDEO, 'data': self._serialize(video_data)})
+    
+    def add_channel(self, channel_data) -> None:
+        """Завершенный канал (интерфейс приемника конвейера)"""
+        with self._lock:
+            if channel_data.channel_id in self.channels:
+                return
+            self.channels[channel_data.channel_id] = channel_data
+        self._write({'type': self.CHANNEL, 'data': self._serialize(channel_data)})
+    
+    @staticmethod
+    def _serialize(data: Any) -> Dict[str, Any]:
+        return asdict(data) if is_dataclass(data) else dict(vars(data))
+    
+    def get_video(self, url: str) -> Optional[Any]:
+        """Завершенное видео из журнала"""
+        with self._lock:
+            return self.videos.get(url)
+    
+    def get_channel(self, channel_id: str) -> Optional[Any]:
+        """Завершенный канал из журнала"""
+        with self._lock:
+            return self.channels.get(channel_id)
+    
+    def finish(self) -> None:
+        """Отметка об успешном завершении запуска"""
+        self.finished = True
+        self._write({'type': self.FINISHED, 'finished_at': datetime.now()})
+    
+    def close(self) -> None:
+        """Закрытие файла журнала (журнал остается на диске для --resume)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+# === ЭКСПОРТ ===
+
+__all__ = [
+    'RunJournal'
+]
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Внешнее хранилище субтитров для YouTube Competitor Analysis Tool
+
+Субтитры записываются один раз в append-only файл (UTF-8) с индексом смещений,
+чтение выполняется через отображение файла в память (mmap). Вместо строки
+VideoData.transcript хранит TranscriptHandle, который читает текст по требованию:
+память процесса зависит от числа видео в обработке, а не от объема корпуса.
+"""
+
+import os
+import mmap
+import logging
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+from config import config
+
+class TranscriptHandle:
+    """Ленивый дескриптор субтитров: текст читается из хранилища при обращении"""
+    
+    __slots__ = ('store', 'offset', 'length')
+    
+    def __init__(self, store: 'TranscriptStore', offset: int, length: int):
+        self.store = store
+        self.offset = offset
+        # Длина в байтах UTF-8
+        self.length = length
+    
+    def read(self) -> str:
+        """Текст субтитров"""
+        return self.store.read(self.offset, self.length)
+    
+    def __str__(self) -> str:
+        return self.read()
+    
+    def __bool__(self) -> bool:
+        return self.length > 0
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TranscriptHandle):
+            if other.store is self.store:
+                return other.offset == self.offset and other.length == self.length
+            return other.read() == self.read()
+        if isinstance(other, str):
+            return other == self.read()
+        return NotImplemented
+    
+    # Равенство определяется текстом, как у строки
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"TranscriptHandle(offset={self.offset}, length={self.length})"
+    
+    # Дескриптор неизменяем: asdict и copy не копируют его
+    def __copy__(self) -> 'TranscriptHandle':
+        return self
+    
+    def __deepcopy__(self, memo) -> 'TranscriptHandle':
+        return self
+    
+    # В pickle (кэш, инкрементальное хранилище) попадает сам текст: файл хранилища живет один запуск
+    def __reduce__(self):
+        return (str, (self.read(),))
+
+class TranscriptStore:
+    """Append-only файл субтитров с индексом смещений и чтением через mmap"""
+    
+    def __init__(self, path: Union[str, Path] = None):
+        if path is None:
+            name = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}_{uuid.uuid4().hex[:6]}.bin"
+            path = config.data_dir / 'transcripts' / name
+        
+        self.path = Path(path)
+        self.logger = logging.getLogger(__name__)
+        
+        # Ключ (URL видео) -> (смещение, длина)
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._size = 0
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._mapped_size = 0
+        self._closed = False
+        self._lock = threading.Lock()
+    
+    def put(self, key: str, text: str) -> TranscriptHandle:
+        """Запись субтитров (повторная запись того же ключа не выполняется)"""
+        data = text.encode('utf-8')
+        with self._lock:
+            if self._closed:
+                raise ValueError(f"Хранилище субтитров закрыто: {self.path}")
+            
+            location = self._index.get(key)
+            if location is None:
+                if self._file is None:
+                    # Файл создается при первой записи
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._file = open(self.path, 'w+b')
+                self._file.write(data)
+                location = (self._size, len(data))
+                self._index[key] = location
+                self._size += len(data)
+        
+        return TranscriptHandle(self, *location)
+    
+    def get(self, key: str) -> Optional[TranscriptHandle]:
+        """Дескриптор ранее записанных субтитров"""
+        with self._lock:
+            location = self._index.get(key)
+        return TranscriptHandle(self, *location) if location is not None else None
+    
+    def read(self, offset: int, length: int) -> str:
+        """Текст по смещению и длине в байтах"""
+        if length == 0:
+            return ''
+        
+        with self._lock:
+            if self._closed:
+                raise ValueError(f"Хранилище субтитров закрыто: {self.path}")
+            if offset + length > self._mapped_size:
+                self._remap()
+            data = self._map[offset:offset + length]
+        return data.decode('utf-8')
+    
+    def _remap(self) -> None:
+        """Отображение файла заново: запись за пределами текущего отображения"""
+        self._file.flush()
+        if self._map is not None:
+            self._map.close()
+        self._map = mmap.mmap(self._file.fileno(), self._size, access=mmap.ACCESS_READ)
+        self._mapped_size = self._size
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Число субтитров и размер файла"""
+        with self._lock:
+            return {'transcripts': len(self._index), 'bytes': self._size}
+    
+    def close(self) -> None:
+        """Закрытие и удаление файла: дескрипторы после этого недействительны"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+                try:
+                    self.path.unlink()
+                except OSError as e:
+                    self.logger.warning(f"Не удалось удалить файл субтитров {self.path}: {e}")
+
+# === ЭКСПОРТ ===
+
+__all__ = [
+    'TranscriptHandle',
+    'TranscriptStore'
+]
@@ -9,25 +9,38 @@ import sys
 import json
 import logging
 import hashlib
+import importlib.metadata
+import importlib.util
+import inspect
 import pickle
 import time
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime, timedelta
 from functools import wraps
 import requests
 from diskcache import Cache
 
 from config import config, validate_config
+from .rate_limiter import rate_limiter
+from .http_client import http_client
+from .patterns import CHANNEL_ID_PATTERNS, VIDEO_ID_PATTERNS, YOUTUBE_URL_PATTERNS, first_group
 
-def setup_logging(level: str = None, log_file: str = None) -> logging.Logger:
+def setup_logging(level: Union[str, int] = None, log_file: str = None) -> logging.Logger:
     """Настройка системы логирования"""
     
     # Определение уровня логирования
     if level is None:
         level = config.log_level
     
-    log_level = getattr(logging, level.upper(), logging.INFO)
+    # Уровень передается как имя ('INFO') или как число (logging.INFO)
+    if isinstance(level, int):
+        log_level = level
+        level = logging.getLevelName(level)
+    else:
+        log_level = getattr(logging, level.upper(), logging.INFO)
     
     # Определение файла логов
     if log_file is None:
@@ -95,51 +108,188 @@ def load_config() -> Dict:
         'proxies': config.proxies
     }
 
-def validate_environment() -> bool:
-    """Валидация окружения и зависимостей"""
+# === ПРОВЕРКА ОКРУЖЕНИЯ ===
+
+# Пакет для pip -> имя модуля для импорта
+REQUIRED_PACKAGES = {
+    'requests': 'requests',
+    'beautifulsoup4': 'bs4',
+    'pandas': 'pandas',
+    'yt-dlp': 'yt_dlp',
+    'youtube-transcript-api': 'youtube_transcript_api',
+    'nltk': 'nltk',
+    'openpyxl': 'openpyxl'
+}
+
+# Ресурс NLTK -> путь внутри каталога nltk_data
+NLTK_RESOURCES = {
+    'punkt': 'tokenizers/punkt',
+    'stopwords': 'corpora/stopwords'
+}
+
+SPACY_MODEL = 'ru_core_news_sm'
+
+# Результат проверки окружения хранится между запусками
+ENVIRONMENT_CACHE_FILE = 'environment.json'
+
+_environment_status: Optional[Dict[str, Any]] = None
+_environment_lock = threading.Lock()
+
+def nltk_data_paths() -> List[str]:
+    """Каталоги поиска данных NLTK (как nltk.data.path, но без импорта nltk)"""
+    paths = [path for path in os.environ.get('NLTK_DATA', '').split(os.pathsep) if path]
+    
+    home_dir = os.path.expanduser('~/')
+    if home_dir != '~/':
+        paths.append(os.path.join(home_dir, 'nltk_data'))
+    
+    paths += [
+        os.path.join(sys.prefix, 'nltk_data'),
+        os.path.join(sys.prefix, 'share', 'nltk_data'),
+        os.path.join(sys.prefix, 'lib', 'nltk_data')
+    ]
     
+    if sys.platform.startswith('win'):
+        paths += [
+            os.path.join(os.environ.get('APPDATA', 'C:\\'), 'nltk_data'),
+            r'C:\nltk_data', r'D:\nltk_data', r'E:\nltk_data'
+        ]
+    else:
+        paths += ['/usr/share/nltk_data', '/usr/local/share/nltk_data',
+                  '/usr/lib/nltk_data', '/usr/local/lib/nltk_data']
+    
+    return paths
+
+def find_nltk_resource(resource_path: str) -> Optional[str]:
+    """Поиск ресурса NLTK на диске (каталог или zip-архив) без сети и без импорта nltk"""
+    for data_dir in nltk_data_paths():
+        candidate = os.path.join(data_dir, *resource_path.split('/'))
+        for path in (candidate, candidate + '.zip'):
+            if os.path.exists(path):
+                return path
+    return None
+
+def _module_available(module_name: str) -> bool:
+    """Наличие модуля без его импорта"""
+    if module_name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        return False
+
+def _package_version(package: str) -> Optional[str]:
+    """Установленная версия пакета (None, если пакет не установлен)"""
+    try:
+        return importlib.metadata.version(package)
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+def environment_fingerprint() -> str:
+    """Отпечаток окружения: интерпретатор, версии пакетов и каталоги данных NLTK"""
+    data_dirs = {}
+    for data_dir in nltk_data_paths():
+        # Время изменения каталогов ресурсов меняется при установке или удалении данных
+        for resource_dir in ('', 'tokenizers', 'corpora'):
+            path = os.path.join(data_dir, resource_dir)
+            try:
+                data_dirs[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+    
+    state = {
+        'python': sys.version,
+        'executable': sys.executable,
+        'packages': {
+            package: _package_version(package)
+            for package in list(REQUIRED_PACKAGES) + ['spacy', SPACY_MODEL.replace('_', '-')]
+        },
+        'nltk_data': data_dirs
+    }
+    return hashlib.sha256(json.dumps(state, sort_keys=True).encode('utf-8')).hexdigest()
+
+def _check_environment(download_nltk: bool) -> Dict[str, Any]:
+    """Полная проверка окружения (выполняется только при изменении отпечатка)"""
     logger = logging.getLogger(__name__)
     
-    required_packages = [
-        'requests', 'beautifulsoup4', 'pandas', 'yt_dlp', 
-        'youtube_transcript_api', 'nltk', 'openpyxl'
+    missing_packages = [
+        package for package, module_name in REQUIRED_PACKAGES.items()
+        if not _module_available(module_name)
     ]
     
-    missing_packages = []
+    nltk_resources = {name: find_nltk_resource(path) for name, path in NLTK_RESOURCES.items()}
+    missing_resources = [name for name, path in nltk_resources.items() if path is None]
     
-    for package in required_packages:
+    # Сеть используется только для действительно отсутствующих данных
+    if missing_resources and download_nltk and 'nltk' not in missing_packages:
+        logger.warning(f"NLTK данные не найдены ({', '.join(missing_resources)}). Попытка загрузки...")
         try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
-            missing_packages.append(package)
+            import nltk
+            for name in missing_resources:
+                nltk.download(name, quiet=True)
+            nltk_resources = {name: find_nltk_resource(path) for name, path in NLTK_RESOURCES.items()}
+            logger.info("NLTK данные загружены успешно")
+        except Exception as e:
+            logger.error(f"Ошибка загрузки NLTK данных: {e}")
     
-    if missing_packages:
-        logger.error(f"Отсутствуют необходимые пакеты: {', '.join(missing_packages)}")
+    return {
+        'valid': not missing_packages and all(nltk_resources.values()),
+        'missing_packages': missing_packages,
+        'nltk_resources': nltk_resources,
+        # spaCy модель устанавливается как отдельный пакет
+        'spacy_model': _module_available(SPACY_MODEL),
+        'checked_at': datetime.now().isoformat()
+    }
+
+def get_environment_status(download_nltk: bool = True, force: bool = False) -> Dict[str, Any]:
+    """Результат проверки окружения: из памяти, из кэша на диске или полная проверка"""
+    global _environment_status
+    logger = logging.getLogger(__name__)
+    
+    with _environment_lock:
+        if _environment_status is not None and not force:
+            return _environment_status
+        
+        cache_file = Path(config.cache_dir) / ENVIRONMENT_CACHE_FILE
+        fingerprint = environment_fingerprint()
+        
+        status = None if force else load_json(cache_file)
+        if (status and status.get('fingerprint') == fingerprint
+                and all(path and os.path.exists(path) for path in status.get('nltk_resources', {}).values())):
+            logger.debug("Окружение не изменилось с последней проверки, используется кэш")
+        else:
+            status = _check_environment(download_nltk)
+            # Загрузка данных NLTK меняет каталоги данных, поэтому отпечаток считается после проверки
+            status['fingerprint'] = environment_fingerprint()
+            if status['valid']:
+                save_json(status, cache_file)
+        
+        _environment_status = status
+        return status
+
+def ensure_nltk_resources() -> Dict[str, Optional[str]]:
+    """Пути к данным NLTK; загрузка только если данных нет на диске"""
+    return get_environment_status()['nltk_resources']
+
+def validate_environment(force: bool = False) -> bool:
+    """Валидация окружения и зависимостей"""
+    
+    logger = logging.getLogger(__name__)
+    status = get_environment_status(force=force)
+    
+    if status['missing_packages']:
+        logger.error(f"Отсутствуют необходимые пакеты: {', '.join(status['missing_packages'])}")
         logger.error("Установите их командой: pip install -r requirements.txt")
         return False
     
-    # Проверка NLTK данных
-    try:
-        import nltk
-        nltk.data.find('tokenizers/punkt')
-        nltk.data.find('corpora/stopwords')
-    except LookupError:
-        logger.warning("NLTK данные не найдены. Попытка загрузки...")
-        try:
-            nltk.download('punkt', quiet=True)
-            nltk.download('stopwords', quiet=True)
-            logger.info("NLTK данные загружены успешно")
-        except Exception as e:
-            logger.error(f"Ошибка загрузки NLTK данных: {e}")
-            return False
+    missing_resources = [name for name, path in status['nltk_resources'].items() if not path]
+    if missing_resources:
+        logger.error(f"NLTK данные недоступны: {', '.join(missing_resources)}")
+        return False
     
-    # Проверка spaCy модели
-    try:
-        import spacy
-        spacy.load("ru_core_news_sm")
-    except OSError:
+    if not status['spacy_model']:
         logger.warning("spaCy модель для русского языка не найдена")
-        logger.warning("Установите командой: python -m spacy download ru_core_news_sm")
+        logger.warning(f"Установите командой: python -m spacy download {SPACY_MODEL}")
     
     logger.info("Валидация окружения завершена успешно")
     return True
@@ -149,55 +299,222 @@ def validate_environment() -> bool:
 class CacheManager:
     """Менеджер кэширования результатов"""
     
-    def __init__(self, cache_dir: str = None, duration_hours: int = None):
+    # Пространства имен (уровни) кэша, у каждого свое время жизни
+    SEARCH = 'search'
+    VIDEO = 'video'
+    TRANSCRIPT = 'transcript'
+    CHANNEL = 'channel'
+    
+    # Пространство имен для ключей без префикса
+    DEFAULT_NAMESPACE = 'default'
+    
+    def __init__(self, cache_dir: str = None, duration_hours: int = None,
+                 namespace_hours: Dict[str, int] = None, memory_items: int = None,
+                 memory_bytes: int = None, memory_entry_bytes: int = None,
+                 disk_only_namespaces: Tuple[str, ...] = None):
         if cache_dir is None:
             cache_dir = str(config.cache_dir)
         
+        if memory_items is None:
+            memory_items = config.cache_memory_items
+        
+        if memory_bytes is None:
+            memory_bytes = config.cache_memory_bytes
+        
+        if memory_entry_bytes is None:
+            memory_entry_bytes = config.cache_memory_entry_bytes
+        
+        if disk_only_namespaces is None:
+            # Субтитры читаются один раз на видео и держатся в TranscriptStore, а не в памяти
+            disk_only_namespaces = (self.TRANSCRIPT,)
+        
         if duration_hours is None:
             duration_hours = config.cache_duration_hours
         
+        if namespace_hours is None:
+            namespace_hours = {
+                self.SEARCH: config.cache_search_ttl_hours,
+                self.VIDEO: config.cache_video_ttl_hours,
+                self.TRANSCRIPT: config.cache_transcript_ttl_hours,
+                self.CHANNEL: config.cache_channel_ttl_hours
+            }
+        
         self.cache = Cache(cache_dir)
         self.duration = timedelta(hours=duration_hours)
+        self.namespace_durations = {
+            namespace: timedelta(hours=hours) for namespace, hours in namespace_hours.items()
+        }
         self.logger = logging.getLogger(__name__)
+        
+        # Уровень 1: LRU в памяти процесса перед diskcache (уровень 2),
+        # ограничен и числом записей, и суммарным размером
+        self.memory_items = max(0, memory_items)
+        self.memory_bytes = max(0, memory_bytes)
+        self.memory_entry_bytes = max(0, min(memory_entry_bytes, self.memory_bytes))
+        # Пространства имен, которые хранятся только на диске
+        self.disk_only_namespaces = frozenset(disk_only_namespaces)
+        # Ключ -> (время записи, данные, размер в байтах)
+        self._memory: OrderedDict = OrderedDict()
+        self._memory_size = 0
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Counter] = defaultdict(Counter)
+    
+    @staticmethod
+    def make_key(namespace: str, *parts) -> str:
+        """Детерминированный ключ: пространство имен и хэш частей ключа"""
+        payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+        return f"{namespace}:{hashlib.md5(payload.encode('utf-8')).hexdigest()}"
     
     def get_cache_key(self, *args, **kwargs) -> str:
         """Генерация ключа кэша"""
-        data = str(args) + str(sorted(kwargs.items()))
-        return hashlib.md5(data.encode()).hexdigest()
+        data = json.dumps([args, sorted(kwargs.items())], ensure_ascii=False, default=str)
+        return hashlib.md5(data.encode('utf-8')).hexdigest()
+    
+    def get_namespace(self, key: str) -> str:
+        """Пространство имен ключа"""
+        return key.split(':', 1)[0] if ':' in key else self.DEFAULT_NAMESPACE
+    
+    def get_duration(self, key: str) -> timedelta:
+        """Время жизни записи по пространству имен ключа"""
+        return self.namespace_durations.get(self.get_namespace(key), self.duration)
     
     def get(self, key: str) -> Optional[Any]:
-        """Получение данных из кэша"""
+        """Получение данных из кэша: сначала память, затем диск (объекты из памяти не копируются)"""
         if not config.enable_caching:
             return None
         
+        namespace = self.get_namespace(key)
+        duration = self.get_duration(key)
+        
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if datetime.now() - entry[0] < duration:
+                    self._memory.move_to_end(key)
+                    self._stats[namespace]['memory_hits'] += 1
+                    return entry[1]
+                self._forget(key)
+        
         try:
             cached_data = self.cache.get(key)
             if cached_data:
-                timestamp, data = cached_data
-                if datetime.now() - timestamp < self.duration:
-                    self.logger.debug(f"Данные получены из кэша: {key[:16]}...")
+                # Запись на диске: (время, данные, размер); у записей прежних версий размера нет
+                timestamp, data = cached_data[:2]
+                size = cached_data[2] if len(cached_data) > 2 else None
+                if datetime.now() - timestamp < duration:
+                    self.logger.debug(f"Данные получены из кэша: {key[:24]}...")
+                    # Чтение с диска поднимает запись в память без повторной сериализации
+                    self._remember(key, timestamp, data, size)
+                    self._count(namespace, 'disk_hits')
                     return data
                 else:
                     self.cache.delete(key)
-                    self.logger.debug(f"Кэш устарел, удален: {key[:16]}...")
+                    self.logger.debug(f"Кэш устарел, удален: {key[:24]}...")
         except Exception as e:
             self.logger.warning(f"Ошибка чтения кэша: {e}")
         
+        self._count(namespace, 'misses')
         return None
     
     def set(self, key: str, data: Any) -> None:
-        """Сохранение данных в кэш"""
+        """Сохранение данных в кэш (в память и на диск)"""
         if not config.enable_caching:
             return
         
+        namespace = self.get_namespace(key)
+        timestamp = datetime.now()
+        # Размер считается один раз и хранится рядом с данными на диске
+        size = None if namespace in self.disk_only_namespaces else self._entry_size(data)
+        entry = (timestamp, data, size)
+        self._remember(key, timestamp, data, size)
+        self._count(namespace, 'writes')
+        
         try:
-            self.cache.set(key, (datetime.now(), data))
-            self.logger.debug(f"Данные сохранены в кэш: {key[:16]}...")
+            # expire позволяет diskcache самому удалять устаревшие записи
+            expire = self.get_duration(key).total_seconds()
+            self.cache.set(key, entry, expire=expire)
+            self.logger.debug(f"Данные сохранены в кэш: {key[:24]}...")
         except Exception as e:
             self.logger.warning(f"Ошибка записи в кэш: {e}")
     
+    @staticmethod
+    def _entry_size(data: Any) -> int:
+        """Размер значения в байтах: длина для bytes и str, иначе по сериализации, как на диске"""
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return len(data)
+        if isinstance(data, str):
+            return sys.getsizeof(data)
+        try:
+            return len(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            return sys.getsizeof(data)
+    
+    def _remember(self, key: str, timestamp: datetime, data: Any, size: Optional[int] = None) -> None:
+        """Запись в LRU в памяти с вытеснением самых давно использованных записей
+        
+        Вытеснение идет, пока не соблюдены оба предела: число записей и суммарный размер.
+        Значения крупнее memory_entry_bytes и пространства имен disk_only_namespaces
+        в память не попадают.
+        """
+        if self.memory_items <= 0 or self.memory_bytes <= 0:
+            return
+        
+        namespace = self.get_namespace(key)
+        if namespace in self.disk_only_namespaces:
+            return
+        
+        if size is None:
+            size = self._entry_size(data)
+        
+        with self._lock:
+            self._forget(key)
+            if size > self.memory_entry_bytes:
+                self._stats[namespace]['oversized'] += 1
+                return
+            
+            self._memory[key] = (timestamp, data, size)
+            self._memory_size += size
+            while len(self._memory) > self.memory_items or self._memory_size > self.memory_bytes:
+                evicted_key, evicted = self._memory.popitem(last=False)
+                self._memory_size -= evicted[2]
+                self._stats[self.get_namespace(evicted_key)]['evictions'] += 1
+    
+    def _forget(self, key: str) -> None:
+        """Удаление записи из памяти (вызывается под блокировкой)"""
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._memory_size -= entry[2]
+    
+    def _count(self, namespace: str, name: str) -> None:
+        with self._lock:
+            self._stats[namespace][name] += 1
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Заполнение памяти (записи и байты) и счетчики по пространствам имен: попадания, промахи,
+        записи, вытеснения, слишком крупные для памяти значения"""
+        with self._lock:
+            namespaces = {
+                namespace: {
+                    name: counters[name]
+                    for name in ('memory_hits', 'disk_hits', 'misses', 'writes', 'evictions', 'oversized')
+                }
+                for namespace, counters in self._stats.items()
+            }
+            
+            return {
+                'memory': {
+                    'items': len(self._memory), 'capacity': self.memory_items,
+                    'bytes': self._memory_size, 'capacity_bytes': self.memory_bytes
+                },
+                'namespaces': namespaces
+            }
+    
     def clear(self) -> None:
         """Очистка кэша"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_size = 0
+        
         try:
             self.cache.clear()
             self.logger.info("Кэш очищен")
@@ -207,25 +524,39 @@ class CacheManager:
 # Глобальный менеджер кэша
 cache_manager = CacheManager()
 
-def cached(func):
-    """Декоратор для кэширования результатов функций"""
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        if not config.enable_caching:
-            return func(*args, **kwargs)
-        
-        cache_key = cache_manager.get_cache_key(func.__name__, *args, **kwargs)
-        cached_result = cache_manager.get(cache_key)
+def cached(func: Callable = None, *, namespace: str = None):
+    """Декоратор для кэширования результатов функций (self/cls методов в ключ не входит)"""
+    def decorator(func: Callable) -> Callable:
+        key_namespace = namespace or func.__qualname__
+        parameters = list(inspect.signature(func).parameters)
+        skip_first = bool(parameters) and parameters[0] in ('self', 'cls')
         
-        if cached_result is not None:
-            return cached_result
-        
-        result = func(*args, **kwargs)
-        cache_manager.set(cache_key, result)
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not config.enable_caching:
+                return func(*args, **kwargs)
+            
+            key_args = args[1:] if skip_first else args
+            cache_key = cache_manager.make_key(key_namespace, list(key_args), sorted(kwargs.items()))
+            cached_result = cache_manager.get(cache_key)
+            
+            if cached_result is not None:
+                return cached_result
+            
+            result = func(*args, **kwargs)
+            cache_manager.set(cache_key, result)
+            
+            return result
         
-        return result
+        return wrapper
     
-    return wrapper
+    if func is not None:
+        return decorator(func)
+    return decorator
+
+def normalize_keyword(keyword: str) -> str:
+    """Нормализация поискового запроса для ключа кэша"""
+    return ' '.join(keyword.lower().split())
 
 # === ОБРАБОТКА ОШИБОК И ПОВТОРЫ ===
 
@@ -254,26 +585,15 @@ def retry_on_error(max_attempts: int = 3, delay: float = 1.0, backoff: float = 2
     return decorator
 
 def safe_request(url: str, **kwargs) -> Optional[requests.Response]:
-    """Безопасный HTTP запрос с обработкой ошибок"""
+    """Безопасный HTTP запрос с обработкой ошибок (через общий пул соединений)"""
     logger = logging.getLogger(__name__)
     
-    # Настройки по умолчанию
-    default_kwargs = {
-        'timeout': 30,
-        'headers': {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-    }
-    
-    # Добавление прокси если настроен
-    if config.proxies:
-        default_kwargs['proxies'] = config.proxies
-    
-    # Объединение с пользовательскими параметрами
-    request_kwargs = {**default_kwargs, **kwargs}
+    # Настройки по умолчанию (заголовки, прокси и cookies задаются в сессии http_client)
+    request_kwargs = {'timeout': 30, **kwargs}
     
     try:
-        response = requests.get(url, **request_kwargs)
+        rate_limiter.acquire(url)
+        response = http_client.get(url, **request_kwargs)
         response.raise_for_status()
         return response
     except requests.exceptions.RequestException as e:
@@ -360,49 +680,15 @@ def load_pickle(filepath: Union[str, Path]) -> Optional[Any]:
 
 def validate_youtube_url(url: str) -> bool:
     """Валидация YouTube URL"""
-    youtube_patterns = [
-        r'(?:youtube\.com\/watch\?v=|youtu\.be\/)([^&\n?#]+)',
-        r'youtube\.com\/embed\/([^&\n?#]+)',
-        r'youtube\.com\/channel\/([^&\n?#\/]+)',
-        r'youtube\.com\/@([^&\n?#\/]+)'
-    ]
-    
-    import re
-    return any(re.search(pattern, url) for pattern in youtube_patterns)
+    return any(pattern.search(url) for pattern in YOUTUBE_URL_PATTERNS)
 
 def extract_video_id(url: str) -> Optional[str]:
     """Извлечение ID видео из YouTube URL"""
-    import re
-    
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=|youtu\.be\/)([^&\n?#]+)',
-        r'youtube\.com\/embed\/([^&\n?#]+)',
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    
-    return None
+    return first_group(VIDEO_ID_PATTERNS, url)
 
 def extract_channel_id(url: str) -> Optional[str]:
     """Извлечение ID канала из YouTube URL"""
-    import re
-    
-    patterns = [
-        r'youtube\.com\/channel\/([^&\n?#\/]+)',
-        r'youtube\.com\/@([^&\n?#\/]+)',
-        r'youtube\.com\/c\/([^&\n?#\/]+)',
-        r'youtube\.com\/user\/([^&\n?#\/]+)'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    
-    return None
+    return first_group(CHANNEL_ID_PATTERNS, url)
 
 # === ФОРМАТИРОВАНИЕ И ОТОБРАЖЕНИЕ ===
 
@@ -591,9 +877,13 @@ __all__ = [
     'setup_logging',
     'load_config', 
     'validate_environment',
+    'get_environment_status',
+    'environment_fingerprint',
+    'ensure_nltk_resources',
     'CacheManager',
     'cache_manager',
     'cached',
+    'normalize_keyword',
     'retry_on_error',
     'safe_request',
     'save_json',
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Проекция и сжатие info dict yt-dlp для YouTube Competitor Analysis Tool
+
+Полный info dict содержит форматы, миниатюры, заголовки HTTP и URL всех субтитров
+(сотни КБ на видео), а конвейеру нужна лишь дюжина полей. Ответ YouTube Data API
+(videos.list) приводится к тем же полям.
+"""
+
+import json
+import zlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from config import YouTubeConstants
+from .patterns import ISO8601_DURATION
+
+# Поля info dict, которые использует конвейер
+VIDEO_INFO_FIELDS = (
+    'id', 'title', 'description', 'duration', 'view_count', 'like_count', 'comment_count',
+    'upload_date', 'uploader', 'channel_id', 'tags', 'thumbnail', 'category'
+)
+
+# Языки субтитров по умолчанию в порядке приоритета
+DEFAULT_CAPTION_LANGUAGES = ('ru', 'en')
+
+# Уровень zlib: хорошее сжатие текста без заметных затрат CPU
+COMPRESSION_LEVEL = 6
+
+def get_caption_tracks(info: Dict[str, Any],
+                       languages: Sequence[str] = DEFAULT_CAPTION_LANGUAGES) -> List[Tuple[str, str]]:
+    """Дорожки субтитров (язык, URL) в порядке приоритета: ручные, затем автоматические"""
+    subtitles = info.get('subtitles') or {}
+    auto_subtitles = info.get('automatic_captions') or {}
+    
+    caption_tracks = []
+    for lang in languages:
+        for source in (subtitles, auto_subtitles):
+            formats = source.get(lang)
+            if not formats:
+                continue
+            # Парсер рассчитан на VTT, остальные форматы - запасной вариант
+            track = next((f for f in formats if f.get('ext') == 'vtt'), formats[0])
+            if track.get('url'):
+                caption_tracks.append((lang, track['url']))
+            break
+    
+    return caption_tracks
+
+def project_video_info(info: Dict[str, Any],
+                       languages: Sequence[str] = DEFAULT_CAPTION_LANGUAGES) -> Dict[str, Any]:
+    """Только используемые поля info dict и выбранные дорожки субтитров в 'caption_tracks'"""
+    projected = {field: info[field] for field in VIDEO_INFO_FIELDS if field in info}
+    
+    caption_tracks = info.get('caption_tracks')
+    if caption_tracks is None:
+        caption_tracks = get_caption_tracks(info, languages)
+    projected['caption_tracks'] = [tuple(track) for track in caption_tracks]
+    
+    return projected
+
+def parse_iso8601_duration(value: Optional[str]) -> int:
+    """Длительность ISO 8601 (PT1H2M3S) в секундах (0, если не распознана)"""
+    match = ISO8601_DURATION.match(value or '')
+    if not match:
+        return 0
+    days, hours, minutes, seconds = (int(group or 0) for group in match.groups())
+    return ((days * 24 + hours) * 60 + minutes) * 60 + seconds
+
+def video_info_from_api(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Элемент ответа videos.list (snippet, contentDetails, statistics) в полях info dict yt-dlp"""
+    snippet = item.get('snippet', {})
+    statistics = item.get('statistics', {})
+    thumbnails = snippet.get('thumbnails', {})
+    thumbnail = next((thumbnails[size]['url'] for size in ('maxres', 'high', 'medium', 'default')
+                      if size in thumbnails), '')
+    
+    return {
+        'id': item.get('id', ''),
+        'title': snippet.get('title', ''),
+        'description': snippet.get('description', ''),
+        'duration': parse_iso8601_duration(item.get('contentDetails', {}).get('duration')),
+        'view_count': int(statistics.get('viewCount', 0)),
+        # Скрытые лайки и отключенные комментарии отсутствуют в statistics
+        'like_count': int(statistics.get('likeCount', 0)),
+        'comment_count': int(statistics.get('commentCount', 0)),
+        # publishedAt: 2025-03-15T10:00:00Z -> 20250315
+        'upload_date': snippet.get('publishedAt', '')[:10].replace('-', ''),
+        'uploader': snippet.get('channelTitle', ''),
+        'channel_id': snippet.get('channelId', ''),
+        'tags': snippet.get('tags', []),
+        'thumbnail': thumbnail,
+        'category': YouTubeConstants.VIDEO_CATEGORIES.get(snippet.get('categoryId', ''), ''),
+    }
+
+def pack_video_info(info: Dict[str, Any]) -> bytes:
+    """Сжатое представление спроецированного info dict для кэша"""
+    payload = json.dumps(info, ensure_ascii=False, separators=(',', ':'), default=str)
+    return zlib.compress(payload.encode('utf-8'), COMPRESSION_LEVEL)
+
+def unpack_video_info(data: bytes) -> Optional[Dict[str, Any]]:
+    """Восстановление info dict из сжатого представления"""
+    try:
+        info = json.loads(zlib.decompress(data).decode('utf-8'))
+    except (zlib.error, ValueError, TypeError):
+        return None
+    
+    # JSON не различает кортежи и списки
+    if 'caption_tracks' in info:
+        info['caption_tracks'] = [tuple(track) for track in info['caption_tracks']]
+    return info
+
+# === ЭКСПОРТ ===
+
+__all__ = [
+    'VIDEO_INFO_FIELDS',
+    'get_caption_tracks',
+    'project_video_info',
+    'parse_iso8601_duration',
+    'video_info_from_api',
+    'pack_video_info',
+    'unpack_video_info'
+]
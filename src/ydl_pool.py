@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Пул переиспользуемых экземпляров yt_dlp.YoutubeDL для YouTube Competitor Analysis Tool
+"""
+
+import json
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List
+
+from config import config
+
+if TYPE_CHECKING:
+    import yt_dlp
+
+class YoutubeDLPool:
+    """Ограниченный набор долгоживущих экземпляров YoutubeDL на каждый набор опций
+    
+    Экземпляр выдается потоку на время извлечения и возвращается в пул: число экземпляров
+    (с их cookies и HTTP сессиями) не зависит от числа созданных за запуск потоков.
+    """
+    
+    def __init__(self, max_instances: int = None):
+        if max_instances is None:
+            max_instances = config.ydl_pool_size
+        
+        self.max_instances = max(1, max_instances)
+        self.logger = logging.getLogger(__name__)
+        
+        # Ключ опций -> свободные экземпляры и число созданных
+        self._idle: Dict[str, queue.Queue] = {}
+        self._counts: Dict[str, int] = {}
+        self._instances: List[Any] = []
+        self._lock = threading.Lock()
+        
+        # Статистика
+        self.created = 0
+        self.reused = 0
+        self.waits = 0
+    
+    @staticmethod
+    def options_key(opts: Dict[str, Any]) -> str:
+        """Детерминированный ключ набора опций"""
+        return json.dumps(opts, sort_keys=True, default=str)
+    
+    def configure(self, max_instances: int) -> None:
+        """Изменение предела экземпляров на набор опций (созданные сверх предела остаются в пуле)"""
+        with self._lock:
+            self.max_instances = max(1, max_instances)
+    
+    @contextmanager
+    def acquire(self, opts: Dict[str, Any]) -> Iterator['yt_dlp.YoutubeDL']:
+        """Экземпляр YoutubeDL для указанных опций на время блока with"""
+        key = self.options_key(opts)
+        idle, ydl = self._checkout(key, opts)
+        try:
+            yield ydl
+        finally:
+            idle.put(ydl)
+    
+    def _checkout(self, key: str, opts: Dict[str, Any]):
+        """Свободный экземпляр, новый (пока не достигнут предел) или ожидание освобождения"""
+        with self._lock:
+            idle = self._idle.setdefault(key, queue.Queue())
+            try:
+                ydl = idle.get_nowait()
+                self.reused += 1
+                return idle, ydl
+            except queue.Empty:
+                pass
+            
+            create = self._counts.get(key, 0) < self.max_instances
+            if create:
+                self._counts[key] = self._counts.get(key, 0) + 1
+            else:
+                self.waits += 1
+        
+        if not create:
+            ydl = idle.get()
+            with self._lock:
+                self.reused += 1
+            return idle, ydl
+        
+        try:
+            # yt_dlp импортируется при первом извлечении: загрузка всех экстракторов заметно замедляет запуск
+            import yt_dlp
+            
+            # Регистрация экстракторов, разбор cookies и настройка opener выполняются один раз
+            ydl = yt_dlp.YoutubeDL(dict(opts))
+        except Exception:
+            with self._lock:
+                self._counts[key] -= 1
+            raise
+        
+        with self._lock:
+            self._instances.append(ydl)
+            self.created += 1
+            count = self._counts.get(key, 0)
+        self.logger.debug(f"Создан экземпляр YoutubeDL ({count}/{self.max_instances})")
+        return idle, ydl
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Статистика создания, переиспользования и ожидания экземпляров"""
+        with self._lock:
+            return {
+                'created': self.created,
+                'reused': self.reused,
+                'waits': self.waits,
+                'alive': len(self._instances)
+            }
+    
+    def close(self) -> None:
+        """Закрытие всех экземпляров (сохранение cookies, закрытие соединений)"""
+        with self._lock:
+            instances, self._instances = self._instances, []
+            self._idle = {}
+            self._counts = {}
+        
+        for ydl in instances:
+            try:
+                ydl.__exit__(None, None, None)
+            except Exception as e:
+                self.logger.debug(f"Ошибка закрытия YoutubeDL: {e}")
+
+# Глобальный пул YoutubeDL
+ydl_pool = YoutubeDLPool()
+
+# === ЭКСПОРТ ===
+
+__all__ = [
+    'YoutubeDLPool',
+    'ydl_pool'
+]
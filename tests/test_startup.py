@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Бюджет запуска main.py --dry-run: тяжелые библиотеки не импортируются,
+медианное время укладывается в бюджет (STARTUP_BUDGET_SECONDS, по умолчанию 1.0 с)
+"""
+
+import os
+import statistics
+import time
+
+from benchmarks.bench_startup import LAZY_MODULES, parse_importtime, run_dry_run
+
+STARTUP_BUDGET = float(os.getenv('STARTUP_BUDGET_SECONDS', '1.0'))
+STARTUP_RUNS = 3
+
+def test_dry_run_does_not_import_heavy_modules():
+    """При показе плана ни один модуль из LAZY_MODULES не загружается"""
+    result = run_dry_run(importtime=True)
+    assert result.returncode == 0, result.stderr[-2000:]
+    
+    imports = parse_importtime(result.stderr)
+    eager = [name for name in LAZY_MODULES if name in imports]
+    assert not eager, f"При запуске импортированы тяжелые модули: {', '.join(eager)}"
+
+def test_dry_run_fits_startup_budget():
+    """Медиана нескольких запусков не превышает бюджет"""
+    timings = []
+    for _ in range(STARTUP_RUNS):
+        started = time.perf_counter()
+        result = run_dry_run()
+        timings.append(time.perf_counter() - started)
+        assert result.returncode == 0, result.stderr[-2000:]
+    
+    median = statistics.median(timings)
+    assert median <= STARTUP_BUDGET, f"Бюджет времени запуска превышен: {median:.3f} с > {STARTUP_BUDGET:.3f} с"
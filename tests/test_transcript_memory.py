@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Память при выносе субтитров в TranscriptStore: после кэширования и записи в хранилище
+текст субтитров не остается в процессе, RSS не растет с числом видео
+"""
+
+import gc
+
+import psutil
+
+from src.transcript_store import TranscriptStore
+from src.utils import CacheManager
+
+# ~48 КБ кириллического текста на видео, как у длинного ролика
+TRANSCRIPT_CHARS = 48 * 1024
+WARMUP_VIDEOS = 100
+VIDEOS = 600
+# Без выноса 600 субтитров занимают в памяти ~55 МБ
+RSS_GROWTH_LIMIT = 16 * 1024 * 1024
+
+def make_transcript(index: int) -> str:
+    """Уникальный текст субтитров видео"""
+    line = f"Видео {index}: разбираем вопрос зрителя и отвечаем подробно. "
+    return (line * (TRANSCRIPT_CHARS // len(line) + 1))[:TRANSCRIPT_CHARS]
+
+def process(cache: CacheManager, store: TranscriptStore, handles: list, index: int) -> None:
+    """Путь субтитров в анализаторе: кэш, затем хранилище, в записи остается дескриптор"""
+    video_id = f"{index:011d}"
+    cache_key = cache.make_key(CacheManager.TRANSCRIPT, video_id, ['ru', 'en'])
+    transcript = make_transcript(index)
+    cache.set(cache_key, transcript)
+    handles.append(store.put(f"https://www.youtube.com/watch?v={video_id}", cache.get(cache_key)))
+
+def test_rss_stays_flat_after_offloading(tmp_path):
+    """Рост RSS на сотнях субтитров не зависит от их суммарного объема"""
+    cache = CacheManager(cache_dir=str(tmp_path / 'cache'))
+    store = TranscriptStore(tmp_path / 'transcripts.bin')
+    handles = []
+    process_info = psutil.Process()
+    
+    try:
+        for index in range(WARMUP_VIDEOS):
+            process(cache, store, handles, index)
+        gc.collect()
+        baseline = process_info.memory_info().rss
+        
+        for index in range(WARMUP_VIDEOS, WARMUP_VIDEOS + VIDEOS):
+            process(cache, store, handles, index)
+        gc.collect()
+        growth = process_info.memory_info().rss - baseline
+        
+        assert cache.get_stats()['memory']['items'] == 0
+        assert handles[-1].read() == make_transcript(WARMUP_VIDEOS + VIDEOS - 1)
+        assert growth < RSS_GROWTH_LIMIT, f"RSS вырос на {growth / 1024 / 1024:.1f} МБ"
+    finally:
+        store.close()
+        cache.cache.close()